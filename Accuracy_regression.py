@@ -0,0 +1,352 @@
+# /**************************************************************************************************************************************************************************************
+# Nom du fichier : Accuracy_regression.py
+# Rôle du fichier : Ce fichier enregistre les données structurées et domaines prédits de référence de chaque CV de Banque_CV, puis compare une autre configuration de la chaîne d'analyse à cette référence : précision / rappel par champ, accord des domaines prédits et gain de vitesse.
+
+# Auteur : Maxime BRONNY
+# Version : V1
+# Licence : Réalisé dans le cadre des cours "Fouille de données, Ingéniérie des langues, Développement logiciel libre, IA & Apprentisage" L3 INFORMATIQUE IED
+# Usage : Un paquetage a été mit en place pour l'utiliser veuillez utiliser dans un système debian la commande suivante :
+#           - INSTALLATION DU PAQUET GÉNÉRÉ
+#               - sudo apt install ./cv-classifier_1.0-1_all.deb
+
+#           Puis exécute ton programme avec :
+#               - cv-classifier
+# ***************************************************************************************************************************************************************************************/
+
+
+
+# *************************************************************** # 
+# --- LIBRAIRIES UTILISÉES POUR LE CONTRÔLE DE NON-RÉGRESSION --- # 
+# *************************************************************** # 
+
+
+
+import os
+import ast
+import json
+import time
+import argparse
+import importlib
+
+# --- Chaîne d'analyse contrôlée ---
+import main
+
+# --- Sélection des CV et version du code (banc d'essai) ---
+from Benchmark import BASE_DIR, DEFAULT_BENCH_FOLDERS, collect_pdf_paths, git_revision
+
+
+
+# ************************************************ # 
+# --- PARAMÈTRES DU CONTRÔLE DE NON-RÉGRESSION --- # 
+# ************************************************ # 
+
+
+
+# Dossier des résultats de référence (un fichier JSON par CV et un fichier de description de l'exécution)
+DEFAULT_GOLDEN_DIR = BASE_DIR / "Banque_CV/golden"
+RUN_FILE = "_run.json"
+
+# Champs comparés : (nom affiché, chemin dans les données structurées)
+COMPARED_FIELDS = (
+    ("Formations",   ("Formations",)),
+    ("Compétences",  ("Compétences",)),
+    ("Expériences",  ("Expériences",)),
+    ("Localisation", ("Localisation",)),
+    ("Langues",      ("Langues",)),
+    ("Noms",         ("Identité", "Noms")),
+    ("Emails",       ("Identité", "Emails")),
+    ("Téléphone",    ("Identité", "Téléphone"))
+)
+
+
+
+# ************************************* # 
+# --- EXÉCUTION D'UNE CONFIGURATION --- # 
+# ************************************* # 
+
+
+
+def apply_overrides(overrides):
+    """
+    Applique les réglages "module.NOM=valeur" (ex : main.GAZETTEER_RECALL=True) avant l'exécution.
+    La valeur est lue comme un littéral Python.
+
+    :return: Dictionnaire { "module.NOM": valeur } des réglages appliqués
+    """
+    applied = {}
+    for override in overrides or ():
+        name, separator, raw_value = override.partition("=")
+        module_name, _, attribute = name.strip().rpartition(".")
+        if not separator or not module_name:
+            raise SystemExit(f"Réglage invalide : {override} (format attendu : module.NOM=valeur)")
+        module = importlib.import_module(module_name)
+        if not hasattr(module, attribute):
+            raise SystemExit(f"Réglage inconnu : {name}")
+        value = ast.literal_eval(raw_value.strip())
+        setattr(module, attribute, value)
+        applied[name.strip()] = value
+    return applied
+
+
+
+def cv_key(pdf_path):
+    """
+    Identifiant d'un CV dans la référence : son chemin relatif au projet.
+    """
+    return os.path.relpath(os.path.abspath(pdf_path), BASE_DIR)
+
+
+
+def _jsonable_domains(predicted_domain):
+    # Les domaines prédits sont des types numpy : convertis pour l'enregistrement JSON
+    return [[str(domain), float(probability)] for domain, probability in predicted_domain]
+
+
+
+def run_configuration(pdf_paths, batch_size=main.DEFAULT_BATCH_SIZE, mini_batch_size=main.DEFAULT_MINI_BATCH_SIZE, pdf_options=None):
+    """
+    Analyse 'pdf_paths' sans cache ni écriture des résultats de classement.
+
+    :return: Tuple ({ identifiant du CV : {"structured", "domains"} }, durée de l'analyse en secondes)
+    """
+    outputs = {}
+    start = time.perf_counter()
+    for batch_start in range(0, len(pdf_paths), batch_size):
+        batch = pdf_paths[batch_start:batch_start + batch_size]
+        results = main.analyse_cv_batch(batch, mini_batch_size, cache_path=None, pdf_options=pdf_options)
+        for pdf_path, (_, structured_data, predicted_domain) in zip(batch, results):
+            if structured_data is None:
+                # CV ignoré par les limites de l'extraction : absent de la comparaison
+                continue
+            outputs[cv_key(pdf_path)] = {"structured": structured_data, "domains": _jsonable_domains(predicted_domain)}
+    return outputs, time.perf_counter() - start
+
+
+
+# ************************************************* # 
+# --- ENREGISTREMENT ET LECTURE DE LA RÉFÉRENCE --- # 
+# ************************************************* # 
+
+
+
+def _golden_filename(key):
+    return key.replace(os.sep, "__").replace(".pdf", ".json")
+
+
+
+def save_golden(golden_dir, outputs, run):
+    """
+    Enregistre la référence : un JSON par CV et la description de l'exécution (_run.json).
+    """
+    os.makedirs(golden_dir, exist_ok=True)
+    for key, output in outputs.items():
+        with open(os.path.join(golden_dir, _golden_filename(key)), "w", encoding="utf-8") as file:
+            json.dump({"cv": key, **output}, file, ensure_ascii=False, indent=2)
+    with open(os.path.join(golden_dir, RUN_FILE), "w", encoding="utf-8") as file:
+        json.dump(run, file, ensure_ascii=False, indent=2)
+
+
+
+def load_golden(golden_dir):
+    """
+    :return: Tuple ({ identifiant du CV : {"structured", "domains"} }, description de l'exécution de référence)
+    """
+    run_path = os.path.join(golden_dir, RUN_FILE)
+    if not os.path.exists(run_path):
+        raise SystemExit(f"Aucune référence dans {golden_dir} : lancez d'abord la commande 'record'.")
+    with open(run_path, "r", encoding="utf-8") as file:
+        run = json.load(file)
+
+    outputs = {}
+    for filename in sorted(os.listdir(golden_dir)):
+        if filename.endswith(".json") and filename != RUN_FILE:
+            with open(os.path.join(golden_dir, filename), "r", encoding="utf-8") as file:
+                entry = json.load(file)
+            outputs[entry["cv"]] = {"structured": entry["structured"], "domains": entry["domains"]}
+    return outputs, run
+
+
+
+# ********************************** # 
+# --- COMPARAISON À LA RÉFÉRENCE --- # 
+# ********************************** # 
+
+
+
+def field_values(structured_data, path):
+    """
+    Valeurs d'un champ sous forme d'ensemble comparable (minuscules, espaces retirés).
+    Les langues {"Langue", "Niveau"} deviennent "langue : niveau".
+    """
+    value = structured_data
+    for key in path:
+        value = value.get(key, {}) if isinstance(value, dict) else {}
+    values = set()
+    for item in value or ():
+        if isinstance(item, dict):
+            item = " : ".join(str(part) for part in item.values())
+        values.add(str(item).strip().lower())
+    return values
+
+
+
+def compare_outputs(golden, candidate):
+    """
+    Compare 'candidate' à 'golden' (la référence) sur les CV présents dans les deux.
+
+    :return: Dictionnaire :
+             - fields  : { champ : {"precision", "recall", "f1", "golden", "candidate", "changed_cvs"} } (micro-moyennes)
+             - domains : {"top1_agreement", "set_agreement", "mean_top1_probability_delta"}
+             - diffs   : { identifiant du CV : { champ : {"missing": [...], "added": [...]} } }
+    """
+    keys = sorted(set(golden) & set(candidate))
+    fields, diffs = {}, {}
+
+    for name, path in COMPARED_FIELDS:
+        true_positives = golden_total = candidate_total = changed = 0
+        for key in keys:
+            expected = field_values(golden[key]["structured"], path)
+            found = field_values(candidate[key]["structured"], path)
+            true_positives += len(expected & found)
+            golden_total += len(expected)
+            candidate_total += len(found)
+            if expected != found:
+                changed += 1
+                diffs.setdefault(key, {})[name] = {"missing": sorted(expected - found), "added": sorted(found - expected)}
+
+        precision = true_positives / candidate_total if candidate_total else 1.0
+        recall = true_positives / golden_total if golden_total else 1.0
+        fields[name] = {
+            "precision": precision,
+            "recall": recall,
+            "f1": 2 * precision * recall / (precision + recall) if precision + recall else 0.0,
+            "golden": golden_total,
+            "candidate": candidate_total,
+            "changed_cvs": changed
+        }
+
+    top1 = same_set = 0
+    probability_delta = 0.0
+    for key in keys:
+        expected, found = golden[key]["domains"], candidate[key]["domains"]
+        if expected and found and expected[0][0] == found[0][0]:
+            top1 += 1
+            probability_delta += abs(expected[0][1] - found[0][1])
+        if {domain for domain, _ in expected} == {domain for domain, _ in found}:
+            same_set += 1
+
+    domains = {
+        "top1_agreement": top1 / len(keys) if keys else None,
+        "set_agreement": same_set / len(keys) if keys else None,
+        "mean_top1_probability_delta": probability_delta / top1 if top1 else None
+    }
+    return {"cvs": len(keys), "fields": fields, "domains": domains, "diffs": diffs}
+
+
+
+def print_comparison(comparison, speedup, details=0):
+    print(f"\nComparaison à la référence ({comparison['cvs']} CV) :\n")
+    print(f"  {'champ':<14}{'précision':>11}{'rappel':>9}{'F1':>8}{'réf.':>7}{'nouv.':>7}{'CV modifiés':>13}")
+    for name, field in comparison["fields"].items():
+        print(f"  {name:<14}{field['precision']:>11.3f}{field['recall']:>9.3f}{field['f1']:>8.3f}"
+              f"{field['golden']:>7}{field['candidate']:>7}{field['changed_cvs']:>13}")
+
+    domains = comparison["domains"]
+    if domains["top1_agreement"] is not None:
+        print(f"\n  Domaine principal identique   : {domains['top1_agreement']:.1%}")
+        print(f"  Mêmes domaines (top 3)        : {domains['set_agreement']:.1%}")
+        if domains["mean_top1_probability_delta"] is not None:
+            print(f"  Écart moyen de probabilité    : {domains['mean_top1_probability_delta']:.4f}")
+    print(f"  Gain de vitesse               : {'-' if speedup is None else f'x{speedup:.2f}'}\n")
+
+    for key, fields in list(comparison["diffs"].items())[:details]:
+        print(f"  {key}")
+        for name, diff in fields.items():
+            print(f"    {name:<14} manquants : {diff['missing']}  ajoutés : {diff['added']}")
+    if details:
+        print()
+
+
+
+def check_thresholds(comparison, min_f1=None, min_domain_agreement=None):
+    """
+    Retourne la liste des seuils non respectés (vide si la configuration est acceptée).
+    """
+    failures = []
+    if min_f1 is not None:
+        for name, field in comparison["fields"].items():
+            if field["f1"] < min_f1:
+                failures.append(f"F1 {name} = {field['f1']:.3f} < {min_f1}")
+    agreement = comparison["domains"]["top1_agreement"]
+    if min_domain_agreement is not None and agreement is not None and agreement < min_domain_agreement:
+        failures.append(f"accord du domaine principal = {agreement:.3f} < {min_domain_agreement}")
+    return failures
+
+
+
+# ************************************************************** # 
+# --- POINT D'ENTRÉE DU SCRIPT SI IL EST EXÉCUTÉ DIRECTEMENT --- # 
+# ************************************************************** # 
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Contrôle de non-régression des résultats de la chaîne d'analyse.")
+    subparsers = parser.add_subparsers(dest="command", required=True)
+
+    common = argparse.ArgumentParser(add_help=False)
+    common.add_argument("folders", nargs="*", default=[str(folder) for folder in DEFAULT_BENCH_FOLDERS], help="Dossiers de CV PDF")
+    common.add_argument("--golden", default=str(DEFAULT_GOLDEN_DIR), help="Dossier des résultats de référence")
+    common.add_argument("--batch-size", type=int, default=main.DEFAULT_BATCH_SIZE, help="Nombre de CV annotés ensemble")
+    common.add_argument("--mini-batch-size", type=int, default=main.DEFAULT_MINI_BATCH_SIZE, help="Nombre de phrases traitées simultanément par le BiLSTM")
+    common.add_argument("--pdf-backend", choices=list(main.PDF_BACKENDS) + ["fast"], default=main.DEFAULT_PDF_BACKEND,
+                        help="Moteur d'extraction du texte des PDF (comparer un moteur rapide à la référence pdfplumber)")
+    common.add_argument("--limit", type=int, help="Nombre maximal de CV")
+    common.add_argument("--set", dest="overrides", action="append", metavar="MODULE.NOM=VALEUR", help="Réglage appliqué avant l'analyse (ex : main.GAZETTEER_RECALL=True)")
+
+    subparsers.add_parser("record", parents=[common], help="Enregistre les résultats de référence")
+    compare_parser = subparsers.add_parser("compare", parents=[common], help="Compare une configuration à la référence")
+    compare_parser.add_argument("--report", help="Fichier JSON recevant le rapport de comparaison")
+    compare_parser.add_argument("--details", type=int, default=0, help="Affiche les différences des N premiers CV modifiés")
+    compare_parser.add_argument("--min-f1", type=float, help="F1 minimal exigé pour chaque champ")
+    compare_parser.add_argument("--min-domain-agreement", type=float, help="Accord minimal exigé sur le domaine principal")
+    args = parser.parse_args()
+
+    overrides = apply_overrides(args.overrides)
+    pdf_paths = collect_pdf_paths(args.folders, args.limit)
+    if not pdf_paths:
+        raise SystemExit("Aucun CV PDF à analyser.")
+
+    # Modèles chargés avant la mesure : seule l'analyse est chronométrée
+    main.prewarm(main.SHARED_MODELS, background=False)
+    # Textes ré-extraits à chaque exécution : le gain de vitesse comprend l'extraction des PDF
+    outputs, seconds = run_configuration(pdf_paths, args.batch_size, args.mini_batch_size,
+                                         {"backend": args.pdf_backend, "text_cache": False})
+    run = {
+        "timestamp": time.strftime("%Y-%m-%dT%H:%M:%S"),
+        "git_revision": git_revision(),
+        "overrides": {name: repr(value) for name, value in overrides.items()},
+        "batch_size": args.batch_size,
+        "mini_batch_size": args.mini_batch_size,
+        "pdf_backend": main.backend_version(main.resolve_backend(args.pdf_backend)),
+        "docs": len(outputs),
+        "seconds": seconds
+    }
+
+    if args.command == "record":
+        save_golden(args.golden, outputs, run)
+        print(f"\nRéférence enregistrée dans {args.golden} ({len(outputs)} CV, {seconds:.1f} s)")
+    else:
+        golden, golden_run = load_golden(args.golden)
+        comparison = compare_outputs(golden, outputs)
+        speedup = None
+        if golden_run["docs"] and outputs and seconds > 0:
+            speedup = (golden_run["seconds"] / golden_run["docs"]) / (seconds / len(outputs))
+        print_comparison(comparison, speedup, args.details)
+
+        failures = check_thresholds(comparison, args.min_f1, args.min_domain_agreement)
+        if args.report:
+            with open(args.report, "w", encoding="utf-8") as file:
+                json.dump({"golden_run": golden_run, "run": run, "speedup": speedup, "failures": failures, **comparison},
+                          file, ensure_ascii=False, indent=2)
+        if failures:
+            print("Configuration refusée :\n  " + "\n  ".join(failures))
+            raise SystemExit(1)
@@ -0,0 +1,413 @@
+# /**************************************************************************************************************************************************************************************
+# Nom du fichier : Benchmark.py
+# Rôle du fichier : Ce fichier mesure les performances de la chaîne d'analyse des CV (complète et étape par étape) sur les CV de Banque_CV : débit, latence par CV (p50/p95/p99), pic de mémoire et temps de chargement des modèles ; les résultats sont enregistrés en JSON pour comparer les exécutions.
+
+# Auteur : Maxime BRONNY
+# Version : V1
+# Licence : Réalisé dans le cadre des cours "Fouille de données, Ingéniérie des langues, Développement logiciel libre, IA & Apprentisage" L3 INFORMATIQUE IED
+# Usage : Un paquetage a été mit en place pour l'utiliser veuillez utiliser dans un système debian la commande suivante :
+#           - INSTALLATION DU PAQUET GÉNÉRÉ
+#               - sudo apt install ./cv-classifier_1.0-1_all.deb
+
+#           Puis exécute ton programme avec :
+#               - cv-classifier
+# ***************************************************************************************************************************************************************************************/
+
+
+
+# ************************************************* # 
+# --- LIBRAIRIES UTILISÉES POUR LE BANC D'ESSAI --- # 
+# ************************************************* # 
+
+
+
+import os
+import sys
+import json
+import time
+import argparse
+import platform
+import resource      # Pic de mémoire résidente du processus et de ses processus de travail
+import subprocess    # Version du code mesuré (git)
+from pathlib import Path
+
+# --- Chaîne d'analyse mesurée ---
+import main
+
+# --- Registre des modèles : pré-chargement et temps de chargement ---
+from Model_registry import prewarm, model_report, current_rss_bytes
+
+# --- Mesures par étape de la chaîne complète ---
+from Instrumentation import CVTrace, summarize_stages
+
+# --- Versions des bibliothèques et chemin du cache ---
+from Result_cache import DEFAULT_CACHE_PATH, package_version
+
+
+
+# ********************************** # 
+# --- PARAMÈTRES DU BANC D'ESSAI --- # 
+# ********************************** # 
+
+
+
+BASE_DIR = Path(__file__).resolve().parent
+
+# Dossiers de CV mesurés par défaut
+DEFAULT_BENCH_FOLDERS = (BASE_DIR / "Banque_CV", BASE_DIR / "Banque_CV/CV_TEST_genere")
+
+# Dossier des résultats JSON
+DEFAULT_RESULTS_DIR = BASE_DIR / "data/benchmarks"
+
+# Étapes mesurées isolément, dans l'ordre de la chaîne : chacune part du résultat de la précédente
+#   - pdf         : extraction du texte (extract_text_from_pdf)
+#   - ner         : découpage et annotation par les deux taggers Flair (annotate_cv_texts)
+#   - postprocess : extraction et nettoyage des entités (extract_all_entities) et sections
+#   - classify    : prédiction du domaine (SVM)
+ISOLATED_STAGES = ("pdf", "ner", "postprocess", "classify")
+
+# "full" : chaîne complète (process_cv_files, sans écriture des fichiers JSON/CSV)
+ALL_STAGES = ("full",) + ISOLATED_STAGES
+
+# Bibliothèques dont la version est enregistrée avec les résultats
+RECORDED_PACKAGES = ("flair", "torch", "spacy", "scikit-learn", "rapidfuzz", "pdfplumber", "fr_core_news_sm", "fr_core_news_md")
+
+
+
+# ********************************************* # 
+# --- STATISTIQUES DE LATENCE ET DE MÉMOIRE --- # 
+# ********************************************* # 
+
+
+
+def percentile(values, q):
+    """
+    Percentile 'q' (0 à 100) de 'values', par interpolation linéaire entre les deux rangs voisins.
+    """
+    if not values:
+        return None
+    ordered = sorted(values)
+    rank = (len(ordered) - 1) * q / 100
+    lower = int(rank)
+    upper = min(lower + 1, len(ordered) - 1)
+    return ordered[lower] + (ordered[upper] - ordered[lower]) * (rank - lower)
+
+
+
+def latency_summary(latencies_ms, elapsed_seconds):
+    """
+    Débit et distribution des latences d'une étape.
+
+    :param latencies_ms: Latence de chaque CV (ms)
+    :param elapsed_seconds: Durée totale de l'étape (s)
+    """
+    docs = len(latencies_ms)
+    return {
+        "docs": docs,
+        "seconds": elapsed_seconds,
+        "docs_per_sec": docs / elapsed_seconds if elapsed_seconds > 0 else None,
+        "latency_ms": {
+            "mean": sum(latencies_ms) / docs if docs else None,
+            "p50": percentile(latencies_ms, 50),
+            "p95": percentile(latencies_ms, 95),
+            "p99": percentile(latencies_ms, 99),
+            "max": max(latencies_ms) if docs else None
+        }
+    }
+
+
+
+def peak_rss_mb():
+    """
+    Pic de mémoire résidente (Mo) de ce processus et du plus gros de ses processus de travail terminés.
+    """
+    # ru_maxrss est en Ko sous Linux, en octets sous macOS
+    unit = 1 if sys.platform == "darwin" else 1024
+    return {
+        "self": resource.getrusage(resource.RUSAGE_SELF).ru_maxrss * unit / (1024 * 1024),
+        "children": resource.getrusage(resource.RUSAGE_CHILDREN).ru_maxrss * unit / (1024 * 1024)
+    }
+
+
+
+# ******************************************************* # 
+# --- MESURE DE LA CHAÎNE COMPLÈTE ET DE CHAQUE ÉTAPE --- # 
+# ******************************************************* # 
+
+
+
+def collect_pdf_paths(folders, limit=None):
+    """
+    CV PDF des dossiers 'folders' (sans sous-dossiers), dans un ordre stable.
+    """
+    pdf_paths = []
+    for folder in folders:
+        if os.path.isdir(folder):
+            pdf_paths.extend(main.list_cv_files(str(folder)))
+        else:
+            print(f"Dossier ignoré (introuvable) : {folder}")
+    return pdf_paths[:limit] if limit else pdf_paths
+
+
+
+def bench_full(pdf_paths, batch_size, mini_batch_size, jobs, share_models, cache_path, pdf_options=None, stream_pages=False):
+    """
+    Chaîne complète sur tous les CV. La latence d'un CV est la somme de ses étapes
+    (sa part de l'annotation NER du lot comprise), mesurée par Instrumentation.
+    """
+    trace_records, limit_records = [], []
+    start = time.perf_counter()
+    main.process_cv_files(pdf_paths, batch_size=batch_size, mini_batch_size=mini_batch_size, jobs=jobs,
+                          share_models=share_models, cache_path=cache_path,
+                          trace_records=trace_records, save_results=False, pdf_options=pdf_options,
+                          limit_records=limit_records, stream_pages=stream_pages)
+    elapsed = time.perf_counter() - start
+
+    result = latency_summary([record["total_wall_ms"] for record in trace_records], elapsed)
+    result["stages"] = summarize_stages(trace_records)
+    result["skipped"] = sum(1 for record in limit_records if "skipped" in record)
+    result["truncated"] = sum(1 for record in limit_records if "truncated" in record)
+    return result
+
+
+
+def bench_isolated(pdf_paths, stages, batch_size, mini_batch_size, pdf_options=None):
+    """
+    Mesure chaque étape de 'stages' séparément, sur un seul processus et sans cache.
+    Les étapes précédant la dernière étape demandée sont exécutées (et mesurées) pour lui fournir ses entrées.
+    """
+    last_stage = max(ISOLATED_STAGES.index(stage) for stage in stages)
+    chain = ISOLATED_STAGES[:last_stage + 1]
+    results = {}
+
+    # --- Extraction du texte ---
+    texts, latencies = [], []
+    start = time.perf_counter()
+    for pdf_path in pdf_paths:
+        doc_start = time.perf_counter()
+        texts.append(main.extract_text_from_pdf(pdf_path, **(pdf_options or {})))
+        latencies.append((time.perf_counter() - doc_start) * 1000)
+    results["pdf"] = latency_summary(latencies, time.perf_counter() - start)
+    if "ner" not in chain:
+        return results
+
+    # --- Annotation NER par lots (latence d'un CV : sa part du lot, au prorata de ses phrases) ---
+    analyses, latencies = [], []
+    start = time.perf_counter()
+    for batch_start in range(0, len(texts), batch_size):
+        batch_texts = texts[batch_start:batch_start + batch_size]
+        traces = [CVTrace(None) for _ in batch_texts]
+        analyses.extend(main.annotate_cv_texts(batch_texts, mini_batch_size=mini_batch_size, traces=traces))
+        latencies.extend(trace.to_record()["total_wall_ms"] for trace in traces)
+    results["ner"] = latency_summary(latencies, time.perf_counter() - start)
+    if "postprocess" not in chain:
+        return results
+
+    # --- Extraction et nettoyage des entités ---
+    structured, latencies = [], []
+    start = time.perf_counter()
+    for text, analysis in zip(texts, analyses):
+        doc_start = time.perf_counter()
+        structured.append(main.structure_cv(text, main.extract_all_entities(text, analysis)))
+        latencies.append((time.perf_counter() - doc_start) * 1000)
+    results["postprocess"] = latency_summary(latencies, time.perf_counter() - start)
+    if "classify" not in chain:
+        return results
+
+    # --- Classification ---
+    latencies = []
+    start = time.perf_counter()
+    for structured_data in structured:
+        doc_start = time.perf_counter()
+        main.classify_cv(structured_data, cache=None)
+        latencies.append((time.perf_counter() - doc_start) * 1000)
+    results["classify"] = latency_summary(latencies, time.perf_counter() - start)
+    return results
+
+
+
+def git_revision():
+    """
+    Commit mesuré (None hors dépôt git), suffixé de "-dirty" si l'arbre de travail est modifié.
+    """
+    try:
+        revision = subprocess.run(["git", "rev-parse", "--short", "HEAD"], cwd=BASE_DIR,
+                                  capture_output=True, text=True, check=True).stdout.strip()
+        dirty = subprocess.run(["git", "status", "--porcelain", "--untracked-files=no"], cwd=BASE_DIR,
+                               capture_output=True, text=True, check=True).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+    return revision + ("-dirty" if dirty else "")
+
+
+
+def run_benchmark(folders=DEFAULT_BENCH_FOLDERS, stages=ALL_STAGES, batch_size=main.DEFAULT_BATCH_SIZE,
+                  mini_batch_size=main.DEFAULT_MINI_BATCH_SIZE, jobs=1, share_models=False, cache_path=None,
+                  limit=None, label=None, pdf_options=None, stream_pages=False):
+    """
+    Exécute le banc d'essai et retourne ses résultats (dictionnaire sérialisable en JSON).
+
+    Les modèles sont chargés avant les mesures : leur temps de chargement est rapporté à part
+    et n'entre pas dans les latences. Avec jobs > 1 sans 'share_models', chaque processus de
+    travail charge ses propres modèles pendant la mesure de la chaîne complète.
+    """
+    pdf_paths = collect_pdf_paths(folders, limit)
+    if not pdf_paths:
+        raise SystemExit("Aucun CV PDF à mesurer.")
+    # Sans --cache, le texte des PDF est aussi ré-extrait : l'étape "pdf" mesure l'extraction, pas sa relecture
+    pdf_options = {"text_cache": cache_path is not None, **(pdf_options or {})}
+
+    rss_before_models = current_rss_bytes()
+    if jobs <= 1 or share_models or any(stage in ISOLATED_STAGES for stage in stages):
+        prewarm(main.SHARED_MODELS, background=False)
+    models = model_report()
+    models_rss_mb = (current_rss_bytes() - rss_before_models) / (1024 * 1024)
+
+    results = {}
+    if "full" in stages:
+        print(f"\nChaîne complète : {len(pdf_paths)} CV...")
+        results["full"] = bench_full(pdf_paths, batch_size, mini_batch_size, jobs, share_models, cache_path, pdf_options, stream_pages)
+    isolated = [stage for stage in stages if stage in ISOLATED_STAGES]
+    if isolated:
+        print(f"\nÉtapes isolées : {', '.join(isolated)}...")
+        results.update(bench_isolated(pdf_paths, isolated, batch_size, mini_batch_size, pdf_options))
+
+    return {
+        "label": label,
+        "timestamp": time.strftime("%Y-%m-%dT%H:%M:%S"),
+        "git_revision": git_revision(),
+        "config": {
+            "folders": [str(folder) for folder in folders],
+            "docs": len(pdf_paths),
+            "stages": list(stages),
+            "batch_size": batch_size,
+            "mini_batch_size": mini_batch_size,
+            "jobs": jobs,
+            "share_models": share_models,
+            "cache": cache_path is not None,
+            "pdf_backend": main.backend_version(main.resolve_backend(pdf_options.get("backend", main.DEFAULT_PDF_BACKEND))),
+            "page_jobs": pdf_options.get("page_jobs", main.DEFAULT_PAGE_JOBS),
+            "stream_pages": stream_pages
+        },
+        "environment": {
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "cpu_count": os.cpu_count(),
+            "packages": {name: package_version(name) for name in RECORDED_PACKAGES}
+        },
+        "models": {
+            "load_seconds": sum(entry["load_seconds"] or 0 for entry in models),
+            "rss_mb": models_rss_mb,
+            "details": models
+        },
+        "peak_rss_mb": peak_rss_mb(),
+        "results": results
+    }
+
+
+
+# ********************************************** # 
+# --- AFFICHAGE ET COMPARAISON DES RÉSULTATS --- # 
+# ********************************************** # 
+
+
+
+def _format(value, pattern="{:.1f}"):
+    return "-" if value is None else pattern.format(value)
+
+
+
+def print_results(benchmark):
+    config = benchmark["config"]
+    print(f"\nBanc d'essai {benchmark['label'] or ''} ({benchmark['git_revision'] or 'hors git'}) : "
+          f"{config['docs']} CV, lots de {config['batch_size']}, {config['jobs']} processus, "
+          f"cache {'activé' if config['cache'] else 'désactivé'}\n")
+    print(f"  {'étape':<14}{'CV/s':>10}{'p50 (ms)':>12}{'p95 (ms)':>12}{'p99 (ms)':>12}{'total (s)':>12}")
+    for stage, result in benchmark["results"].items():
+        latency = result["latency_ms"]
+        print(f"  {stage:<14}{_format(result['docs_per_sec'], '{:.2f}'):>10}{_format(latency['p50']):>12}"
+              f"{_format(latency['p95']):>12}{_format(latency['p99']):>12}{_format(result['seconds'], '{:.2f}'):>12}")
+
+    print(f"\n  Chargement des modèles : {benchmark['models']['load_seconds']:.2f} s")
+    peak = benchmark["peak_rss_mb"]
+    print(f"  Pic de mémoire         : {peak['self']:.1f} Mo (processus principal), {peak['children']:.1f} Mo (processus de travail)\n")
+
+
+
+def compare_results(benchmark, baseline):
+    """
+    Affiche l'évolution du débit et des latences de chaque étape par rapport à 'baseline'.
+    """
+    print(f"\nComparaison avec {baseline.get('label') or baseline.get('git_revision') or 'la référence'} ({baseline['timestamp']}) :\n")
+    print(f"  {'étape':<14}{'CV/s':>22}{'p95 (ms)':>24}")
+    for stage, result in benchmark["results"].items():
+        reference = baseline["results"].get(stage)
+        if reference is None:
+            continue
+        old_rate, new_rate = reference["docs_per_sec"], result["docs_per_sec"]
+        old_p95, new_p95 = reference["latency_ms"]["p95"], result["latency_ms"]["p95"]
+        speedup = f"x{new_rate / old_rate:.2f}" if old_rate and new_rate else "-"
+        print(f"  {stage:<14}{_format(old_rate, '{:.2f}'):>8} → {_format(new_rate, '{:.2f}'):<6}{speedup:>6}"
+              f"{_format(old_p95):>12} → {_format(new_p95):<10}")
+    old_peak, new_peak = baseline["peak_rss_mb"]["self"], benchmark["peak_rss_mb"]["self"]
+    print(f"\n  Pic de mémoire : {old_peak:.1f} → {new_peak:.1f} Mo\n")
+
+
+
+def save_results(benchmark, output=None):
+    """
+    Enregistre les résultats en JSON (par défaut dans data/benchmarks) et retourne le chemin du fichier.
+    """
+    if output is None:
+        name = benchmark["label"] or benchmark["git_revision"] or "run"
+        output = DEFAULT_RESULTS_DIR / f"benchmark_{time.strftime('%Y%m%d_%H%M%S')}_{name}.json"
+    output = Path(output)
+    output.parent.mkdir(parents=True, exist_ok=True)
+    with open(output, "w", encoding="utf-8") as file:
+        json.dump(benchmark, file, ensure_ascii=False, indent=2)
+    return output
+
+
+
+# ************************************************************** # 
+# --- POINT D'ENTRÉE DU SCRIPT SI IL EST EXÉCUTÉ DIRECTEMENT --- # 
+# ************************************************************** # 
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Banc d'essai de la chaîne d'analyse des CV.")
+    parser.add_argument("folders", nargs="*", default=[str(folder) for folder in DEFAULT_BENCH_FOLDERS], help="Dossiers de CV PDF mesurés")
+    parser.add_argument("--stages", nargs="+", choices=ALL_STAGES, default=list(ALL_STAGES), help="Étapes mesurées (chaîne complète et/ou étapes isolées)")
+    parser.add_argument("--batch-size", type=int, default=main.DEFAULT_BATCH_SIZE, help="Nombre de CV annotés ensemble")
+    parser.add_argument("--mini-batch-size", type=int, default=main.DEFAULT_MINI_BATCH_SIZE, help="Nombre de phrases traitées simultanément par le BiLSTM")
+    parser.add_argument("--jobs", type=int, default=1, help="Nombre de processus de travail (chaîne complète)")
+    parser.add_argument("--share-models", action="store_true", help="Avec --jobs : modèles partagés entre processus (fork)")
+    parser.add_argument("--cache", nargs="?", const=DEFAULT_CACHE_PATH, help="Utilise le cache des résultats (désactivé par défaut pour mesurer l'analyse)")
+    parser.add_argument("--pdf-backend", choices=list(main.PDF_BACKENDS) + ["fast"], default=main.DEFAULT_PDF_BACKEND,
+                        help="Moteur d'extraction du texte des PDF")
+    parser.add_argument("--page-jobs", type=int, default=main.DEFAULT_PAGE_JOBS, help="Nombre de processus se partageant les pages des longs PDF")
+    parser.add_argument("--stream-pages", action="store_true", help="Chaîne complète : pages annotées au fil de leur extraction")
+    parser.add_argument("--limit", type=int, help="Nombre maximal de CV mesurés")
+    parser.add_argument("--label", help="Nom de la configuration mesurée")
+    parser.add_argument("--output", help="Fichier JSON des résultats (par défaut dans data/benchmarks)")
+    parser.add_argument("--compare", metavar="FICHIER", help="Résultats JSON d'une exécution précédente à comparer")
+    args = parser.parse_args()
+
+    benchmark = run_benchmark(
+        folders=args.folders,
+        stages=args.stages,
+        batch_size=args.batch_size,
+        mini_batch_size=args.mini_batch_size,
+        jobs=args.jobs,
+        share_models=args.share_models,
+        cache_path=args.cache,
+        limit=args.limit,
+        label=args.label,
+        pdf_options={"backend": args.pdf_backend, "page_jobs": args.page_jobs},
+        stream_pages=args.stream_pages
+    )
+    print_results(benchmark)
+    print(f"Résultats enregistrés dans : {save_results(benchmark, args.output)}")
+
+    if args.compare:
+        with open(args.compare, "r", encoding="utf-8") as file:
+            compare_results(benchmark, json.load(file))
@@ -0,0 +1,409 @@
+# /**************************************************************************************************************************************************************************************
+# Nom du fichier : Daemon_cv_classifier.py
+# Rôle du fichier : Ce fichier fournit un service local (socket Unix) qui garde les modèles de main.py et Sklearn_cv_classifier.py chargés, ainsi que le client léger utilisé par la GUI et la ligne de commande.
+
+# Auteur : Maxime BRONNY
+# Version : V1
+# Licence : Réalisé dans le cadre des cours "Fouille de données, Ingéniérie des langues, Développement logiciel libre, IA & Apprentisage" L3 INFORMATIQUE IED
+# Usage : Un paquetage a été mit en place pour l'utiliser veuillez utiliser dans un système debian la commande suivante :
+#           - INSTALLATION DU PAQUET GÉNÉRÉ
+#               - sudo apt install ./cv-classifier_1.0-1_all.deb
+
+#           Puis exécute ton programme avec :
+#               - cv-classifier
+# ***************************************************************************************************************************************************************************************/
+
+
+
+# ************************************************************ # 
+# --- LIBRAIRIES UTILISÉES POUR LE SERVICE D'ANALYSE LOCAL --- # 
+# ************************************************************ # 
+
+
+
+import os             # Chemins, suppression de l'ancienne socket
+import sys            # Sortie standard et code de retour du client
+import json           # Protocole : un message JSON par ligne
+import socket         # Connexion du client à la socket Unix
+import argparse       # Interface en ligne de commande (serve / submit / ping / stop)
+import threading      # Sérialisation des analyses et arrêt du serveur
+import contextlib     # Redirection des sorties de l'analyse vers le client
+import socketserver   # Serveur multi-threadé sur socket Unix
+
+
+
+# *************************************** # 
+# --- PARAMÈTRES DU SERVICE D'ANALYSE --- # 
+# *************************************** # 
+
+
+
+# Socket Unix du service (surchargeable par la variable d'environnement CV_CLASSIFIER_SOCKET)
+DEFAULT_SOCKET_PATH = os.environ.get("CV_CLASSIFIER_SOCKET", "/var/lib/cv-classifier/cv-classifier.sock")
+
+# Délai de connexion du client avant de considérer le service comme absent (en secondes)
+CONNECT_TIMEOUT = 2.0
+
+# Droits de la socket : seul l'utilisateur du service peut lui envoyer des requêtes
+SOCKET_MODE = 0o600
+
+# Options d'analyse acceptées d'un client, et leur type. Aucune ne désigne un fichier :
+# la trace est renvoyée au client, qui l'écrit lui-même
+_INT_OPTIONS = ("batch_size", "mini_batch_size", "jobs")
+_BOOL_OPTIONS = ("no_cache", "timings", "trace", "stream_pages")
+_PDF_INT_OPTIONS = ("page_jobs", "max_bytes", "max_pages", "max_chars")
+
+
+
+# ***************************************************************** # 
+# --- ENVOI DES SORTIES DE L'ANALYSE AU CLIENT, LIGNE PAR LIGNE --- # 
+# ***************************************************************** # 
+
+
+
+class _LineStreamWriter:
+    """
+    Flux de sortie qui transmet chaque ligne écrite au client sous la forme
+    d'un message {"type": "log", "line": ...}.
+    """
+
+    def __init__(self, send):
+        self.send = send
+        self.buffer = ""
+
+    def write(self, text):
+        self.buffer += text
+        *lines, self.buffer = self.buffer.split("\n")
+        for line in lines:
+            if line.strip():
+                self.send({"type": "log", "line": line})
+        return len(text)
+
+    def flush(self):
+        if self.buffer.strip():
+            self.send({"type": "log", "line": self.buffer})
+        self.buffer = ""
+
+
+
+# *************************************** # 
+# --- TRAITEMENT DES REQUÊTES CLIENTS --- # 
+# *************************************** # 
+
+
+
+# Une seule analyse à la fois : les modèles ne sont pas partagés entre analyses concurrentes
+_job_lock = threading.Lock()
+
+
+
+def _positive_int(name, value):
+    if not isinstance(value, int) or isinstance(value, bool) or value < 1:
+        raise ValueError(f"Option {name} : entier positif attendu")
+    return value
+
+
+
+def validate_options(options):
+    """
+    Vérifie les options d'analyse reçues d'un client et les convertit en paramètres de main.process_cv_files.
+    Toute option inconnue ou mal typée est refusée (ValueError).
+    """
+    from Pdf_backends import PDF_BACKENDS, TEXT_STORE_SUFFIXES
+
+    if not isinstance(options, dict):
+        raise ValueError("Options invalides : dictionnaire attendu")
+    unknown = set(options) - set(_INT_OPTIONS) - set(_BOOL_OPTIONS) - {"pdf_options"}
+    if unknown:
+        raise ValueError(f"Options refusées : {', '.join(sorted(unknown))}")
+
+    kwargs = {}
+    for name in _INT_OPTIONS:
+        if name in options:
+            kwargs[name] = _positive_int(name, options[name])
+    if "jobs" in kwargs:
+        # Le nombre de processus de travail reste borné par le nombre de cœurs de la machine
+        kwargs["jobs"] = min(kwargs["jobs"], os.cpu_count() or 1)
+    for name in _BOOL_OPTIONS:
+        if name in options and not isinstance(options[name], bool):
+            raise ValueError(f"Option {name} : booléen attendu")
+    if options.get("no_cache"):
+        kwargs["cache_path"] = None
+    if options.get("timings"):
+        kwargs["timings"] = True
+    if options.get("stream_pages"):
+        kwargs["stream_pages"] = True
+
+    pdf_options = options.get("pdf_options") or {}
+    if not isinstance(pdf_options, dict):
+        raise ValueError("Option pdf_options : dictionnaire attendu")
+    unknown = set(pdf_options) - set(_PDF_INT_OPTIONS) - {"backend", "text_cache", "text_compression"}
+    if unknown:
+        raise ValueError(f"Options d'extraction refusées : {', '.join(sorted(unknown))}")
+    if "backend" in pdf_options and pdf_options["backend"] not in list(PDF_BACKENDS) + ["fast"]:
+        raise ValueError(f"Moteur d'extraction PDF inconnu : {pdf_options['backend']}")
+    for name in _PDF_INT_OPTIONS:
+        if pdf_options.get(name) is not None:
+            _positive_int(name, pdf_options[name])
+    if "text_cache" in pdf_options and not isinstance(pdf_options["text_cache"], bool):
+        raise ValueError("Option text_cache : booléen attendu")
+    if pdf_options.get("text_compression") not in TEXT_STORE_SUFFIXES:
+        raise ValueError(f"Compression inconnue : {pdf_options['text_compression']}")
+    if pdf_options:
+        kwargs["pdf_options"] = dict(pdf_options)
+    return kwargs
+
+
+
+class _RequestHandler(socketserver.StreamRequestHandler):
+    """
+    Traite une requête JSON d'une ligne :
+      - {"action": "ping"}                              : état du service et des modèles
+      - {"action": "process", "path": ..., "options"}   : analyse d'un fichier PDF ou d'un dossier
+      - {"action": "stop"}                              : arrêt du service
+    Chaque requête se termine par un message {"type": "done", "ok": ...}.
+    """
+
+    def send(self, message):
+        self.wfile.write((json.dumps(message, ensure_ascii=False, default=str) + "\n").encode("utf-8"))
+        self.wfile.flush()
+
+    def handle(self):
+        try:
+            request = json.loads(self.rfile.readline().decode("utf-8"))
+        except ValueError as e:
+            self.send({"type": "done", "ok": False, "error": f"Requête invalide : {e}"})
+            return
+
+        action = request.get("action")
+
+        if action == "ping":
+            from Model_registry import model_report
+            self.send({"type": "done", "ok": True, "busy": _job_lock.locked(), "models": model_report()})
+
+        elif action == "process":
+            self.process(request.get("path", ""), request.get("options") or {})
+
+        elif action == "stop":
+            self.send({"type": "done", "ok": True})
+            threading.Thread(target=self.server.shutdown, daemon=True).start()
+
+        else:
+            self.send({"type": "done", "ok": False, "error": f"Action inconnue : {action}"})
+
+    def process(self, path, options):
+        import main
+
+        try:
+            kwargs = validate_options(options)
+        except ValueError as e:
+            self.send({"type": "done", "ok": False, "error": str(e)})
+            return
+        trace_records = [] if options.get("trace") else None
+        error_records = []
+
+        if os.path.isdir(path):
+            pdf_paths = main.list_cv_files(path)
+        elif os.path.isfile(path):
+            pdf_paths = [path]
+        else:
+            self.send({"type": "done", "ok": False, "error": f"Chemin introuvable : {path}"})
+            return
+
+        # La sortie standard du processus est détournée vers le client pendant l'analyse : le pré-chargement
+        # des modèles, qui affiche sa progression depuis un autre thread, doit être terminé avant
+        if self.server.prewarm_thread is not None:
+            self.server.prewarm_thread.join()
+
+        writer = _LineStreamWriter(self.send)
+        with _job_lock:
+            try:
+                with contextlib.redirect_stdout(writer), contextlib.redirect_stderr(writer):
+                    main.process_cv_files(pdf_paths, trace_records=trace_records, error_records=error_records, **kwargs)
+                writer.flush()
+                # Les CV en échec sont signalés sans faire échouer la requête : les autres CV ont été écrits
+                self.send({"type": "done", "ok": True, "processed": len(pdf_paths), "trace_records": trace_records,
+                           "errors": error_records})
+            except Exception as e:
+                writer.flush()
+                self.send({"type": "done", "ok": False, "error": str(e)})
+
+
+
+class _DaemonServer(socketserver.ThreadingMixIn, socketserver.UnixStreamServer):
+    daemon_threads = True
+    prewarm_thread = None   # Thread du pré-chargement des modèles, attendu avant la première analyse
+
+
+
+# ************************************** # 
+# --- DÉMARRAGE DU SERVICE D'ANALYSE --- # 
+# ************************************** # 
+
+
+
+def serve(socket_path=DEFAULT_SOCKET_PATH, prewarm_models=True):
+    """
+    Démarre le service d'analyse sur la socket Unix 'socket_path' jusqu'à la réception d'un "stop".
+    Les modèles sont pré-chargés en arrière-plan puis gardés en mémoire entre les analyses.
+    """
+    # Supprime une socket laissée par un service arrêté brutalement
+    if os.path.exists(socket_path):
+        if daemon_available(socket_path):
+            print(f"Un service d'analyse est déjà actif sur {socket_path}")
+            return
+        os.remove(socket_path)
+
+    # L'import de main est léger : les modèles sont chargés par Model_registry
+    import main
+    from Model_registry import prewarm
+
+    with _DaemonServer(socket_path, _RequestHandler) as server:
+        os.chmod(socket_path, SOCKET_MODE)
+        if prewarm_models:
+            server.prewarm_thread = prewarm(background=True)
+        print(f"Service d'analyse de CV en écoute sur {socket_path}")
+        try:
+            server.serve_forever()
+        finally:
+            if os.path.exists(socket_path):
+                os.remove(socket_path)
+    print("Service d'analyse arrêté.")
+
+
+
+# ************************************** # 
+# --- CLIENT LÉGER (GUI ET TERMINAL) --- # 
+# ************************************** # 
+
+
+
+def _request(message, socket_path=DEFAULT_SOCKET_PATH, timeout=CONNECT_TIMEOUT):
+    """
+    Envoie une requête au service et retourne un itérateur sur ses messages de réponse.
+    """
+    client = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    client.settimeout(timeout)
+    client.connect(socket_path)
+    # Une analyse peut durer longtemps : plus de délai une fois connecté
+    client.settimeout(None)
+
+    with client, client.makefile("rwb") as stream:
+        stream.write((json.dumps(message, ensure_ascii=False) + "\n").encode("utf-8"))
+        stream.flush()
+        for raw_line in stream:
+            yield json.loads(raw_line.decode("utf-8"))
+
+
+
+def daemon_available(socket_path=DEFAULT_SOCKET_PATH):
+    """
+    Indique si un service d'analyse répond sur 'socket_path'.
+    """
+    if not os.path.exists(socket_path):
+        return False
+    try:
+        for message in _request({"action": "ping"}, socket_path):
+            return message.get("ok", False)
+    except (OSError, ValueError):
+        return False
+    return False
+
+
+
+def submit_job(path, socket_path=DEFAULT_SOCKET_PATH, on_line=print, options=None):
+    """
+    Demande au service l'analyse d'un fichier PDF ou d'un dossier de CV.
+
+    :param path: Fichier PDF ou dossier à analyser (chemin absolu conseillé)
+    :param on_line: Fonction appelée pour chaque ligne de sortie de l'analyse
+    :param options: Options de l'analyse, vérifiées par le service (validate_options) : batch_size, mini_batch_size,
+                    jobs, no_cache, timings, trace, stream_pages, pdf_options (backend, max_pages...)
+    :return: Dernier message du service ({"type": "done", "ok": ...})
+    """
+    message = {"action": "process", "path": os.path.abspath(path), "options": options or {}}
+    result = {"type": "done", "ok": False, "error": "Réponse du service interrompue."}
+    for reply in _request(message, socket_path):
+        if reply.get("type") == "log":
+            on_line(reply["line"])
+        else:
+            result = reply
+    return result
+
+
+
+def stop_daemon(socket_path=DEFAULT_SOCKET_PATH):
+    for reply in _request({"action": "stop"}, socket_path):
+        return reply.get("ok", False)
+    return False
+
+
+
+# *********************************** # 
+# --- POINT D'ENTRÉE DU PROGRAMME --- # 
+# *********************************** # 
+
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Service local d'analyse de CV (modèles gardés en mémoire).")
+    parser.add_argument("--socket", default=DEFAULT_SOCKET_PATH, help="Chemin de la socket Unix du service")
+    subparsers = parser.add_subparsers(dest="command", required=True)
+
+    serve_parser = subparsers.add_parser("serve", help="Démarre le service")
+    serve_parser.add_argument("--no-prewarm", action="store_true", help="Ne pré-charge pas les modèles au démarrage")
+
+    submit_parser = subparsers.add_parser("submit", help="Envoie un fichier PDF ou un dossier à analyser")
+    submit_parser.add_argument("path", help="Fichier PDF ou dossier de CV")
+    submit_parser.add_argument("--batch-size", type=int, help="Nombre de CV annotés ensemble")
+    submit_parser.add_argument("--mini-batch-size", type=int, help="Nombre de phrases traitées simultanément par le BiLSTM")
+    submit_parser.add_argument("--jobs", type=int, help="Nombre de processus de travail traitant les lots en parallèle")
+    submit_parser.add_argument("--no-cache", action="store_true", help="Ré-analyse tous les CV sans lire ni écrire le cache")
+    submit_parser.add_argument("--pdf-backend", help="Moteur d'extraction du texte des PDF (pdfplumber, pymupdf, pypdfium2, pdfminer ou fast)")
+    submit_parser.add_argument("--stream-pages", action="store_true", help="Annote les pages de chaque CV au fil de leur extraction")
+    submit_parser.add_argument("--trace", metavar="FICHIER", help="Fichier JSONL recevant la trace (temps par étape) de chaque CV")
+    submit_parser.add_argument("--timings", action="store_true", help="Affiche le temps cumulé de chaque étape à la fin du traitement")
+
+    subparsers.add_parser("ping", help="Vérifie que le service répond")
+    subparsers.add_parser("stop", help="Arrête le service")
+
+    args = parser.parse_args()
+
+    if args.command == "serve":
+        serve(args.socket, prewarm_models=not args.no_prewarm)
+
+    elif args.command == "submit":
+        options = {}
+        if args.batch_size:
+            options["batch_size"] = args.batch_size
+        if args.mini_batch_size:
+            options["mini_batch_size"] = args.mini_batch_size
+        if args.jobs:
+            options["jobs"] = args.jobs
+        if args.no_cache:
+            options["no_cache"] = True
+        if args.pdf_backend:
+            options["pdf_options"] = {"backend": args.pdf_backend}
+        if args.stream_pages:
+            options["stream_pages"] = True
+        if args.trace:
+            # La trace est renvoyée par le service et écrite ici, avec les droits du client
+            options["trace"] = True
+        if args.timings:
+            options["timings"] = True
+        result = submit_job(args.path, args.socket, options=options)
+        if not result.get("ok"):
+            print(f"Erreur : {result.get('error')}")
+            sys.exit(1)
+        if args.trace:
+            from Instrumentation import write_trace_records
+            write_trace_records(args.trace, result.get("trace_records") or [])
+        print(f"\n\nAnalyse terminé ! ({result.get('processed', 0)} CV)\n\n")
+
+    elif args.command == "ping":
+        available = daemon_available(args.socket)
+        print("Service actif." if available else "Aucun service actif.")
+        sys.exit(0 if available else 1)
+
+    elif args.command == "stop":
+        print("Service arrêté." if stop_daemon(args.socket) else "Arrêt impossible.")
@@ -0,0 +1,172 @@
+# /**************************************************************************************************************************************************************************************
+# Nom du fichier : Fuzzy_correction.py
+# Rôle du fichier : Ce fichier fournit le moteur de correction par similarité floue : les vocabulaires de référence sont normalisés une seule fois et tous les termes détectés sont comparés à toutes les références en un seul calcul matriciel.
+
+# Auteur : Maxime BRONNY
+# Version : V1
+# Licence : Réalisé dans le cadre des cours "Fouille de données, Ingéniérie des langues, Développement logiciel libre, IA & Apprentisage" L3 INFORMATIQUE IED
+# Usage : Un paquetage a été mit en place pour l'utiliser veuillez utiliser dans un système debian la commande suivante :
+#           - INSTALLATION DU PAQUET GÉNÉRÉ
+#               - sudo apt install ./cv-classifier_1.0-1_all.deb
+
+#           Puis exécute ton programme avec :
+#               - cv-classifier
+# ***************************************************************************************************************************************************************************************/
+
+
+
+# ******************************************************************** # 
+# --- LIBRAIRIES UTILISÉES POUR LA CORRECTION PAR SIMILARITÉ FLOUE --- # 
+# ******************************************************************** # 
+
+
+
+from collections import namedtuple
+
+# --- Bibliothèque numérique pour la recherche du meilleur score de chaque ligne ---
+import numpy as np
+
+# --- Comparaison floue de chaînes, calcul matriciel multi-thread ---
+from rapidfuzz import fuzz, process
+
+# --- Présélection des références candidates pour les grands vocabulaires (ESCO) ---
+from Ngram_index import TrigramIndex, DEFAULT_CANDIDATE_LIMIT
+
+
+
+# *********************************** # 
+# --- PARAMÈTRES DE LA CORRECTION --- # 
+# *********************************** # 
+
+
+
+# Score minimal (exclu) pour remplacer un terme détecté par la référence la plus proche
+DEFAULT_THRESHOLD = 80
+
+# Nombre de threads utilisés par rapidfuzz (-1 : tous les cœurs disponibles)
+DEFAULT_WORKERS = -1
+
+# Taille de vocabulaire à partir de laquelle les candidats sont présélectionnés par l'index de trigrammes
+# (en dessous, la matrice complète termes x références reste la plus rapide)
+DEFAULT_MIN_INDEX_SIZE = 1000
+
+
+
+# Résultat de la correction d'un terme détecté
+#   - original  : terme tel que détecté
+#   - match     : référence la plus proche (forme d'origine du vocabulaire), ou None
+#   - score     : score de similarité avec cette référence (0 à 100)
+#   - corrected : référence si score > seuil, sinon le terme d'origine
+Correction = namedtuple("Correction", ["original", "match", "score", "corrected"])
+
+
+
+# **************************** # 
+# --- MOTEUR DE CORRECTION --- # 
+# **************************** # 
+
+
+
+class FuzzyCorrector:
+    """
+    Corrige des termes détectés à partir d'un vocabulaire de référence.
+
+    Le vocabulaire est trié et normalisé une seule fois à la création ; chaque appel à correct()
+    compare tous les termes à toutes les références en un seul appel à process.cdist.
+    Pour un grand vocabulaire, un index de trigrammes présélectionne d'abord quelques dizaines
+    de candidats par terme ; tous les couples (terme, candidat) sont ensuite comparés en un seul
+    appel à process.cpdist, et chaque terme retient le meilleur de ses candidats.
+    """
+
+    def __init__(self, vocabulary, scorer=fuzz.WRatio, processor=None, threshold=DEFAULT_THRESHOLD, index_processor=None,
+                 index_dir=None, min_index_size=DEFAULT_MIN_INDEX_SIZE, candidate_limit=DEFAULT_CANDIDATE_LIMIT):
+        """
+        :param vocabulary: Références (forme renvoyée en cas de correction)
+        :param scorer: Fonction de similarité de rapidfuzz (fuzz.WRatio, fuzz.ratio...)
+        :param processor: Normalisation appliquée aux références et aux termes avant comparaison
+        :param threshold: Score minimal (exclu) pour appliquer une correction
+        :param index_processor: Normalisation des références et des termes pour la présélection par l'index
+                                seulement, les scores restant calculés avec 'processor' (None : 'processor')
+        :param index_dir: Dossier où l'index de trigrammes est enregistré puis rechargé (None : en mémoire)
+        :param min_index_size: Taille de vocabulaire à partir de laquelle l'index est utilisé
+        :param candidate_limit: Nombre de candidats présélectionnés par terme
+        """
+        self.scorer = scorer
+        self.processor = processor
+        self.threshold = threshold
+        self.index_processor = index_processor
+        self.candidate_limit = candidate_limit
+        self.choices = sorted(vocabulary)
+        self.normalized_choices = [self._prepare(choice) for choice in self.choices]
+        self.index = None
+        if len(self.choices) >= min_index_size:
+            self.index = TrigramIndex.load_or_build(self._index_keys(self.choices), index_dir)
+
+    def _prepare(self, text):
+        return self.processor(text) if self.processor is not None else text
+
+    def _index_keys(self, texts):
+        # Formes sous lesquelles les références sont indexées et les termes recherchés dans l'index de trigrammes
+        if self.index_processor is None:
+            return [self._prepare(text) for text in texts]
+        return [self.index_processor(text) for text in texts]
+
+    def score_matrix(self, items, workers=DEFAULT_WORKERS):
+        """
+        Matrice des scores (termes x références), calculée en parallèle par rapidfuzz.
+        """
+        queries = [self._prepare(item) for item in items]
+        return process.cdist(queries, self.normalized_choices, scorer=self.scorer, dtype=np.float32, workers=workers)
+
+    def correct(self, items, workers=DEFAULT_WORKERS):
+        """
+        Retourne une Correction pour chaque terme de 'items', dans le même ordre.
+        """
+        items = list(items)
+        if not items or not self.choices:
+            return [Correction(item, None, 0.0, item) for item in items]
+        if self.index is not None:
+            return self._correct_with_index(items, workers)
+
+        scores = self.score_matrix(items, workers)
+        best_indices = scores.argmax(axis=1)
+
+        corrections = []
+        for item, row, best in zip(items, scores, best_indices):
+            score = float(row[best])
+            match = self.choices[best]
+            corrections.append(Correction(item, match, score, match if score > self.threshold else item))
+        return corrections
+
+    def _correct_with_index(self, items, workers=DEFAULT_WORKERS):
+        """
+        Corrige les termes en ne les comparant qu'aux candidats présélectionnés par l'index de trigrammes.
+        Les couples (terme, candidat) de tous les termes sont évalués en un seul appel à process.cpdist,
+        qui ne calcule que ces scores (contrairement à cdist sur l'union des candidats).
+        """
+        queries = [self._prepare(item) for item in items]
+        candidate_ids = [self.index.candidates(key, self.candidate_limit) for key in self._index_keys(items)]
+        corrections = [Correction(item, None, 0.0, item) for item in items]
+
+        pair_queries, pair_choices = [], []
+        for query, ids in zip(queries, candidate_ids):
+            pair_queries.extend([query] * len(ids))
+            pair_choices.extend(self.normalized_choices[i] for i in ids)
+        if not pair_queries:
+            return corrections
+
+        scores = process.cpdist(pair_queries, pair_choices, scorer=self.scorer, dtype=np.float32, workers=workers)
+
+        # Les scores de chaque terme se suivent, dans l'ordre des candidats de l'index
+        start = 0
+        for position, ids in enumerate(candidate_ids):
+            if len(ids) == 0:
+                continue
+            candidate_scores = scores[start:start + len(ids)]
+            start += len(ids)
+            best = int(candidate_scores.argmax())
+            score = float(candidate_scores[best])
+            match = self.choices[ids[best]]
+            item = items[position]
+            corrections[position] = Correction(item, match, score, match if score > self.threshold else item)
+        return corrections
@@ -72,6 +72,12 @@ import importlib.util  # Utilitaires pour charger dynamiquement des modules Pyth
 import contextlib      # Contexte managers utilitaires (suppression d'exceptions, redirections)
 import io              # Manipulation de flux en mémoire (StringIO, BytesIO)
 
+# Registre des modèles : chargement paresseux et pré-chargement en arrière-plan
+from Model_registry import prewarm
+
+# Client léger du service d'analyse local (modèles gardés en mémoire entre deux analyses)
+from Daemon_cv_classifier import daemon_available, submit_job
+
 
 
 
@@ -94,7 +100,12 @@ class ProcessCVThread(QThread):
 
     def run(self):
         try:
-            # 1) Chargement dynamique de /var/lib/cv-classifier/main.py
+            # 1) Si le service d'analyse local est actif, il traite le dossier avec ses modèles déjà chargés
+            if daemon_available():
+                self.run_with_daemon()
+                return
+
+            # 2) Sinon, chargement dynamique de /var/lib/cv-classifier/main.py
             spec = importlib.util.spec_from_file_location(
                 "cv_classifier_main", "/var/lib/cv-classifier/main.py"
             )
@@ -105,7 +116,7 @@ class ProcessCVThread(QThread):
                 self.output_line.emit("Erreur : process_cv_folder() introuvable.")
                 return
 
-            # 2) Capture des sorties stdout/stderr
+            # 3) Capture des sorties stdout/stderr
             line_count = 0
 
             class _Emitter(io.StringIO):
@@ -128,6 +139,22 @@ class ProcessCVThread(QThread):
             self.progress.emit(100)
             self.command_done.emit()
 
+    def run_with_daemon(self):
+        # Les lignes de sortie de l'analyse sont renvoyées par le service au fil de l'eau
+        line_count = 0
+
+        def _emit(line):
+            nonlocal line_count
+            self.output_line.emit(line)
+            line_count += 1
+            if line_count % 5 == 0:
+                self.progress.emit(min(100, line_count))
+
+        self.output_line.emit("Analyse confiée au service local (modèles déjà chargés).")
+        result = submit_job(self.folder_path, on_line=_emit)
+        if not result.get("ok"):
+            self.output_line.emit(f"Erreur d’exécution : {result.get('error')}")
+
 
 
 # ************************************************************************** # 
@@ -795,7 +822,12 @@ if __name__ == "__main__":
     window = MainWidget()
     window.showMaximized()
 
-    # 5) Démarrage de la boucle d'exécution de l'application
+    # 5) Pré-chargement des modèles en arrière-plan, seulement si le service d'analyse local
+    #    n'est pas actif : sinon le service traite les dossiers avec ses propres modèles
+    if not daemon_available():
+        prewarm(background=True)
+
+    # 6) Démarrage de la boucle d'exécution de l'application
     sys.exit(app.exec())
 
 
@@ -0,0 +1,236 @@
+# /**************************************************************************************************************************************************************************************
+# Nom du fichier : Gazetteer.py
+# Rôle du fichier : Ce fichier compile des dictionnaires de termes (compétences, diplômes, langues, libellés ESCO...) en un automate d'Aho-Corasick qui trouve toutes leurs occurrences dans un texte normalisé en un seul parcours.
+
+# Auteur : Maxime BRONNY
+# Version : V1
+# Licence : Réalisé dans le cadre des cours "Fouille de données, Ingéniérie des langues, Développement logiciel libre, IA & Apprentisage" L3 INFORMATIQUE IED
+# Usage : Un paquetage a été mit en place pour l'utiliser veuillez utiliser dans un système debian la commande suivante :
+#           - INSTALLATION DU PAQUET GÉNÉRÉ
+#               - sudo apt install ./cv-classifier_1.0-1_all.deb
+
+#           Puis exécute ton programme avec :
+#               - cv-classifier
+# ***************************************************************************************************************************************************************************************/
+
+
+
+# *********************************************************** # 
+# --- LIBRAIRIES UTILISÉES POUR LA RECHERCHE MULTI-MOTIFS --- # 
+# *********************************************************** # 
+
+
+
+from collections import deque, namedtuple
+
+# --- Normalisation (suppression des accents), identique à main.normalize ---
+from unidecode import unidecode
+
+# --- Automate compilé en C (pyahocorasick), facultatif : à défaut l'automate Python ci-dessous est utilisé ---
+try:
+    import ahocorasick
+except ImportError:
+    ahocorasick = None
+
+
+
+# Occurrence d'un terme du dictionnaire dans le texte d'origine
+#   - term     : terme du dictionnaire (forme d'origine)
+#   - category : catégorie du terme ("COMPETENCE", "DIPLOME"...)
+#   - start/end: position de l'occurrence dans le texte d'origine
+#   - text     : texte de l'occurrence tel qu'il apparaît dans le CV
+GazetteerMatch = namedtuple("GazetteerMatch", ["term", "category", "start", "end", "text"])
+
+
+
+# ******************************************************* # 
+# --- NORMALISATION AVEC CORRESPONDANCE DES POSITIONS --- # 
+# ******************************************************* # 
+
+
+
+def normalize_with_offsets(text):
+    """
+    Normalise 'text' comme main.normalize (accents supprimés, minuscules, "-" et "_" remplacés
+    par des espaces, espaces consécutifs réduits) et retourne aussi, pour chaque caractère du
+    texte normalisé, sa position dans le texte d'origine.
+
+    :return: Tuple (texte normalisé, liste des positions d'origine)
+    """
+    characters, offsets = [], []
+    for position, character in enumerate(text):
+        converted = character.lower() if character.isascii() else unidecode(character).lower()
+        for converted_character in converted:
+            if converted_character in "-_" or converted_character.isspace():
+                # Espaces de début et espaces consécutifs supprimés
+                if not characters or characters[-1] == " ":
+                    continue
+                converted_character = " "
+            characters.append(converted_character)
+            offsets.append(position)
+
+    if characters and characters[-1] == " ":
+        characters.pop()
+        offsets.pop()
+    return "".join(characters), offsets
+
+
+
+# ******************************* # 
+# --- AUTOMATE D'AHO-CORASICK --- # 
+# ******************************* # 
+
+
+
+class _PythonAutomaton:
+    """
+    Automate d'Aho-Corasick en Python : arbre des préfixes des termes, liens d'échec calculés
+    par un parcours en largeur, puis un seul passage sur le texte quel que soit le nombre de termes.
+    """
+
+    def __init__(self, words):
+        self.goto = [{}]       # transitions de chaque état
+        self.fail = [0]        # lien d'échec de chaque état
+        self.output = [[]]     # mots reconnus en atteignant chaque état
+
+        for word in words:
+            state = 0
+            for character in word:
+                next_state = self.goto[state].get(character)
+                if next_state is None:
+                    next_state = len(self.goto)
+                    self.goto[state][character] = next_state
+                    self.goto.append({})
+                    self.fail.append(0)
+                    self.output.append([])
+                state = next_state
+            self.output[state].append(word)
+
+        queue = deque(self.goto[0].values())
+        while queue:
+            state = queue.popleft()
+            for character, child in self.goto[state].items():
+                queue.append(child)
+                fallback = self.fail[state]
+                while fallback and character not in self.goto[fallback]:
+                    fallback = self.fail[fallback]
+                self.fail[child] = self.goto[fallback].get(character, 0)
+                self.output[child] = self.output[child] + self.output[self.fail[child]]
+
+    def iter(self, text):
+        """
+        Itère sur les (début, fin, mot) de toutes les occurrences, chevauchements compris.
+        """
+        state = 0
+        for position, character in enumerate(text):
+            while state and character not in self.goto[state]:
+                state = self.fail[state]
+            state = self.goto[state].get(character, 0)
+            for word in self.output[state]:
+                yield position + 1 - len(word), position + 1, word
+
+
+
+class _CAutomaton:
+    """
+    Même interface que _PythonAutomaton, avec l'automate compilé de pyahocorasick.
+    """
+
+    def __init__(self, words):
+        self.automaton = ahocorasick.Automaton()
+        for word in words:
+            self.automaton.add_word(word, word)
+        self.automaton.make_automaton()
+        self.empty = not words
+
+    def iter(self, text):
+        if self.empty:
+            return
+        for last, word in self.automaton.iter(text):
+            yield last + 1 - len(word), last + 1, word
+
+
+
+# ************************************** # 
+# --- DICTIONNAIRE DE TERMES COMPILÉ --- # 
+# ************************************** # 
+
+
+
+class Gazetteer:
+    """
+    Dictionnaire de termes classés par catégorie, compilé en un automate sur leur forme normalisée.
+
+    La recherche se fait sur le texte normalisé (insensible à la casse et aux accents) et les
+    occurrences sont rapportées aux positions du texte d'origine.
+    """
+
+    def __init__(self, entries, whole_words=True):
+        """
+        :param entries: Couples (terme, catégorie)
+        :param whole_words: N'accepte que les occurrences délimitées par des caractères non alphanumériques
+        """
+        self.whole_words = whole_words
+        self.terms_by_word = {}   # { terme normalisé : [(terme, catégorie), ...] }
+        for term, category in entries:
+            word = normalize_with_offsets(term)[0]
+            if word:
+                self.terms_by_word.setdefault(word, [])
+                if (term, category) not in self.terms_by_word[word]:
+                    self.terms_by_word[word].append((term, category))
+
+        automaton_class = _CAutomaton if ahocorasick is not None else _PythonAutomaton
+        self.automaton = automaton_class(sorted(self.terms_by_word))
+
+    @classmethod
+    def from_categories(cls, categories, whole_words=True):
+        """
+        Construit le dictionnaire à partir de { catégorie : termes }.
+        """
+        return cls(((term, category) for category, terms in categories.items() for term in terms), whole_words)
+
+    def _is_whole_word(self, normalized_text, start, end):
+        if start > 0 and normalized_text[start].isalnum() and normalized_text[start - 1].isalnum():
+            return False
+        if end < len(normalized_text) and normalized_text[end - 1].isalnum() and normalized_text[end].isalnum():
+            return False
+        return True
+
+    def find_normalized(self, normalized_text, category=None):
+        """
+        Itère sur les (début, fin, terme, catégorie) trouvés dans un texte déjà normalisé.
+        """
+        for start, end, word in self.automaton.iter(normalized_text):
+            if self.whole_words and not self._is_whole_word(normalized_text, start, end):
+                continue
+            for term, term_category in self.terms_by_word[word]:
+                if category is None or term_category == category:
+                    yield start, end, term, term_category
+
+    def find(self, text, category=None):
+        """
+        Toutes les occurrences des termes (de 'category', ou de toutes les catégories) dans 'text'.
+        """
+        normalized_text, offsets = normalize_with_offsets(text)
+        matches = []
+        for start, end, term, term_category in self.find_normalized(normalized_text, category):
+            original_start, original_end = offsets[start], offsets[end - 1] + 1
+            matches.append(GazetteerMatch(term, term_category, original_start, original_end, text[original_start:original_end]))
+        return matches
+
+    def terms(self, text, category=None):
+        """
+        Termes distincts trouvés dans 'text', dans leur ordre de première apparition.
+        """
+        normalized_text = normalize_with_offsets(text)[0]
+        found = {}
+        for _, _, term, _ in self.find_normalized(normalized_text, category):
+            found.setdefault(term, None)
+        return list(found)
+
+    def contains(self, text, category=None):
+        """
+        Indique si 'text' contient au moins un terme (de 'category', ou de toutes les catégories).
+        """
+        normalized_text = normalize_with_offsets(text)[0]
+        return next(self.find_normalized(normalized_text, category), None) is not None
@@ -0,0 +1,451 @@
+# /**************************************************************************************************************************************************************************************
+# Nom du fichier : Generate_cv_corpus.py
+# Rôle du fichier : Ce fichier génère autant de CV fictifs que voulu (texte et PDF) pour les tests de charge : sections, compétences et intitulés de postes sont tirés de data/cv_corpus.txt, data/Corpus_France_Travail.txt et des sorties ESCO, avec une longueur, un nombre de pages et un taux de fautes de frappe réglables.
+
+# Auteur : Maxime BRONNY
+# Version : V1
+# Licence : Réalisé dans le cadre des cours "Fouille de données, Ingéniérie des langues, Développement logiciel libre, IA & Apprentisage" L3 INFORMATIQUE IED
+# Usage : Un paquetage a été mit en place pour l'utiliser veuillez utiliser dans un système debian la commande suivante :
+#           - INSTALLATION DU PAQUET GÉNÉRÉ
+#               - sudo apt install ./cv-classifier_1.0-1_all.deb
+
+#           Puis exécute ton programme avec :
+#               - cv-classifier
+# ***************************************************************************************************************************************************************************************/
+
+
+
+# ************************************************************* # 
+# --- LIBRAIRIES UTILISÉES POUR LA GÉNÉRATION DE CV FICTIFS --- # 
+# ************************************************************* # 
+
+
+
+import os
+import csv
+import json
+import random
+import argparse
+import textwrap
+import unicodedata
+import multiprocessing
+from pathlib import Path
+
+
+
+# ********************************************** # 
+# --- SOURCES ET PARAMÈTRES DE LA GÉNÉRATION --- # 
+# ********************************************** # 
+
+
+
+BASE_DIR = Path(__file__).resolve().parent
+
+# Phrases d'expériences par domaine ("phrase|domaine", sections "# domaine")
+CV_CORPUS_PATH = BASE_DIR / "data/cv_corpus.txt"
+
+# Compétences des offres France Travail par domaine ("compétence|domaine")
+FRANCE_TRAVAIL_PATH = BASE_DIR / "data/Corpus_France_Travail.txt"
+
+# Outils et technologies ESCO ("terme|catégorie") et métiers ESCO associés à une catégorie
+ESCO_SKILLS_PATH = BASE_DIR / "ESCO/esco_outputs/ESCO_IT_Pair.csv"
+ESCO_JOBS_PATH   = BASE_DIR / "ESCO/esco_outputs/esco_jobs_to_skills.csv"
+
+# Dossier des CV générés par défaut
+DEFAULT_OUTPUT_DIR = BASE_DIR / "Banque_CV/CV_synthetiques"
+
+# Catégories ESCO correspondant à chaque domaine du corpus
+ESCO_CATEGORIES_BY_DOMAIN = {
+    "Développement Web":         ("Software",),
+    "DevOps":                    ("DevOps", "Software"),
+    "Cybersécurité":             ("Security",),
+    "Réseaux":                   ("Network",),
+    "Administration Système":    ("Network", "DevOps"),
+    "Intelligence Artificielle": ("AI/ML",),
+    "Data Science":              ("Data", "AI/ML"),
+    "Testing et QA":             ("QA/Test",),
+    "Gestion de Projet":         ("Software",),
+    "Blockchain":                ("Software",)
+}
+
+# Intitulés utilisés quand ESCO ne propose aucun métier pour un domaine
+DEFAULT_JOB_TITLES = ("Développeur", "Ingénieur", "Chef de projet", "Consultant", "Analyste", "Technicien", "Administrateur système")
+
+# Identités fictives (aucune donnée personnelle réelle)
+FIRST_NAMES = ("Alice", "Hugo", "Camille", "Lucas", "Léa", "Nathan", "Chloé", "Louis", "Manon", "Gabriel",
+               "Inès", "Jules", "Sarah", "Arthur", "Emma", "Paul", "Zoé", "Adam", "Julie", "Yanis")
+LAST_NAMES  = ("Martin", "Bernard", "Dubois", "Thomas", "Robert", "Richard", "Petit", "Durand", "Leroy", "Moreau",
+               "Simon", "Laurent", "Lefebvre", "Michel", "Garcia", "David", "Bertrand", "Roux", "Vincent", "Fournier")
+CITIES      = ("Paris", "Lyon", "Marseille", "Toulouse", "Nantes", "Bordeaux", "Lille", "Rennes", "Strasbourg",
+               "Montpellier", "Grenoble", "Nice")
+COMPANIES   = ("Technova", "DataSphere", "CloudWorks", "InfoSecure", "NetLogic", "Softeam Conseil", "Numeria",
+               "Webcraft", "Algora", "Cybelis", "Hexaflow", "Optimalis")
+SCHOOLS     = ("Université Paris Cité", "Université de Lyon", "Université de Bordeaux", "INSA Toulouse",
+               "Université de Lille", "IUT de Nantes", "Université Grenoble Alpes", "EPITA", "Université de Rennes")
+DEGREES     = ("Master", "Licence", "BTS", "DUT", "Doctorat", "Diplôme d'ingénieur", "Licence professionnelle")
+LANGUAGES   = ("Anglais", "Espagnol", "Allemand", "Italien", "Portugais", "Chinois", "Arabe")
+LEVELS      = ("A2", "B1", "B2", "C1", "C2", "courant", "intermédiaire", "bilingue", "débutant")
+INTERESTS   = ("Course à pied", "Photographie", "Échecs", "Bénévolat associatif", "Musique", "Randonnée",
+               "Lecture", "Cuisine", "Robotique", "Jeux de société")
+
+# Mise en page des PDF (A4, police Helvetica 10 pt)
+PAGE_WIDTH, PAGE_HEIGHT = 595, 842
+MARGIN       = 50
+FONT_SIZE    = 10
+LINE_HEIGHT  = 13
+WRAP_WIDTH   = 95
+LINES_PER_PAGE = (PAGE_HEIGHT - 2 * MARGIN) // LINE_HEIGHT
+
+
+
+# ****************************** # 
+# --- CHARGEMENT DES SOURCES --- # 
+# ****************************** # 
+
+
+
+def _read_pairs(path, separator="|"):
+    """
+    Lit un fichier "texte|domaine" et retourne { domaine : [textes distincts] } (commentaires et lignes vides ignorés).
+    """
+    by_domain = {}
+    if not os.path.exists(path):
+        return by_domain
+    with open(path, "r", encoding="utf-8") as file:
+        for line in file:
+            line = line.strip()
+            if not line or line.startswith("#") or separator not in line:
+                continue
+            text, domain = (part.strip() for part in line.rsplit(separator, 1))
+            if text and domain:
+                by_domain.setdefault(domain, {})[text] = None
+    return {domain: list(texts) for domain, texts in by_domain.items()}
+
+
+
+def _read_esco_jobs(path):
+    """
+    Métiers ESCO par catégorie : { catégorie : [intitulés] } (forme masculine du libellé "masculin/féminin").
+    """
+    by_category = {}
+    if not os.path.exists(path):
+        return by_category
+    with open(path, "r", encoding="utf-8", newline="") as file:
+        for row in csv.DictReader(file):
+            title = row["occupationLabel"].split("/")[0].strip()
+            if title:
+                by_category.setdefault(row["label"], {})[title[0].upper() + title[1:]] = None
+    return {category: list(titles) for category, titles in by_category.items()}
+
+
+
+def load_sources():
+    """
+    Charge les sources de la génération, par domaine :
+      - experiences : phrases d'expériences (cv_corpus.txt)
+      - skills      : compétences (Corpus_France_Travail.txt)
+      - tools       : outils et technologies (ESCO)
+      - titles      : intitulés de postes (métiers ESCO)
+    """
+    experiences = _read_pairs(CV_CORPUS_PATH)
+    skills      = _read_pairs(FRANCE_TRAVAIL_PATH)
+    esco_tools  = _read_pairs(ESCO_SKILLS_PATH)
+    esco_jobs   = _read_esco_jobs(ESCO_JOBS_PATH)
+
+    sources = {}
+    for domain, sentences in sorted(experiences.items()):
+        categories = ESCO_CATEGORIES_BY_DOMAIN.get(domain, ("Software",))
+        sources[domain] = {
+            "experiences": sentences,
+            "skills":      skills.get(domain) or sentences,
+            "tools":       [tool for category in categories for tool in esco_tools.get(category, [])],
+            "titles":      [title for category in categories for title in esco_jobs.get(category, [])] or list(DEFAULT_JOB_TITLES)
+        }
+    if not sources:
+        raise SystemExit(f"Aucune phrase d'expérience trouvée dans {CV_CORPUS_PATH}")
+    return sources
+
+
+
+# ******************************** # 
+# --- BRUIT : FAUTES DE FRAPPE --- # 
+# ******************************** # 
+
+
+
+def add_typo(word, rng):
+    """
+    Ajoute une faute de frappe à 'word' : inversion, suppression, doublement ou remplacement d'une lettre.
+    """
+    if len(word) < 4:
+        return word
+    position = rng.randrange(1, len(word) - 1)
+    kind = rng.randrange(4)
+    if kind == 0:
+        return word[:position] + word[position + 1] + word[position] + word[position + 2:]
+    if kind == 1:
+        return word[:position] + word[position + 1:]
+    if kind == 2:
+        return word[:position] + word[position] + word[position:]
+    return word[:position] + rng.choice("abcdefghijklmnopqrstuvwxyz") + word[position + 1:]
+
+
+
+def add_noise(text, typo_rate, rng):
+    """
+    Applique une faute de frappe à chaque mot de 'text' avec la probabilité 'typo_rate'.
+    """
+    if typo_rate <= 0:
+        return text
+    return " ".join(add_typo(word, rng) if rng.random() < typo_rate else word for word in text.split(" "))
+
+
+
+# ************************** # 
+# --- GÉNÉRATION D'UN CV --- # 
+# ************************** # 
+
+
+
+# Caractères hors Latin-1 fréquents dans les sources, que la police Helvetica des PDF ne contient pas
+LATIN1_REPLACEMENTS = str.maketrans({"’": "'", "‘": "'", "œ": "oe", "Œ": "OE", "–": "-", "—": "-", "“": '"', "”": '"', "…": "..."})
+
+
+
+def _to_latin1(text):
+    text = text.translate(LATIN1_REPLACEMENTS)
+    if all(ord(character) < 256 for character in text):
+        return text
+    # Autres caractères : forme sans accent, ou supprimés
+    return "".join(
+        character if ord(character) < 256
+        else unicodedata.normalize("NFKD", character).encode("ascii", "ignore").decode("ascii")
+        for character in text
+    )
+
+
+
+def _wrap(lines):
+    """
+    Découpe les lignes trop longues pour la largeur d'une page (texte ramené au jeu Latin-1 des PDF).
+    """
+    wrapped = []
+    for line in lines:
+        wrapped.extend(textwrap.wrap(_to_latin1(line), WRAP_WIDTH, subsequent_indent="  ") or [""])
+    return wrapped
+
+
+
+def _slug(text):
+    ascii_text = unicodedata.normalize("NFKD", text).encode("ascii", "ignore").decode("ascii")
+    return "".join(character if character.isalnum() else "_" for character in ascii_text).strip("_")
+
+
+
+def generate_cv(index, sources, seed=0, pages=(1, 2), typo_rate=0.0, domains=None):
+    """
+    Génère le CV fictif numéro 'index'. Le même (seed, index) produit toujours le même CV :
+    la génération peut être répartie entre plusieurs processus sans changer le corpus.
+
+    :param sources: Sources chargées par load_sources()
+    :param pages: Nombre de pages (minimum, maximum) visé
+    :param typo_rate: Probabilité d'une faute de frappe par mot dans les expériences et compétences
+    :param domains: Domaines tirés au sort (tous les domaines des sources par défaut)
+    :return: Dictionnaire { "name", "domain", "pages", "lines", "titles", "skills" }
+    """
+    rng = random.Random(f"{seed}-{index}")
+    domain = rng.choice(sorted(domains or sources))
+    source = sources[domain]
+    target_pages = rng.randint(*pages)
+    # Le texte occupe au moins un tiers de la dernière page et ne la dépasse pas
+    target_lines = rng.randint((target_pages - 1) * LINES_PER_PAGE + LINES_PER_PAGE // 3, target_pages * LINES_PER_PAGE)
+
+    first_name, last_name = rng.choice(FIRST_NAMES), rng.choice(LAST_NAMES)
+    city = rng.choice(CITIES)
+    phone = "0" + str(rng.randint(6, 7)) + "".join(f" {rng.randint(0, 99):02d}" for _ in range(4))
+
+    # --- En-tête et identité ---
+    header = [
+        f"{first_name} {last_name}",
+        f"Email : {_slug(first_name).lower()}.{_slug(last_name).lower()}{index}@example.com",
+        f"Téléphone : {phone}",
+        f"Localisation : {city}, France",
+        ""
+    ]
+
+    # --- Formation ---
+    education = ["FORMATION", ""]
+    year = rng.randint(2005, 2022)
+    for _ in range(rng.randint(1, 3)):
+        degree = f"{rng.choice(DEGREES)} {domain}"
+        education.append(f"Formation : {degree} - {rng.choice(SCHOOLS)} ({year - 2} - {year})")
+        year -= rng.randint(2, 3)
+    education.append("")
+
+    # --- Compétences ---
+    skills = rng.sample(source["skills"], min(len(source["skills"]), rng.randint(6, 14)))
+    tools = rng.sample(source["tools"], min(len(source["tools"]), rng.randint(4, 10)))
+    competences = ["COMPÉTENCES", ""]
+    competences += [f"- {add_noise(skill, typo_rate, rng)}" for skill in skills]
+    if tools:
+        competences.append("Outils : " + ", ".join(add_noise(tool, typo_rate, rng) for tool in tools))
+    competences.append("")
+
+    # --- Langues ---
+    languages = ["LANGUES", "", "Français : Langue maternelle"]
+    languages += [f"{language} : {rng.choice(LEVELS)}" for language in rng.sample(LANGUAGES, rng.randint(1, 3))]
+    languages.append("")
+
+    interests = ["CENTRES D'INTÉRÊT", "", ", ".join(rng.sample(INTERESTS, 3))]
+
+    # --- Expériences : ajoutées jusqu'à atteindre la longueur visée ---
+    fixed_lines = len(_wrap(header + education + competences + languages + interests)) + 2
+    experiences, titles = ["EXPÉRIENCE PROFESSIONNELLE", ""], []
+    end_year = 2025
+    while len(_wrap(experiences)) + fixed_lines < target_lines:
+        title = rng.choice(source["titles"])
+        titles.append(title)
+        start_year = end_year - rng.randint(1, 4)
+        experiences.append(f"{add_noise(title, typo_rate, rng)} - {rng.choice(COMPANIES)}, {rng.choice(CITIES)} ({start_year} - {end_year})")
+        for sentence in rng.sample(source["experiences"], min(len(source["experiences"]), rng.randint(2, 5))):
+            experiences.append(f"- {add_noise(sentence, typo_rate, rng)}")
+        experiences.append("")
+        end_year = start_year
+
+    lines = _wrap(header + experiences + education + competences + languages + interests)[:target_pages * LINES_PER_PAGE]
+    return {
+        "name":   f"CV_SYNTH_{index:06d}_{_slug(domain)}",
+        "domain": domain,
+        "pages":  -(-len(lines) // LINES_PER_PAGE),
+        "lines":  lines,
+        "titles": titles,
+        "skills": skills + tools
+    }
+
+
+
+# ************************************** # 
+# --- ÉCRITURE DES CV (TEXTE ET PDF) --- # 
+# ************************************** # 
+
+
+
+def write_pdf(lines, path):
+    """
+    Écrit 'lines' dans un PDF A4 (LINES_PER_PAGE lignes par page) avec PyMuPDF.
+    """
+    import fitz   # PyMuPDF, importé seulement pour la sortie PDF
+
+    document = fitz.open()
+    for start in range(0, max(len(lines), 1), LINES_PER_PAGE):
+        page = document.new_page(width=PAGE_WIDTH, height=PAGE_HEIGHT)
+        y = MARGIN + FONT_SIZE
+        for line in lines[start:start + LINES_PER_PAGE]:
+            if line:
+                page.insert_text((MARGIN, y), line, fontsize=FONT_SIZE, fontname="helv")
+            y += LINE_HEIGHT
+    document.save(path, garbage=3, deflate=True)
+    document.close()
+
+
+
+# Sources et paramètres partagés par les processus de génération
+_worker_state = {}
+
+
+
+def _init_generator(sources, output_dir, formats, seed, pages, typo_rate, domains):
+    _worker_state.update(sources=sources, output_dir=output_dir, formats=formats, seed=seed,
+                         pages=pages, typo_rate=typo_rate, domains=domains)
+
+
+
+def _generate_and_write(index):
+    state = _worker_state
+    cv = generate_cv(index, state["sources"], state["seed"], state["pages"], state["typo_rate"], state["domains"])
+    base_path = os.path.join(state["output_dir"], cv["name"])
+    if "txt" in state["formats"]:
+        with open(base_path + ".txt", "w", encoding="utf-8") as file:
+            file.write("\n".join(cv["lines"]) + "\n")
+    if "pdf" in state["formats"]:
+        write_pdf(cv["lines"], base_path + ".pdf")
+    # Le manifeste décrit chaque CV sans en recopier le texte
+    return {key: value for key, value in cv.items() if key != "lines"}
+
+
+
+def generate_corpus(count, output_dir=DEFAULT_OUTPUT_DIR, formats=("pdf",), seed=0, pages=(1, 2), typo_rate=0.0,
+                    domains=None, start=0, jobs=1):
+    """
+    Génère 'count' CV fictifs dans 'output_dir' et un manifeste manifest.jsonl (domaine, pages,
+    intitulés et compétences tirés pour chaque CV).
+
+    :param formats: Formats écrits ("txt", "pdf")
+    :param start: Numéro du premier CV (pour compléter un corpus existant sans écraser ses fichiers)
+    :param jobs: Nombre de processus de génération
+    """
+    sources = load_sources()
+    unknown = set(domains or ()) - set(sources)
+    if unknown:
+        raise SystemExit(f"Domaines inconnus : {', '.join(sorted(unknown))} (disponibles : {', '.join(sources)})")
+
+    os.makedirs(output_dir, exist_ok=True)
+    initargs = (sources, str(output_dir), tuple(formats), seed, tuple(pages), typo_rate, domains)
+    indexes = range(start, start + count)
+
+    with open(os.path.join(output_dir, "manifest.jsonl"), "a", encoding="utf-8") as manifest:
+        if jobs > 1:
+            with multiprocessing.Pool(jobs, initializer=_init_generator, initargs=initargs) as pool:
+                entries = pool.imap(_generate_and_write, indexes, chunksize=64)
+                for done, entry in enumerate(entries, 1):
+                    manifest.write(json.dumps(entry, ensure_ascii=False) + "\n")
+                    if done % 1000 == 0:
+                        print(f"{done} / {count} CV générés")
+        else:
+            _init_generator(*initargs)
+            for done, index in enumerate(indexes, 1):
+                manifest.write(json.dumps(_generate_and_write(index), ensure_ascii=False) + "\n")
+                if done % 1000 == 0:
+                    print(f"{done} / {count} CV générés")
+
+    print(f"{count} CV générés dans {output_dir}")
+
+
+
+# ************************************************************** # 
+# --- POINT D'ENTRÉE DU SCRIPT SI IL EST EXÉCUTÉ DIRECTEMENT --- # 
+# ************************************************************** # 
+
+def _page_range(value):
+    low, _, high = value.partition("-")
+    low, high = int(low), int(high or low)
+    if not 1 <= low <= high:
+        raise argparse.ArgumentTypeError("format attendu : N ou MIN-MAX avec 1 <= MIN <= MAX")
+    return low, high
+
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Génère des CV fictifs (texte et PDF) pour les tests de charge.")
+    parser.add_argument("count", type=int, help="Nombre de CV à générer")
+    parser.add_argument("--output", default=str(DEFAULT_OUTPUT_DIR), help="Dossier des CV générés")
+    parser.add_argument("--format", choices=("pdf", "txt", "both"), default="pdf", help="Format des CV générés")
+    parser.add_argument("--pages", type=_page_range, default=(1, 2), help="Nombre de pages : N ou MIN-MAX (1-2 par défaut)")
+    parser.add_argument("--typo-rate", type=float, default=0.0, help="Probabilité d'une faute de frappe par mot (expériences et compétences)")
+    parser.add_argument("--domains", nargs="+", help="Domaines tirés au sort (tous par défaut)")
+    parser.add_argument("--seed", type=int, default=0, help="Graine : la même graine produit le même corpus")
+    parser.add_argument("--start", type=int, default=0, help="Numéro du premier CV")
+    parser.add_argument("--jobs", type=int, default=1, help="Nombre de processus de génération")
+    args = parser.parse_args()
+
+    generate_corpus(
+        args.count,
+        output_dir=args.output,
+        formats=("pdf", "txt") if args.format == "both" else (args.format,),
+        seed=args.seed,
+        pages=args.pages,
+        typo_rate=args.typo_rate,
+        domains=args.domains,
+        start=args.start,
+        jobs=args.jobs
+    )
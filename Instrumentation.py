@@ -0,0 +1,192 @@
+# /**************************************************************************************************************************************************************************************
+# Nom du fichier : Instrumentation.py
+# Rôle du fichier : Ce fichier mesure chaque étape de l'analyse d'un CV (temps réel et temps CPU, nombre d'éléments en entrée et en sortie), remplace les affichages de contrôle par une trace détaillée optionnelle et enregistre une trace JSONL par CV.
+
+# Auteur : Maxime BRONNY
+# Version : V1
+# Licence : Réalisé dans le cadre des cours "Fouille de données, Ingéniérie des langues, Développement logiciel libre, IA & Apprentisage" L3 INFORMATIQUE IED
+# Usage : Un paquetage a été mit en place pour l'utiliser veuillez utiliser dans un système debian la commande suivante :
+#           - INSTALLATION DU PAQUET GÉNÉRÉ
+#               - sudo apt install ./cv-classifier_1.0-1_all.deb
+
+#           Puis exécute ton programme avec :
+#               - cv-classifier
+# ***************************************************************************************************************************************************************************************/
+
+
+
+# **************************************************************** # 
+# --- LIBRAIRIES UTILISÉES POUR L'INSTRUMENTATION DE L'ANALYSE --- # 
+# **************************************************************** # 
+
+
+
+import os            # Création du dossier du fichier de trace
+import json          # Enregistrements JSONL
+import time          # Horloges temps réel et temps CPU
+import contextlib    # Mesure d'une étape avec un bloc "with"
+
+
+
+# *********************************** # 
+# --- TRACE DÉTAILLÉE OPTIONNELLE --- # 
+# *********************************** # 
+
+
+
+# Affichage des résultats intermédiaires de chaque étape (désactivé par défaut)
+_verbose = False
+
+
+
+def set_verbose(enabled):
+    global _verbose
+    _verbose = bool(enabled)
+
+
+
+def is_verbose():
+    return _verbose
+
+
+
+# ******************************************* # 
+# --- MESURE DES ÉTAPES D'ANALYSE D'UN CV --- # 
+# ******************************************* # 
+
+
+
+class CVTrace:
+    """
+    Mesures de l'analyse d'un CV : une entrée par étape avec son temps réel ("wall_ms"),
+    son temps CPU ("cpu_ms", tous threads du processus) et, si renseignés, le nombre
+    d'éléments reçus ("in") et produits ("out"). Si l'analyse du CV échoue, 'error' reçoit
+    l'étape en échec et le message de l'erreur.
+    """
+
+    def __init__(self, name):
+        self.name = name
+        self.timestamp = time.time()
+        self.stages = []
+        self.error = None
+
+    @contextlib.contextmanager
+    def stage(self, name, count_in=None):
+        """
+        Mesure le bloc "with" comme l'étape 'name'. Le dictionnaire retourné peut être complété
+        (ex : record["out"] = len(resultat)) avant la fin du bloc.
+        """
+        record = {"stage": name}
+        if count_in is not None:
+            record["in"] = count_in
+        wall_start, cpu_start = time.perf_counter(), time.process_time()
+        try:
+            yield record
+        finally:
+            record["wall_ms"] = (time.perf_counter() - wall_start) * 1000
+            record["cpu_ms"] = (time.process_time() - cpu_start) * 1000
+            self.stages.append(record)
+
+    def add_stage(self, name, wall_seconds, cpu_seconds, **fields):
+        """
+        Ajoute une étape mesurée ailleurs (ex : part d'une annotation NER faite pour tout un lot).
+        """
+        self.stages.append({"stage": name, **fields, "wall_ms": wall_seconds * 1000, "cpu_ms": cpu_seconds * 1000})
+
+    def log(self, label, value=None):
+        """
+        Affiche un résultat intermédiaire si la trace détaillée est activée.
+        """
+        if _verbose:
+            print(label if value is None else f"{label} : {value}")
+
+    def to_record(self):
+        record = {
+            "cv": self.name,
+            "timestamp": self.timestamp,
+            "total_wall_ms": sum(stage["wall_ms"] for stage in self.stages),
+            "total_cpu_ms": sum(stage["cpu_ms"] for stage in self.stages),
+            "stages": self.stages
+        }
+        if self.error is not None:
+            record["error"] = self.error
+        return record
+
+
+
+@contextlib.contextmanager
+def measure_batch():
+    """
+    Mesure une opération faite pour tout un lot ; le dictionnaire retourné reçoit
+    "wall" et "cpu" (en secondes) à la fin du bloc, pour être réparti entre les CV.
+    """
+    measures = {}
+    wall_start, cpu_start = time.perf_counter(), time.process_time()
+    try:
+        yield measures
+    finally:
+        measures["wall"] = time.perf_counter() - wall_start
+        measures["cpu"] = time.process_time() - cpu_start
+
+
+
+def share_batch_stage(traces, name, measures, weights):
+    """
+    Répartit une étape mesurée pour tout un lot entre les traces des CV, au prorata de 'weights'
+    (ex : nombre de phrases de chaque CV).
+    """
+    total = sum(weights) or 1
+    for trace, weight in zip(traces, weights):
+        share = weight / total
+        trace.add_stage(name, measures["wall"] * share, measures["cpu"] * share, **{"in": weight, "batch_size": len(traces)})
+
+
+
+# ********************************************* # 
+# --- ENREGISTREMENT ET SYNTHÈSE DES TRACES --- # 
+# ********************************************* # 
+
+
+
+def write_trace_records(path, records):
+    """
+    Ajoute les enregistrements 'records' (un par CV) au fichier JSONL 'path'.
+    """
+    if not records:
+        return
+    directory = os.path.dirname(os.path.abspath(path))
+    os.makedirs(directory, exist_ok=True)
+    with open(path, "a", encoding="utf-8") as file:
+        for record in records:
+            file.write(json.dumps(record, ensure_ascii=False) + "\n")
+
+
+
+def summarize_stages(records):
+    """
+    Cumule les mesures de chaque étape sur tous les CV : { étape : {"count", "wall_ms", "cpu_ms"} }.
+    """
+    summary = {}
+    for record in records:
+        for stage in record["stages"]:
+            totals = summary.setdefault(stage["stage"], {"count": 0, "wall_ms": 0.0, "cpu_ms": 0.0})
+            totals["count"] += 1
+            totals["wall_ms"] += stage["wall_ms"]
+            totals["cpu_ms"] += stage["cpu_ms"]
+    return summary
+
+
+
+def print_stage_summary(records):
+    """
+    Affiche le temps passé dans chaque étape, de la plus coûteuse à la moins coûteuse.
+    """
+    summary = summarize_stages(records)
+    total_wall = sum(totals["wall_ms"] for totals in summary.values()) or 1
+
+    print(f"\nTemps par étape ({len(records)} CV) :\n")
+    print(f"  {'étape':<32}{'total (ms)':>12}{'CPU (ms)':>12}{'moy./CV (ms)':>14}{'part':>8}")
+    for name, totals in sorted(summary.items(), key=lambda item: -item[1]["wall_ms"]):
+        print(f"  {name:<32}{totals['wall_ms']:>12.1f}{totals['cpu_ms']:>12.1f}"
+              f"{totals['wall_ms'] / totals['count']:>14.1f}{totals['wall_ms'] / total_wall:>8.1%}")
+    print()
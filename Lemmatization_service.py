@@ -0,0 +1,133 @@
+# /**************************************************************************************************************************************************************************************
+# Nom du fichier : Lemmatization_service.py
+# Rôle du fichier : Ce fichier fournit le service de lemmatisation partagé par le post-traitement des CV et le scraper : traitement par lots avec nlp.pipe (analyse syntaxique et NER désactivées) et cache LRU borné des lemmes déjà calculés.
+
+# Auteur : Maxime BRONNY
+# Version : V1
+# Licence : Réalisé dans le cadre des cours "Fouille de données, Ingéniérie des langues, Développement logiciel libre, IA & Apprentisage" L3 INFORMATIQUE IED
+# Usage : Un paquetage a été mit en place pour l'utiliser veuillez utiliser dans un système debian la commande suivante :
+#           - INSTALLATION DU PAQUET GÉNÉRÉ
+#               - sudo apt install ./cv-classifier_1.0-1_all.deb
+
+#           Puis exécute ton programme avec :
+#               - cv-classifier
+# ***************************************************************************************************************************************************************************************/
+
+
+
+# ************************************************************* # 
+# --- LIBRAIRIES UTILISÉES POUR LE SERVICE DE LEMMATISATION --- # 
+# ************************************************************* # 
+
+
+
+import threading                      # Accès concurrent au cache (service d'analyse multi-thread)
+from collections import OrderedDict   # Cache LRU : ordre d'utilisation des entrées
+
+# --- Modèles spaCy partagés (chargés une seule fois par processus) et profils de composants ---
+from Model_registry import SPACY_SMALL_MODEL
+from Nlp_resources import pipe, LEMMATIZE_PROFILE
+
+
+
+# ********************************************** # 
+# --- PARAMÈTRES DU SERVICE DE LEMMATISATION --- # 
+# ********************************************** # 
+
+
+
+# Nombre maximal d'expressions gardées en cache (les moins récemment utilisées sont oubliées)
+DEFAULT_CACHE_SIZE = 50000
+
+# Nombre de textes traités ensemble par nlp.pipe
+DEFAULT_PIPE_BATCH_SIZE = 256
+
+
+
+# ******************************** # 
+# --- SERVICE DE LEMMATISATION --- # 
+# ******************************** # 
+
+
+
+class LemmatizationService:
+    """
+    Lemmatise des expressions par lots et garde les résultats dans un cache LRU borné :
+    les mêmes compétences reviennent d'un CV à l'autre et ne sont lemmatisées qu'une fois.
+    """
+
+    def __init__(self, model_name=SPACY_SMALL_MODEL, cache_size=DEFAULT_CACHE_SIZE, batch_size=DEFAULT_PIPE_BATCH_SIZE):
+        self.model_name = model_name
+        self.cache_size = cache_size
+        self.batch_size = batch_size
+        self._cache = OrderedDict()   # { (texte, sans mots vides, sans ponctuation) : lemmes }
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def _lemmatize_docs(self, texts, drop_stopwords, drop_punct):
+        # Profil "lemmatize" : le lemmatiseur n'a besoin que des étiquettes morphologiques
+        results = []
+        for doc in pipe(texts, LEMMATIZE_PROFILE, self.model_name, self.batch_size):
+            results.append(" ".join(
+                token.lemma_ for token in doc
+                if not (drop_stopwords and token.is_stop) and not (drop_punct and token.is_punct)
+            ))
+        return results
+
+    def lemmatize_many(self, texts, drop_stopwords=False, drop_punct=False):
+        """
+        Retourne les lemmes (joints par des espaces) de chaque texte de 'texts', dans le même ordre.
+        Seuls les textes absents du cache passent par le modèle, en un seul appel à nlp.pipe.
+
+        :param drop_stopwords: Retire les mots vides
+        :param drop_punct: Retire la ponctuation
+        """
+        texts = list(texts)
+        keys = [(text, drop_stopwords, drop_punct) for text in texts]
+        lemmas = {}
+
+        with self._lock:
+            for key in keys:
+                if key in self._cache:
+                    self._cache.move_to_end(key)
+                    lemmas[key] = self._cache[key]
+                    self.hits += 1
+            missing = list(dict.fromkeys(key for key in keys if key not in lemmas))
+            self.misses += len(missing)
+
+        if missing:
+            computed = self._lemmatize_docs([key[0] for key in missing], drop_stopwords, drop_punct)
+            with self._lock:
+                for key, lemma in zip(missing, computed):
+                    lemmas[key] = lemma
+                    self._cache[key] = lemma
+                while len(self._cache) > self.cache_size:
+                    self._cache.popitem(last=False)
+
+        return [lemmas[key] for key in keys]
+
+    def lemmatize(self, text, drop_stopwords=False, drop_punct=False):
+        return self.lemmatize_many([text], drop_stopwords, drop_punct)[0]
+
+    def cache_info(self):
+        return {"hits": self.hits, "misses": self.misses, "size": len(self._cache), "max_size": self.cache_size}
+
+    def clear(self):
+        with self._lock:
+            self._cache.clear()
+            self.hits = self.misses = 0
+
+
+
+# Un service par modèle spaCy et par processus
+_services = {}
+_services_lock = threading.Lock()
+
+
+
+def get_lemmatizer(model_name=SPACY_SMALL_MODEL):
+    with _services_lock:
+        if model_name not in _services:
+            _services[model_name] = LemmatizationService(model_name)
+        return _services[model_name]
@@ -0,0 +1,310 @@
+# /**************************************************************************************************************************************************************************************
+# Nom du fichier : Model_registry.py
+# Rôle du fichier : Ce fichier centralise le chargement paresseux des modèles (Flair, spaCy, classifieur Sklearn) : chaque modèle est chargé à sa première utilisation puis gardé en cache.
+
+# Auteur : Maxime BRONNY
+# Version : V1
+# Licence : Réalisé dans le cadre des cours "Fouille de données, Ingéniérie des langues, Développement logiciel libre, IA & Apprentisage" L3 INFORMATIQUE IED
+# Usage : Un paquetage a été mit en place pour l'utiliser veuillez utiliser dans un système debian la commande suivante :
+#           - INSTALLATION DU PAQUET GÉNÉRÉ
+#               - sudo apt install ./cv-classifier_1.0-1_all.deb
+
+#           Puis exécute ton programme avec :
+#               - cv-classifier
+# ***************************************************************************************************************************************************************************************/
+
+
+
+# ****************************************************************** # 
+# --- LIBRAIRIES UTILISÉES POUR LE REGISTRE DE MODÈLES PARESSEUX --- # 
+# ****************************************************************** # 
+
+
+
+import os          # Lecture de la mémoire résidente via /proc
+import time        # Mesure des temps de chargement
+import argparse    # Interface en ligne de commande (pré-chargement et rapport)
+import threading   # Verrou de chargement et pré-chargement en arrière-plan
+import resource    # Repli pour la mesure mémoire hors Linux
+from pathlib import Path
+
+
+
+# ****************************************** # 
+# --- NOMS ET CHEMINS DES MODÈLES CONNUS --- # 
+# ****************************************** # 
+
+
+
+# Noms sous lesquels les modèles du projet sont enregistrés
+FLAIR_GENERIC_MODEL   = "flair/ner-french"
+FLAIR_FINETUNED_MODEL = "flair/best-model"
+SPACY_SMALL_MODEL     = "spacy/fr_core_news_sm"
+SPACY_MEDIUM_MODEL    = "spacy/fr_core_news_md"
+SPACY_BLANK_MODEL     = "spacy/blank_fr"
+CV_CLASSIFIER_MODEL   = "sklearn/cv_classifier"
+
+# Chemins des modèles entraînés localement
+FLAIR_FINETUNED_MODEL_PATH = Path(__file__).resolve().parent / "data/models/flair_ner_model/best-model.pt"
+CV_CLASSIFIER_MODEL_PATH   = "/var/lib/cv-classifier/data/models/cv_classifier_model.pkl"
+
+
+
+# ******************************** # 
+# --- ÉTAT INTERNE DU REGISTRE --- # 
+# ******************************** # 
+
+
+
+_loaders = {}   # { nom : fonction sans argument qui charge le modèle }
+_models  = {}   # { nom : modèle chargé }
+_stats   = {}   # { nom : { "load_seconds": ..., "rss_delta_bytes": ... } }
+
+# Un seul chargement à la fois : la mémoire mesurée avant/après est ainsi attribuable au modèle chargé
+_load_lock = threading.RLock()
+
+
+
+# **************************** # 
+# --- MESURE DE LA MÉMOIRE --- # 
+# **************************** # 
+
+
+
+def current_rss_bytes():
+    """
+    Retourne la mémoire résidente (RSS) actuelle du processus en octets.
+    Hors Linux, se replie sur le pic de RSS fourni par getrusage.
+    """
+    try:
+        with open("/proc/self/statm", "r") as statm:
+            resident_pages = int(statm.read().split()[1])
+        return resident_pages * os.sysconf("SC_PAGE_SIZE")
+    except (OSError, ValueError, IndexError):
+        return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss * 1024
+
+
+
+def memory_breakdown(pid="self"):
+    """
+    Répartition de la mémoire d'un processus (Linux, /proc/<pid>/smaps_rollup), en octets :
+      - rss     : mémoire résidente totale
+      - pss     : part proportionnelle (pages partagées divisées par le nombre de processus)
+      - shared  : pages résidentes partagées avec d'autres processus (ex : modèles hérités par fork)
+      - private : pages propres à ce processus
+    Retourne None si l'information n'est pas disponible.
+    """
+    fields = {}
+    try:
+        with open(f"/proc/{pid}/smaps_rollup", "r") as smaps:
+            for line in smaps:
+                parts = line.split()
+                if len(parts) >= 2 and parts[0].endswith(":") and parts[1].isdigit():
+                    fields[parts[0][:-1]] = int(parts[1]) * 1024
+    except OSError:
+        return None
+
+    return {
+        "rss": fields.get("Rss", 0),
+        "pss": fields.get("Pss", 0),
+        "shared": fields.get("Shared_Clean", 0) + fields.get("Shared_Dirty", 0),
+        "private": fields.get("Private_Clean", 0) + fields.get("Private_Dirty", 0)
+    }
+
+
+
+# ******************************************* # 
+# --- ENREGISTREMENT ET ACCÈS AUX MODÈLES --- # 
+# ******************************************* # 
+
+
+
+def register_model(name, loader, replace=False):
+    """
+    Enregistre la fonction de chargement d'un modèle sans le charger.
+
+    :param name: Nom du modèle dans le registre
+    :param loader: Fonction sans argument retournant le modèle chargé
+    :param replace: Remplace un chargeur déjà enregistré (et oublie le modèle en cache)
+    """
+    with _load_lock:
+        if name in _loaders and not replace:
+            return
+        _loaders[name] = loader
+        _models.pop(name, None)
+        _stats.pop(name, None)
+
+
+
+def is_registered(name):
+    return name in _loaders
+
+
+
+def is_loaded(name):
+    return name in _models
+
+
+
+def get_model(name):
+    """
+    Retourne le modèle 'name', en le chargeant lors du premier appel.
+    Le modèle reste en cache pour toute la durée de vie du processus.
+    """
+    model = _models.get(name)
+    if model is not None:
+        return model
+
+    with _load_lock:
+        # Un autre thread a pu terminer le chargement pendant l'attente du verrou
+        if name in _models:
+            return _models[name]
+        if name not in _loaders:
+            raise KeyError(f"Modèle inconnu du registre : {name}")
+
+        rss_before = current_rss_bytes()
+        start = time.perf_counter()
+        model = _loaders[name]()
+        _stats[name] = {
+            "load_seconds": time.perf_counter() - start,
+            "rss_delta_bytes": current_rss_bytes() - rss_before
+        }
+        _models[name] = model
+        return model
+
+
+
+def prewarm(names=None, background=True):
+    """
+    Charge à l'avance les modèles 'names' (tous les modèles enregistrés par défaut).
+
+    :param background: Si vrai, le chargement a lieu dans un thread démon et la fonction
+                       retourne immédiatement ce thread ; sinon elle retourne None une fois
+                       tous les modèles chargés
+    """
+    names = list(_loaders) if names is None else list(names)
+
+    def _load_all():
+        for name in names:
+            try:
+                get_model(name)
+            except Exception as e:
+                print(f"Pré-chargement impossible du modèle {name} : {e}")
+
+    if not background:
+        _load_all()
+        return None
+
+    thread = threading.Thread(target=_load_all, name="prewarm-models", daemon=True)
+    thread.start()
+    return thread
+
+
+
+# ***************************************** # 
+# --- RAPPORT DE CHARGEMENT DES MODÈLES --- # 
+# ***************************************** # 
+
+
+
+def model_report():
+    """
+    Retourne, pour chaque modèle enregistré, son état de chargement,
+    son temps de chargement et la mémoire résidente qu'il a ajoutée au processus.
+    """
+    report = []
+    for name in _loaders:
+        stats = _stats.get(name, {})
+        report.append({
+            "model": name,
+            "loaded": name in _models,
+            "load_seconds": stats.get("load_seconds"),
+            "rss_delta_mb": None if "rss_delta_bytes" not in stats else stats["rss_delta_bytes"] / (1024 * 1024)
+        })
+    return report
+
+
+
+def print_model_report():
+    print("\nRapport de chargement des modèles :\n")
+    for entry in model_report():
+        if entry["loaded"]:
+            print(f"  {entry['model']:<25} chargé en {entry['load_seconds']:.2f} s  (+{entry['rss_delta_mb']:.1f} Mo RSS)")
+        else:
+            print(f"  {entry['model']:<25} non chargé")
+    print(f"\n  RSS totale du processus : {current_rss_bytes() / (1024 * 1024):.1f} Mo\n")
+
+
+
+# **************************************************** # 
+# --- CHARGEURS DES MODÈLES UTILISÉS PAR LE PROJET --- # 
+# **************************************************** # 
+
+
+
+# Les bibliothèques lourdes (torch/Flair, spaCy, scikit-learn) ne sont importées qu'au chargement du modèle
+def _load_flair_generic():
+    from flair.models import SequenceTagger
+    print("\nChargement du modèle Flair/ner-french... \n")
+    return SequenceTagger.load("flair/ner-french")
+
+
+
+def _load_flair_finetuned():
+    from flair.models import SequenceTagger
+    print("\nChargement du modèle local : flair_ner_model/best-model.pt\n")
+    return SequenceTagger.load(str(FLAIR_FINETUNED_MODEL_PATH))
+
+
+
+def _load_spacy_small():
+    import spacy
+    print("\nChargement du modèle local pour la lemmatisation : fr_core_news_sm\n")
+    return spacy.load("fr_core_news_sm")
+
+
+
+def _load_spacy_medium():
+    import spacy
+    print("\nChargement du modèle local : fr_core_news_md\n")
+    return spacy.load("fr_core_news_md")
+
+
+
+def _load_spacy_blank():
+    import spacy
+    # Tokenizer français seul, sans vecteurs ni composants entraînés : mêmes tokens que fr_core_news_*
+    return spacy.blank("fr")
+
+
+
+def _load_cv_classifier():
+    import joblib
+    if not os.path.exists(CV_CLASSIFIER_MODEL_PATH):
+        raise FileNotFoundError("Modèle non trouvé. Entraînez d'abord le modèle avec train_model().")
+    return joblib.load(CV_CLASSIFIER_MODEL_PATH)
+
+
+
+register_model(FLAIR_GENERIC_MODEL, _load_flair_generic)
+register_model(FLAIR_FINETUNED_MODEL, _load_flair_finetuned)
+register_model(SPACY_SMALL_MODEL, _load_spacy_small)
+register_model(SPACY_MEDIUM_MODEL, _load_spacy_medium)
+register_model(SPACY_BLANK_MODEL, _load_spacy_blank)
+register_model(CV_CLASSIFIER_MODEL, _load_cv_classifier)
+
+
+
+# *********************************** # 
+# --- POINT D'ENTRÉE DU PROGRAMME --- # 
+# *********************************** # 
+
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Pré-chargement des modèles et rapport de temps/mémoire de chargement.")
+    parser.add_argument("models", nargs="*", help="Modèles à charger (tous par défaut) : " + ", ".join(_loaders))
+    args = parser.parse_args()
+
+    prewarm(args.models or None, background=False)
+    print_model_report()
@@ -0,0 +1,252 @@
+# /**************************************************************************************************************************************************************************************
+# Nom du fichier : Ngram_index.py
+# Rôle du fichier : Ce fichier construit, enregistre et interroge un index inversé de trigrammes de caractères : pour chaque terme détecté, il présélectionne quelques dizaines de références candidates avant le calcul de similarité RapidFuzz.
+
+# Auteur : Maxime BRONNY
+# Version : V1
+# Licence : Réalisé dans le cadre des cours "Fouille de données, Ingéniérie des langues, Développement logiciel libre, IA & Apprentisage" L3 INFORMATIQUE IED
+# Usage : Un paquetage a été mit en place pour l'utiliser veuillez utiliser dans un système debian la commande suivante :
+#           - INSTALLATION DU PAQUET GÉNÉRÉ
+#               - sudo apt install ./cv-classifier_1.0-1_all.deb
+
+#           Puis exécute ton programme avec :
+#               - cv-classifier
+# ***************************************************************************************************************************************************************************************/
+
+
+
+# ******************************************************* # 
+# --- LIBRAIRIES UTILISÉES POUR L'INDEX DE TRIGRAMMES --- # 
+# ******************************************************* # 
+
+
+
+import os          # Création du dossier de l'index
+import csv         # Lecture des libellés ESCO
+import json        # Libellés et trigrammes de l'index
+import time        # Mesure des temps de recherche (ligne de commande)
+import hashlib     # Empreinte du vocabulaire indexé
+import argparse    # Interface en ligne de commande (build / query)
+from pathlib import Path
+
+# --- Bibliothèque numérique : listes de postings au format CSR, chargées par projection mémoire ---
+import numpy as np
+
+
+
+# ***************************** # 
+# --- PARAMÈTRES DE L'INDEX --- # 
+# ***************************** # 
+
+
+
+# Dossier par défaut des index enregistrés
+DEFAULT_INDEX_DIR = Path(__file__).resolve().parent / "data/index"
+
+# Nombre de références candidates retenues pour chaque terme
+DEFAULT_CANDIDATE_LIMIT = 50
+
+# Libellés ESCO produits par ESCO/ESCO_end2end_build.py
+ESCO_OUTPUT_DIR = Path(__file__).resolve().parent / "ESCO/esco_outputs"
+ESCO_SKILLS_FILE = ESCO_OUTPUT_DIR / "ESCO_IT_Pair.csv"
+ESCO_OCCUPATIONS_FILE = ESCO_OUTPUT_DIR / "esco_jobs_to_skills.csv"
+
+
+
+# ******************************* # 
+# --- DÉCOUPAGE EN TRIGRAMMES --- # 
+# ******************************* # 
+
+
+
+def trigrams(text):
+    """
+    Ensemble des trigrammes de caractères d'un texte (déjà normalisé), bornes de mots comprises :
+    "sql" -> {" sq", "sql", "ql "}.
+    """
+    padded = f" {text} "
+    return {padded[i:i + 3] for i in range(len(padded) - 2)}
+
+
+
+def vocabulary_fingerprint(normalized_labels):
+    """
+    Empreinte d'un vocabulaire normalisé : un index enregistré n'est réutilisé que pour le même vocabulaire.
+    """
+    return hashlib.sha256("\n".join(normalized_labels).encode("utf-8")).hexdigest()
+
+
+
+# *********************************** # 
+# --- INDEX INVERSÉ DE TRIGRAMMES --- # 
+# *********************************** # 
+
+
+
+class TrigramIndex:
+    """
+    Index inversé trigramme -> références, au format CSR :
+      - offsets[t] .. offsets[t + 1] délimitent dans 'postings' les références contenant le trigramme t
+      - sizes[i] est le nombre de trigrammes de la référence i
+
+    Les tableaux sont enregistrés en .npy et rechargés par projection mémoire (mmap_mode="r") :
+    les pages sont partagées entre processus et seules celles consultées sont lues sur le disque.
+    """
+
+    def __init__(self, normalized_labels, trigram_ids, offsets, postings, sizes):
+        self.normalized_labels = normalized_labels
+        self.trigram_ids = trigram_ids
+        self.offsets = offsets
+        self.postings = postings
+        self.sizes = sizes
+        self.fingerprint = vocabulary_fingerprint(normalized_labels)
+
+    @classmethod
+    def build(cls, normalized_labels):
+        """
+        Construit l'index d'une liste de références déjà normalisées (l'ordre est conservé :
+        les identifiants retournés par candidates() sont des positions dans cette liste).
+        """
+        label_trigrams = [trigrams(label) for label in normalized_labels]
+        trigram_ids = {trigram: index for index, trigram in enumerate(sorted(set().union(*label_trigrams)))}
+
+        postings_lists = [[] for _ in trigram_ids]
+        for label_id, label_grams in enumerate(label_trigrams):
+            for trigram in label_grams:
+                postings_lists[trigram_ids[trigram]].append(label_id)
+
+        offsets = np.zeros(len(postings_lists) + 1, dtype=np.int64)
+        offsets[1:] = np.cumsum([len(postings) for postings in postings_lists])
+        postings = np.fromiter((label_id for postings in postings_lists for label_id in postings),
+                               dtype=np.int32, count=int(offsets[-1]))
+        sizes = np.array([len(label_grams) for label_grams in label_trigrams], dtype=np.int32)
+        return cls(list(normalized_labels), trigram_ids, offsets, postings, sizes)
+
+    def save(self, directory):
+        os.makedirs(directory, exist_ok=True)
+        # index.json est supprimé puis écrit en dernier : un enregistrement interrompu n'est jamais rechargé
+        meta_path = os.path.join(directory, "index.json")
+        if os.path.exists(meta_path):
+            os.remove(meta_path)
+        np.save(os.path.join(directory, "offsets.npy"), self.offsets)
+        np.save(os.path.join(directory, "postings.npy"), self.postings)
+        np.save(os.path.join(directory, "sizes.npy"), self.sizes)
+        with open(meta_path, "w", encoding="utf-8") as file:
+            json.dump({
+                "fingerprint": self.fingerprint,
+                "labels": self.normalized_labels,
+                "trigrams": sorted(self.trigram_ids, key=self.trigram_ids.get)
+            }, file, ensure_ascii=False)
+
+    @classmethod
+    def load(cls, directory):
+        with open(os.path.join(directory, "index.json"), "r", encoding="utf-8") as file:
+            meta = json.load(file)
+        arrays = [np.load(os.path.join(directory, f"{name}.npy"), mmap_mode="r") for name in ("offsets", "postings", "sizes")]
+        trigram_ids = {trigram: index for index, trigram in enumerate(meta["trigrams"])}
+        return cls(meta["labels"], trigram_ids, *arrays)
+
+    @classmethod
+    def load_or_build(cls, normalized_labels, directory=None):
+        """
+        Recharge l'index enregistré dans 'directory' s'il correspond au vocabulaire,
+        sinon le reconstruit (et l'enregistre si possible).
+        """
+        normalized_labels = list(normalized_labels)
+        if directory is not None:
+            try:
+                index = cls.load(directory)
+                if index.fingerprint == vocabulary_fingerprint(normalized_labels):
+                    return index
+            except (OSError, ValueError, KeyError):
+                pass
+
+        index = cls.build(normalized_labels)
+        if directory is not None:
+            try:
+                index.save(directory)
+            except OSError as e:
+                print(f"Index de trigrammes non enregistré ({directory}) : {e}")
+        return index
+
+    def candidates(self, query, limit=DEFAULT_CANDIDATE_LIMIT):
+        """
+        Identifiants des 'limit' références partageant le plus de trigrammes avec 'query' (déjà
+        normalisé), classées par coefficient de Dice décroissant.
+        """
+        query_trigrams = trigrams(query)
+        query_ids = [self.trigram_ids[trigram] for trigram in query_trigrams if trigram in self.trigram_ids]
+        if not query_ids:
+            return np.empty(0, dtype=np.int64)
+
+        # Nombre de trigrammes communs avec chaque référence
+        hits = np.concatenate([self.postings[self.offsets[t]:self.offsets[t + 1]] for t in query_ids])
+        counts = np.bincount(hits, minlength=len(self.sizes))
+        label_ids = np.flatnonzero(counts)
+
+        # Dice : 2 x trigrammes communs / (trigrammes du terme + trigrammes de la référence)
+        dice = 2.0 * counts[label_ids] / (len(query_trigrams) + self.sizes[label_ids])
+        if len(label_ids) > limit:
+            best = np.argpartition(-dice, limit - 1)[:limit]
+            label_ids, dice = label_ids[best], dice[best]
+        return label_ids[np.argsort(-dice, kind="stable")]
+
+
+
+# ************************* # 
+# --- VOCABULAIRES ESCO --- # 
+# ************************* # 
+
+
+
+def load_esco_skills(path=ESCO_SKILLS_FILE):
+    """
+    Libellés des compétences ESCO (première colonne de ESCO_IT_Pair.csv : "compétence|domaine").
+    """
+    with open(path, "r", encoding="utf-8") as file:
+        return sorted({row[0].strip() for row in csv.reader(file, delimiter="|") if row and row[0].strip()})
+
+
+
+def load_esco_occupations(path=ESCO_OCCUPATIONS_FILE):
+    """
+    Libellés des métiers ESCO (colonne occupationLabel de esco_jobs_to_skills.csv) ;
+    les formes "masculin/féminin" donnent deux libellés.
+    """
+    labels = set()
+    with open(path, "r", encoding="utf-8") as file:
+        for row in csv.DictReader(file):
+            labels.update(label.strip() for label in row["occupationLabel"].split("/") if label.strip())
+    return sorted(labels)
+
+
+
+# *********************************** # 
+# --- POINT D'ENTRÉE DU PROGRAMME --- # 
+# *********************************** # 
+
+
+
+if __name__ == "__main__":
+    from main import normalize
+
+    parser = argparse.ArgumentParser(description="Construction et interrogation des index de trigrammes des vocabulaires ESCO.")
+    parser.add_argument("vocabulary", choices=("skills", "occupations"), help="Vocabulaire ESCO à indexer")
+    parser.add_argument("--index-dir", default=str(DEFAULT_INDEX_DIR), help="Dossier des index enregistrés")
+    parser.add_argument("--query", nargs="*", default=[], help="Termes à rechercher dans l'index")
+    parser.add_argument("--limit", type=int, default=10, help="Nombre de candidats affichés")
+    args = parser.parse_args()
+
+    labels = load_esco_skills() if args.vocabulary == "skills" else load_esco_occupations()
+    normalized_labels = [normalize(label) for label in labels]
+    start = time.perf_counter()
+    index = TrigramIndex.load_or_build(normalized_labels, os.path.join(args.index_dir, f"esco_{args.vocabulary}"))
+    print(f"{len(labels)} libellés, {len(index.trigram_ids)} trigrammes ({time.perf_counter() - start:.2f} s)")
+
+    for query in args.query:
+        start = time.perf_counter()
+        candidate_ids = index.candidates(normalize(query), args.limit)
+        elapsed_ms = (time.perf_counter() - start) * 1000
+        print(f"\n{query} ({elapsed_ms:.3f} ms) :")
+        for label_id in candidate_ids:
+            print(f"  - {labels[label_id]}")
@@ -0,0 +1,100 @@
+# /**************************************************************************************************************************************************************************************
+# Nom du fichier : Nlp_resources.py
+# Rôle du fichier : Ce fichier est le point d'accès unique aux modèles spaCy : chaque modèle est chargé au plus une fois par processus (Model_registry) et chaque usage choisit un profil qui n'exécute que les composants dont il a besoin.
+
+# Auteur : Maxime BRONNY
+# Version : V1
+# Licence : Réalisé dans le cadre des cours "Fouille de données, Ingéniérie des langues, Développement logiciel libre, IA & Apprentisage" L3 INFORMATIQUE IED
+# Usage : Un paquetage a été mit en place pour l'utiliser veuillez utiliser dans un système debian la commande suivante :
+#           - INSTALLATION DU PAQUET GÉNÉRÉ
+#               - sudo apt install ./cv-classifier_1.0-1_all.deb
+
+#           Puis exécute ton programme avec :
+#               - cv-classifier
+# ***************************************************************************************************************************************************************************************/
+
+
+
+# ************************************************************** # 
+# --- LIBRAIRIES UTILISÉES POUR LA GESTION DES MODÈLES SPACY --- # 
+# ************************************************************** # 
+
+
+
+# --- Registre des modèles : chargement paresseux et unique de fr_core_news_sm / fr_core_news_md / spacy.blank("fr") ---
+from Model_registry import get_model, SPACY_SMALL_MODEL, SPACY_BLANK_MODEL
+
+
+
+# ***************************************** # 
+# --- PROFILS D'UTILISATION DES MODÈLES --- # 
+# ***************************************** # 
+
+
+
+# Profils disponibles :
+#   - "tokenize"  : tokenizer seul (texte des tokens, ponctuation, espaces, mots vides), issu de spacy.blank("fr")
+#                   pour ne pas charger en mémoire les vecteurs et composants d'un modèle entraîné
+#   - "lemmatize" : étiquettes morphologiques et lemmes, sans analyse syntaxique ni entités nommées
+#   - "full"      : tous les composants du modèle
+TOKENIZE_PROFILE  = "tokenize"
+LEMMATIZE_PROFILE = "lemmatize"
+FULL_PROFILE      = "full"
+
+# Composants désactivés par profil (None : tous les composants sont désactivés)
+PROFILE_DISABLED_PIPES = {
+    TOKENIZE_PROFILE:  None,
+    LEMMATIZE_PROFILE: ("parser", "senter", "ner"),
+    FULL_PROFILE:      ()
+}
+
+# Nombre de textes traités ensemble par nlp.pipe
+DEFAULT_PIPE_BATCH_SIZE = 256
+
+
+
+# ************************************************** # 
+# --- ACCÈS AUX MODÈLES ET TRAITEMENT PAR PROFIL --- # 
+# ************************************************** # 
+
+
+
+def get_nlp(model_name=SPACY_SMALL_MODEL):
+    """
+    Retourne le modèle spaCy 'model_name' (SPACY_SMALL_MODEL ou SPACY_MEDIUM_MODEL), chargé au plus une fois par processus.
+    """
+    return get_model(model_name)
+
+
+
+def disabled_pipes(nlp, profile):
+    """
+    Composants du modèle à désactiver pour le profil 'profile'.
+    """
+    if profile not in PROFILE_DISABLED_PIPES:
+        raise ValueError(f"Profil spaCy inconnu : {profile}")
+    disabled = PROFILE_DISABLED_PIPES[profile]
+    if disabled is None:
+        return list(nlp.pipe_names)
+    return [pipe for pipe in disabled if pipe in nlp.pipe_names]
+
+
+
+def pipe(texts, profile=FULL_PROFILE, model_name=SPACY_SMALL_MODEL, batch_size=DEFAULT_PIPE_BATCH_SIZE):
+    """
+    Analyse 'texts' par lots en n'exécutant que les composants du profil ; retourne un itérateur de Doc.
+    Le profil "tokenize" utilise toujours le tokenizer de spacy.blank("fr"), quel que soit 'model_name'.
+    """
+    if profile == TOKENIZE_PROFILE:
+        # Le tokenizer français est identique dans les modèles entraînés : inutile de charger leurs poids
+        return get_model(SPACY_BLANK_MODEL).tokenizer.pipe(texts, batch_size=batch_size)
+    nlp = get_nlp(model_name)
+    return nlp.pipe(texts, batch_size=batch_size, disable=disabled_pipes(nlp, profile))
+
+
+
+def process(text, profile=FULL_PROFILE, model_name=SPACY_SMALL_MODEL):
+    """
+    Analyse un seul texte avec le profil 'profile'.
+    """
+    return next(iter(pipe([text], profile, model_name)))
@@ -0,0 +1,496 @@
+# /**************************************************************************************************************************************************************************************
+# Nom du fichier : Pdf_backends.py
+# Rôle du fichier : Ce fichier regroupe les bibliothèques d'extraction du texte des PDF derrière une même interface : pdfplumber (mise en page fidèle, par défaut) et des moteurs rapides sans analyse de mise en page (PyMuPDF, pypdfium2, pdfminer en mode brut), avec repli automatique lorsqu'un moteur ne retourne aucun texte, et conserve le texte extrait de chaque PDF pour ne pas le ré-extraire.
+
+# Auteur : Maxime BRONNY
+# Version : V1
+# Licence : Réalisé dans le cadre des cours "Fouille de données, Ingéniérie des langues, Développement logiciel libre, IA & Apprentisage" L3 INFORMATIQUE IED
+# Usage : Un paquetage a été mit en place pour l'utiliser veuillez utiliser dans un système debian la commande suivante :
+#           - INSTALLATION DU PAQUET GÉNÉRÉ
+#               - sudo apt install ./cv-classifier_1.0-1_all.deb
+
+#           Puis exécute ton programme avec :
+#               - cv-classifier
+# ***************************************************************************************************************************************************************************************/
+
+
+
+# *************************************************************** # 
+# --- LIBRAIRIES UTILISÉES POUR L'EXTRACTION DU TEXTE DES PDF --- # 
+# *************************************************************** # 
+
+
+
+import os                      # Nombre de cœurs (extraction des pages en parallèle), fichiers du cache des textes
+import gzip                    # Compression des textes extraits conservés
+import json                    # Format des textes extraits conservés
+import multiprocessing         # Détection des processus de travail, contexte forkserver des processus d'extraction
+from itertools import islice   # Sélection d'une plage de pages (pdfminer)
+from concurrent.futures import ProcessPoolExecutor
+
+# --- Version des bibliothèques et empreintes (clé du texte extrait conservé) ---
+from Result_cache import package_version, combine_fingerprints, file_fingerprint
+
+# --- Moteurs d'extraction, tous facultatifs sauf pdfplumber (et pdfminer.six, dont il dépend) ---
+import pdfplumber
+
+try:
+    from pdfminer.layout import LTChar
+    from pdfminer.pdfpage import PDFPage
+    from pdfminer.converter import PDFPageAggregator
+    from pdfminer.pdfinterp import PDFResourceManager, PDFPageInterpreter
+except ImportError:
+    PDFPage = None
+
+try:
+    import pymupdf
+except ImportError:
+    pymupdf = None
+
+try:
+    import pypdfium2
+except ImportError:
+    pypdfium2 = None
+
+# --- Compression zstd des textes conservés, facultative : à défaut gzip est utilisé ---
+try:
+    import zstandard
+except ImportError:
+    zstandard = None
+
+
+
+# ******************************************* # 
+# --- PARAMÈTRES DES MOTEURS D'EXTRACTION --- # 
+# ******************************************* # 
+
+
+
+# Moteur utilisé par défaut : mise en page reconstituée caractère par caractère (le plus fidèle, le plus lent)
+DEFAULT_PDF_BACKEND = "pdfplumber"
+
+# Alias "fast" : premier moteur rapide installé, du plus rapide au moins rapide
+FAST_BACKENDS = ("pymupdf", "pypdfium2", "pdfminer")
+
+# Ordre de repli lorsqu'un moteur échoue ou ne retourne aucun texte
+FALLBACK_ORDER = ("pdfplumber", "pymupdf", "pypdfium2", "pdfminer")
+
+# Nombre de processus extrayant les pages d'un même PDF (1 : extraction séquentielle)
+DEFAULT_PAGE_JOBS = min(4, os.cpu_count() or 1)
+
+# Nombre de pages à partir duquel un PDF est découpé en plages extraites en parallèle
+PARALLEL_MIN_PAGES = 10
+
+# Nombre minimal de pages par plage (l'ouverture du PDF est répétée pour chaque plage)
+MIN_PAGES_PER_RANGE = 3
+
+# Paramètres de l'extraction sans effet sur le texte obtenu (exclus de l'empreinte du cache)
+TEXT_NEUTRAL_OPTIONS = ("page_jobs", "text_cache", "text_compression")
+
+# Limites par CV (None : aucune limite), pour qu'un PDF démesuré (brochure scannée de 200 pages...)
+# ne fasse pas déborder la mémoire d'un processus de travail :
+#   - taille du fichier : au-delà, le PDF est ignoré
+#   - nombre de pages   : seules les premières pages sont extraites
+#   - nombre de caractères du texte extrait : le texte est tronqué
+DEFAULT_MAX_BYTES = 20 * 1024 * 1024
+DEFAULT_MAX_PAGES = 50
+DEFAULT_MAX_CHARS = 200_000
+
+# Sous-dossier du dossier des textes extraits (output_text) où sont conservés les textes de chaque PDF,
+# nommés d'après l'empreinte de son contenu et la version du moteur
+TEXT_STORE_DIR = ".textes_pdf"
+
+# Extension des textes conservés selon leur compression (None : aucune)
+TEXT_STORE_SUFFIXES = {None: ".json", "gzip": ".json.gz", "zstd": ".json.zst"}
+
+
+
+# **************************** # 
+# --- MOTEURS D'EXTRACTION --- # 
+# **************************** # 
+
+
+
+class _PdfplumberBackend:
+    """
+    pdfplumber : caractères regroupés en lignes et mots selon leur position (mise en page fidèle).
+    Son texte est la référence : il est produit tel quel, sans normalize_page_text.
+    """
+    name, package, parallel_pages, normalized = "pdfplumber", "pdfplumber", True, False
+
+    def available(self):
+        return True
+
+    def page_count(self, pdf_path):
+        with pdfplumber.open(pdf_path) as pdf:
+            return len(pdf.pages)
+
+    def iter_pages(self, pdf_path, start=0, stop=None):
+        with pdfplumber.open(pdf_path) as pdf:
+            for page in pdf.pages[start:stop]:
+                try:
+                    yield page.extract_text() or ""
+                finally:
+                    # Libère les caractères et objets de la page gardés en cache jusqu'à la fermeture du PDF
+                    page.close()
+
+
+
+class _PdfminerRawBackend:
+    """
+    pdfminer en mode brut : caractères dans l'ordre du flux du PDF, sans analyse de mise en page ;
+    un saut de ligne est inséré quand la ligne de base change, une espace quand l'écart entre deux
+    caractères dépasse un tiers de leur hauteur.
+    """
+    name, package, parallel_pages, normalized = "pdfminer", "pdfminer.six", True, True
+
+    def available(self):
+        return PDFPage is not None
+
+    def _page_text(self, layout):
+        characters, previous = [], None
+        for item in layout:
+            if not isinstance(item, LTChar):
+                continue
+            if previous is not None:
+                if abs(item.y0 - previous.y0) > previous.height / 2:
+                    characters.append("\n")
+                elif item.x0 - previous.x1 > previous.height / 3 and characters[-1] != " " and item.get_text() != " ":
+                    characters.append(" ")
+            characters.append(item.get_text())
+            previous = item
+        return "".join(characters)
+
+    def page_count(self, pdf_path):
+        with open(pdf_path, "rb") as file:
+            return sum(1 for _ in PDFPage.get_pages(file))
+
+    def iter_pages(self, pdf_path, start=0, stop=None):
+        manager = PDFResourceManager()
+        device = PDFPageAggregator(manager, laparams=None)
+        interpreter = PDFPageInterpreter(manager, device)
+        with open(pdf_path, "rb") as file:
+            for page in islice(PDFPage.get_pages(file), start, stop):
+                interpreter.process_page(page)
+                yield self._page_text(device.get_result())
+
+
+
+class _PypdfiumBackend:
+    """
+    pypdfium2 : texte de chaque page fourni directement par PDFium (Chromium).
+    """
+    name, package, parallel_pages, normalized = "pypdfium2", "pypdfium2", False, True
+
+    def available(self):
+        return pypdfium2 is not None
+
+    def page_count(self, pdf_path):
+        document = pypdfium2.PdfDocument(pdf_path)
+        try:
+            return len(document)
+        finally:
+            document.close()
+
+    def iter_pages(self, pdf_path, start=0, stop=None):
+        document = pypdfium2.PdfDocument(pdf_path)
+        try:
+            for index in range(start, len(document) if stop is None else min(stop, len(document))):
+                page = document[index]
+                text_page = page.get_textpage()
+                try:
+                    yield text_page.get_text_range().replace("\r\n", "\n")
+                finally:
+                    text_page.close()
+                    page.close()
+        finally:
+            document.close()
+
+
+
+class _PymupdfBackend:
+    """
+    PyMuPDF : texte de chaque page fourni directement par MuPDF, dans l'ordre des blocs.
+    """
+    name, package, parallel_pages, normalized = "pymupdf", "PyMuPDF", False, True
+
+    def available(self):
+        return pymupdf is not None
+
+    def page_count(self, pdf_path):
+        with pymupdf.open(pdf_path) as document:
+            return document.page_count
+
+    def iter_pages(self, pdf_path, start=0, stop=None):
+        with pymupdf.open(pdf_path) as document:
+            for page in document.pages(start, stop):
+                yield page.get_text("text")
+
+
+
+def normalize_page_text(text):
+    """
+    Rapproche le texte des moteurs rapides de celui de pdfplumber : espaces insécables remplacées,
+    espaces de fin de ligne et lignes vides de fin de page supprimées.
+    """
+    return "\n".join(line.rstrip() for line in text.replace("\xa0", " ").split("\n")).rstrip("\n")
+
+
+
+def _iter_page_texts(name, pdf_path, start=0, stop=None):
+    # Pages du moteur 'name', normalisées pour les seuls moteurs rapides (pdfplumber reste inchangé)
+    backend = PDF_BACKENDS[name]
+    for text in backend.iter_pages(pdf_path, start, stop):
+        yield normalize_page_text(text) if backend.normalized else text
+
+
+
+PDF_BACKENDS = {backend.name: backend for backend in (_PdfplumberBackend(), _PdfminerRawBackend(), _PypdfiumBackend(), _PymupdfBackend())}
+
+
+
+# ************************************ # 
+# --- SÉLECTION DU MOTEUR ET REPLI --- # 
+# ************************************ # 
+
+
+
+def available_backends():
+    return [name for name, backend in PDF_BACKENDS.items() if backend.available()]
+
+
+
+def resolve_backend(name=DEFAULT_PDF_BACKEND):
+    """
+    Nom du moteur à utiliser pour 'name' ("fast" : premier moteur rapide installé).
+    """
+    if name == "fast":
+        return next((candidate for candidate in FAST_BACKENDS if PDF_BACKENDS[candidate].available()), DEFAULT_PDF_BACKEND)
+    if name not in PDF_BACKENDS:
+        raise ValueError(f"Moteur d'extraction PDF inconnu : {name} (disponibles : {', '.join(available_backends())}, fast)")
+    if not PDF_BACKENDS[name].available():
+        print(f"Moteur d'extraction PDF {name} non installé : utilisation de {DEFAULT_PDF_BACKEND}")
+        return DEFAULT_PDF_BACKEND
+    return name
+
+
+
+def backend_version(name):
+    """
+    Identifiant du moteur et de la version de sa bibliothèque (ex : "pymupdf-1.26.3").
+    """
+    return f"{name}-{package_version(PDF_BACKENDS[name].package)}"
+
+
+
+# ************************************************* # 
+# --- EXTRACTION DES PAGES EN PLAGES PARALLÈLES --- # 
+# ************************************************* # 
+
+
+
+# Processus d'extraction des pages, créés à la première demande puis réutilisés
+_page_pool = None
+_page_pool_size = 0
+
+
+
+def _get_page_pool(page_jobs):
+    global _page_pool, _page_pool_size
+    if _page_pool is None or _page_pool_size != page_jobs:
+        if _page_pool is not None:
+            _page_pool.shutdown()
+        # "forkserver" plutôt que fork : l'appelant peut avoir des threads actifs (service, interface, flux)
+        _page_pool = ProcessPoolExecutor(max_workers=page_jobs,
+                                         mp_context=multiprocessing.get_context("forkserver"))
+        _page_pool_size = page_jobs
+    return _page_pool
+
+
+
+def _extract_page_range(name, pdf_path, start, stop):
+    # Exécutée dans un processus d'extraction : texte des pages [start, stop[
+    return list(_iter_page_texts(name, pdf_path, start, stop))
+
+
+
+def page_ranges(page_count, page_jobs):
+    """
+    Découpe 'page_count' pages en au plus 'page_jobs' plages contiguës [début, fin[ de tailles voisines.
+    """
+    size = max(MIN_PAGES_PER_RANGE, -(-page_count // page_jobs))
+    return [(start, min(start + size, page_count)) for start in range(0, page_count, size)]
+
+
+
+def _read_pages(name, pdf_path, page_jobs, max_pages):
+    """
+    Texte des 'max_pages' premières pages de 'pdf_path' avec le moteur 'name'. Au moins PARALLEL_MIN_PAGES pages
+    à lire sont découpées en plages extraites par des processus distincts, puis rassemblées dans l'ordre des pages.
+
+    L'extraction reste séquentielle pour les moteurs déjà rapides (PyMuPDF, pypdfium2) et dans les
+    processus de travail de main.process_cv_files (processus démons, qui ne peuvent en créer d'autres).
+
+    :return: Tuple (textes des pages lues, nombre de pages du PDF)
+    """
+    backend = PDF_BACKENDS[name]
+    parallel = page_jobs > 1 and backend.parallel_pages and not multiprocessing.current_process().daemon
+    if not parallel and not max_pages:
+        pages = _extract_page_range(name, pdf_path, 0, None)
+        return pages, len(pages)
+
+    page_count = backend.page_count(pdf_path)
+    stop = min(page_count, max_pages) if max_pages else page_count
+    if parallel and stop >= PARALLEL_MIN_PAGES:
+        pool = _get_page_pool(page_jobs)
+        futures = [pool.submit(_extract_page_range, name, pdf_path, start, end)
+                   for start, end in page_ranges(stop, page_jobs)]
+        return [page for future in futures for page in future.result()], page_count
+    return _extract_page_range(name, pdf_path, 0, stop), page_count
+
+
+
+def _fallback_backends(requested):
+    return [name for name in FALLBACK_ORDER if name != requested and PDF_BACKENDS[name].available()]
+
+
+
+def _first_with_text(pdf_path, candidates, requested, page_jobs, max_pages, error=None, empty_result=None):
+    """
+    Essaie les moteurs 'candidates' dans l'ordre et retourne le résultat du premier qui trouve du texte
+    (ou, à défaut, les pages vides du premier moteur ayant pu lire le PDF).
+    """
+    for name in candidates:
+        try:
+            pages, page_count = _read_pages(name, pdf_path, page_jobs, max_pages)
+        except Exception as e:
+            # Un PDF que ce moteur ne sait pas lire peut l'être par un autre
+            error = error or e
+            continue
+        if any(page.strip() for page in pages):
+            if name != requested:
+                print(f"Aucun texte avec {requested} : texte extrait avec {name}")
+            return pages, name, page_count
+        empty_result = empty_result or (pages, name, page_count)
+
+    # PDF sans couche texte (ex : CV scanné) : pages vides du premier moteur ayant pu le lire
+    if empty_result is not None:
+        return empty_result
+    raise error
+
+
+
+def extract_pages(pdf_path, backend=DEFAULT_PDF_BACKEND, fallback=True, page_jobs=1, max_pages=None):
+    """
+    Extrait le texte de chaque page de 'pdf_path' avec le moteur 'backend'.
+
+    Si le moteur échoue ou ne trouve aucun texte (ex : PDF dont l'ordre des caractères le trompe),
+    les autres moteurs installés sont essayés dans l'ordre de FALLBACK_ORDER.
+
+    :param page_jobs: Nombre de processus se partageant les pages des longs PDF
+    :param max_pages: Nombre maximal de pages extraites (None : toutes)
+    :return: Tuple (liste des textes des pages lues, nom du moteur ayant fourni le texte, nombre de pages du PDF)
+    """
+    requested = resolve_backend(backend)
+    candidates = [requested] + (_fallback_backends(requested) if fallback else [])
+    return _first_with_text(pdf_path, candidates, requested, page_jobs, max_pages)
+
+
+
+def stream_pages(pdf_path, backend=DEFAULT_PDF_BACKEND, max_pages=None, info=None):
+    """
+    Variante de extract_pages qui produit le texte de chaque page dès qu'elle est extraite.
+
+    Si le moteur échoue ou ne trouve aucun texte, les autres moteurs sont essayés comme dans extract_pages
+    et leurs pages sont produites à la suite. Lorsque des pages avec du texte ont déjà été produites,
+    None est produit d'abord : les pages reçues jusque-là doivent être oubliées.
+
+    :param info: Dictionnaire complété à la fin avec "pages" (textes des pages lues), "backend" et "page_count"
+    """
+    info = {} if info is None else info
+    name = resolve_backend(backend)
+    pages, error = [], None
+    try:
+        for page in _iter_page_texts(name, pdf_path, 0, max_pages):
+            pages.append(page)
+            yield page
+    except Exception as e:
+        error = e
+    has_text = any(page.strip() for page in pages)
+
+    if error is None:
+        # Nombre total de pages demandé au moteur seulement si la limite de pages est atteinte
+        reached_limit = max_pages and len(pages) >= max_pages
+        page_count = PDF_BACKENDS[name].page_count(pdf_path) if reached_limit else len(pages)
+        if has_text:
+            info.update(pages=pages, backend=name, page_count=page_count)
+            return
+
+    if has_text:
+        yield None
+    empty_result = (pages, name, page_count) if error is None else None
+    pages, info["backend"], info["page_count"] = _first_with_text(pdf_path, _fallback_backends(name), name, 1, max_pages,
+                                                                  error, empty_result)
+    info["pages"] = pages
+    if info["backend"] != name:
+        yield from pages
+
+
+
+# **************************************** # 
+# --- CONSERVATION DES TEXTES EXTRAITS --- # 
+# **************************************** # 
+
+
+
+def text_store_key(pdf_hash, backend=DEFAULT_PDF_BACKEND, max_pages=None):
+    """
+    Nom du texte conservé pour le PDF de contenu 'pdf_hash' : il change avec le moteur, la version de sa
+    bibliothèque, le code de ce fichier et la limite de pages, et l'ancien texte n'est alors plus lu.
+    """
+    version = combine_fingerprints(backend_version(resolve_backend(backend)), file_fingerprint(__file__), max_pages)
+    return f"{pdf_hash}-{version[:16]}"
+
+
+
+def _open_stored(path, mode, compression):
+    if compression == "gzip":
+        return gzip.open(path, mode + "t", encoding="utf-8")
+    if compression == "zstd":
+        return zstandard.open(path, mode + "t", encoding="utf-8")
+    return open(path, mode, encoding="utf-8")
+
+
+
+def load_stored_pages(store_folder, key):
+    """
+    Texte conservé sous 'key', quelle que soit sa compression : dictionnaire {"pages", "page_count", "backend"},
+    ou None s'il est absent ou illisible.
+    """
+    for compression, suffix in TEXT_STORE_SUFFIXES.items():
+        path = os.path.join(store_folder, key + suffix)
+        if not os.path.exists(path) or (compression == "zstd" and zstandard is None):
+            continue
+        try:
+            with _open_stored(path, "r", compression) as file:
+                return json.load(file)
+        except (OSError, ValueError, EOFError):
+            # Fichier tronqué ou corrompu : le PDF est ré-extrait et le fichier réécrit
+            continue
+    return None
+
+
+
+def store_pages(store_folder, key, record, compression=None):
+    """
+    Conserve 'record' ({"pages", "page_count", "backend"}) sous 'key', compressé avec gzip, zstd ou sans compression.
+    Le fichier est écrit sous un nom temporaire puis renommé : un lecteur ne voit jamais un fichier incomplet.
+    """
+    if compression == "zstd" and zstandard is None:
+        compression = "gzip"
+    os.makedirs(store_folder, exist_ok=True)
+    path = os.path.join(store_folder, key + TEXT_STORE_SUFFIXES[compression])
+    temporary_path = f"{path}.{os.getpid()}.tmp"
+    with _open_stored(temporary_path, "w", compression) as file:
+        json.dump(record, file, ensure_ascii=False)
+    os.replace(temporary_path, path)
@@ -0,0 +1,131 @@
+# /**************************************************************************************************************************************************************************************
+# Nom du fichier : Regex_scanner.py
+# Rôle du fichier : Ce fichier compile une seule fois, en un motif combiné, les expressions régulières des champs d'un CV (emails, téléphones, couples langue/niveau) et les extrait en un seul parcours du texte.
+
+# Auteur : Maxime BRONNY
+# Version : V1
+# Licence : Réalisé dans le cadre des cours "Fouille de données, Ingéniérie des langues, Développement logiciel libre, IA & Apprentisage" L3 INFORMATIQUE IED
+# Usage : Un paquetage a été mit en place pour l'utiliser veuillez utiliser dans un système debian la commande suivante :
+#           - INSTALLATION DU PAQUET GÉNÉRÉ
+#               - sudo apt install ./cv-classifier_1.0-1_all.deb
+
+#           Puis exécute ton programme avec :
+#               - cv-classifier
+# ***************************************************************************************************************************************************************************************/
+
+
+
+# ********************************************************************* # 
+# --- LIBRAIRIES UTILISÉES POUR LE SCANNER D'EXPRESSIONS RÉGULIÈRES --- # 
+# ********************************************************************* # 
+
+
+
+import re
+from collections import namedtuple
+
+
+
+# Champ trouvé dans le texte du CV
+#   - kind      : type du champ ("email", "phone", "language")
+#   - text      : texte du champ
+#   - start/end : position du champ dans le texte
+#   - fields    : sous-champs nommés ({"language": ..., "level": ...} pour un couple langue/niveau)
+ScanMatch = namedtuple("ScanMatch", ["kind", "text", "start", "end", "fields"])
+
+# Types de champs, dans l'ordre de priorité du motif combiné
+FIELD_KINDS = ("email", "phone", "language")
+
+# Caractère pouvant prolonger une adresse email, et séparateur entre une langue et son niveau
+_EMAIL_CHARACTER = re.compile(r"[\w.@-]")
+_LANGUAGE_SEPARATOR = re.compile(r"\s*:")
+
+
+
+# ********************************** # 
+# --- SCANNER DES CHAMPS D'UN CV --- # 
+# ********************************** # 
+
+
+
+def _alternation(terms):
+    # Termes les plus longs en premier : "Langue maternelle" est essayé avant un éventuel "Langue"
+    return "|".join(re.escape(term) for term in sorted(terms, key=lambda term: (-len(term), term)))
+
+
+
+class CVFieldScanner:
+    """
+    Regroupe les motifs des champs d'un CV en un seul motif compilé à la création :
+
+        (?P<email>...) | (?P<phone>...) | (?P<language>langue : niveau)
+    """
+
+    def __init__(self, email_pattern, phone_pattern, languages, language_levels):
+        """
+        :param email_pattern: Motif d'une adresse email
+        :param phone_pattern: Motif d'un numéro de téléphone
+        :param languages: Langues reconnues (sans tenir compte de la casse)
+        :param language_levels: Niveaux reconnus (sans tenir compte de la casse)
+        """
+        language_pattern = rf"(?i:\b(?P<language_name>{_alternation(languages)})\b)\s*:\s*(?i:\b(?P<language_level>{_alternation(language_levels)})\b)"
+        self.email_regex = re.compile(rf"(?P<email>{email_pattern})")
+        self.phone_regex = re.compile(rf"(?P<phone>{phone_pattern})")
+        self.language_regex = re.compile(rf"(?P<language>{language_pattern})")
+        self.pattern = re.compile(
+            rf"(?P<email>{email_pattern})"
+            rf"|(?P<phone>{phone_pattern})"
+            rf"|(?P<language>{language_pattern})"
+        )
+
+    def scan(self, text):
+        """
+        Retourne tous les champs trouvés dans 'text', dans leur ordre d'apparition.
+
+        Les champs sont les mêmes qu'avec un re.finditer par type : quand deux champs de types
+        différents peuvent se chevaucher (ex : téléphone dans "0612345678@gmail.com"), le motif
+        combiné n'en trouverait qu'un, et le texte est alors parcouru une fois par type.
+        """
+        matches = []
+        for match in self.pattern.finditer(text):
+            kind = match.lastgroup if match.lastgroup in FIELD_KINDS else None
+            if kind is None:
+                # Le dernier groupe fermé est un sous-groupe : on remonte au champ qui a réussi
+                kind = next(kind for kind in FIELD_KINDS if match.group(kind) is not None)
+            matches.append(self._scan_match(kind, match))
+
+        if any(self._may_overlap(text, match) for match in matches):
+            return self._scan_each_kind(text)
+        return matches
+
+    def _scan_match(self, kind, match):
+        if kind == "language":
+            fields = {"language": match.group("language_name"), "level": match.group("language_level")}
+            return ScanMatch(kind, match.group(kind), match.start(kind), match.end(kind), fields)
+        return ScanMatch(kind, match.group(kind), match.start(kind), match.end(kind), {})
+
+    def _may_overlap(self, text, match):
+        # Un champ d'un autre type peut-il commencer dans 'match' ? Les motifs combinés consomment le texte du premier champ trouvé
+        if match.kind == "email":
+            return (self.phone_regex.search(text, match.start, match.end) is not None
+                    or _LANGUAGE_SEPARATOR.match(text, match.end) is not None)
+        # Une adresse email commençant dans le champ se poursuit au-delà de sa fin
+        return _EMAIL_CHARACTER.match(text, match.end) is not None
+
+    def _scan_each_kind(self, text):
+        # Un parcours par type de champ, comme des re.finditer séparés
+        matches = [
+            self._scan_match(kind, match)
+            for kind, regex in zip(FIELD_KINDS, (self.email_regex, self.phone_regex, self.language_regex))
+            for match in regex.finditer(text)
+        ]
+        return sorted(matches, key=lambda match: (match.start, FIELD_KINDS.index(match.kind)))
+
+    def scan_by_kind(self, text):
+        """
+        Champs trouvés dans 'text', regroupés par type : { "email": [...], "phone": [...], ... }.
+        """
+        grouped = {kind: [] for kind in FIELD_KINDS}
+        for match in self.scan(text):
+            grouped[match.kind].append(match)
+        return grouped
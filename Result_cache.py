@@ -0,0 +1,235 @@
+# /**************************************************************************************************************************************************************************************
+# Nom du fichier : Result_cache.py
+# Rôle du fichier : Ce fichier gère le cache persistant (SQLite) des résultats d'analyse des CV, indexé par le contenu du PDF et par les empreintes des modèles et listes de post-traitement utilisés.
+
+# Auteur : Maxime BRONNY
+# Version : V1
+# Licence : Réalisé dans le cadre des cours "Fouille de données, Ingéniérie des langues, Développement logiciel libre, IA & Apprentisage" L3 INFORMATIQUE IED
+# Usage : Un paquetage a été mit en place pour l'utiliser veuillez utiliser dans un système debian la commande suivante :
+#           - INSTALLATION DU PAQUET GÉNÉRÉ
+#               - sudo apt install ./cv-classifier_1.0-1_all.deb
+
+#           Puis exécute ton programme avec :
+#               - cv-classifier
+# ***************************************************************************************************************************************************************************************/
+
+
+
+# ******************************************************* # 
+# --- LIBRAIRIES UTILISÉES POUR LE CACHE DE RÉSULTATS --- # 
+# ******************************************************* # 
+
+
+
+import os                   # Taille, date de modification et création du dossier du cache
+import json                 # Sérialisation des résultats
+import time                 # Date d'enregistrement des résultats
+import sqlite3              # Stockage persistant du cache
+import threading            # Verrou de la connexion SQLite partagée entre les fils d'exécution
+import hashlib              # Empreintes SHA-256 des fichiers et textes
+import argparse             # Interface en ligne de commande (statistiques / purge)
+import functools            # Mémorisation des empreintes de fichiers volumineux
+from importlib import metadata
+
+
+
+# *************************** # 
+# --- PARAMÈTRES DU CACHE --- # 
+# *************************** # 
+
+
+
+# Emplacement par défaut de la base SQLite du cache
+DEFAULT_CACHE_PATH = "/var/lib/cv-classifier/cache/results.sqlite3"
+
+# Taille des blocs lus pour le calcul des empreintes de fichiers
+HASH_BLOCK_SIZE = 1024 * 1024
+
+
+
+# ***************************** # 
+# --- CALCUL DES EMPREINTES --- # 
+# ***************************** # 
+
+
+
+def sha256_file(path):
+    """
+    Empreinte SHA-256 du contenu d'un fichier (indépendante de son nom et de son emplacement).
+    """
+    digest = hashlib.sha256()
+    with open(path, "rb") as file:
+        for block in iter(lambda: file.read(HASH_BLOCK_SIZE), b""):
+            digest.update(block)
+    return digest.hexdigest()
+
+
+
+def sha256_text(text):
+    return hashlib.sha256(text.encode("utf-8")).hexdigest()
+
+
+
+@functools.lru_cache(maxsize=None)
+def _file_fingerprint(path, size, mtime_ns):
+    return sha256_file(path)
+
+
+
+def file_fingerprint(path):
+    """
+    Empreinte d'un fichier de modèle, calculée une seule fois par processus tant que le fichier
+    n'est pas modifié. Retourne "absent" si le fichier n'existe pas.
+    """
+    try:
+        stat = os.stat(path)
+    except OSError:
+        return "absent"
+    return _file_fingerprint(str(path), stat.st_size, stat.st_mtime_ns)
+
+
+
+def package_version(name):
+    """
+    Version d'un paquet Python installé (sans l'importer), ou "absent".
+    """
+    try:
+        return metadata.version(name)
+    except metadata.PackageNotFoundError:
+        return "absent"
+
+
+
+def combine_fingerprints(*parts):
+    """
+    Combine plusieurs valeurs (chaînes, nombres, listes...) en une seule empreinte stable.
+    """
+    return sha256_text(json.dumps(parts, ensure_ascii=False, sort_keys=True, default=str))
+
+
+
+# ************************************** # 
+# --- CACHE PERSISTANT DES RÉSULTATS --- # 
+# ************************************** # 
+
+
+
+class ResultCache:
+    """
+    Cache SQLite à deux niveaux :
+      - entities : données structurées d'un CV, clé = (SHA-256 du PDF, empreinte NER/post-traitement)
+      - domains  : domaines prédits, clé = (SHA-256 du texte donné au classifieur, empreinte du classifieur)
+
+    Une mise à jour du classifieur n'invalide donc que les domaines : les entités déjà extraites
+    sont réutilisées et seul le SVM est relancé.
+    """
+
+    def __init__(self, path=DEFAULT_CACHE_PATH):
+        self.path = path
+        os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+        # Plusieurs processus de travail (--jobs) peuvent écrire en même temps : mode WAL et délai d'attente.
+        # Dans un processus, les fils (ex : requêtes du service d'analyse local) partagent la connexion sous verrou
+        self.lock = threading.RLock()
+        self.connection = sqlite3.connect(path, timeout=30, check_same_thread=False)
+        self.connection.execute("PRAGMA journal_mode=WAL")
+        self.connection.execute(
+            "CREATE TABLE IF NOT EXISTS entities ("
+            " pdf_hash TEXT NOT NULL, fingerprint TEXT NOT NULL, data TEXT NOT NULL, created REAL NOT NULL,"
+            " PRIMARY KEY (pdf_hash, fingerprint))"
+        )
+        self.connection.execute(
+            "CREATE TABLE IF NOT EXISTS domains ("
+            " input_hash TEXT NOT NULL, fingerprint TEXT NOT NULL, data TEXT NOT NULL, created REAL NOT NULL,"
+            " PRIMARY KEY (input_hash, fingerprint))"
+        )
+        self.connection.commit()
+
+    def _get(self, table, key_column, key, fingerprint):
+        with self.lock:
+            row = self.connection.execute(
+                f"SELECT data FROM {table} WHERE {key_column} = ? AND fingerprint = ?", (key, fingerprint)
+            ).fetchone()
+        return None if row is None else json.loads(row[0])
+
+    def _put(self, table, key, fingerprint, data):
+        with self.lock:
+            self.connection.execute(
+                f"INSERT OR REPLACE INTO {table} VALUES (?, ?, ?, ?)",
+                (key, fingerprint, json.dumps(data, ensure_ascii=False, default=float), time.time())
+            )
+            self.connection.commit()
+
+    # --- Données structurées (entités) d'un CV ---
+    def get_entities(self, pdf_hash, fingerprint):
+        return self._get("entities", "pdf_hash", pdf_hash, fingerprint)
+
+    def put_entities(self, pdf_hash, fingerprint, structured_data):
+        self._put("entities", pdf_hash, fingerprint, structured_data)
+
+    # --- Domaines prédits : liste de (domaine, probabilité) ---
+    def get_domains(self, input_hash, fingerprint):
+        domains = self._get("domains", "input_hash", input_hash, fingerprint)
+        return None if domains is None else [(domain, probability) for domain, probability in domains]
+
+    def put_domains(self, input_hash, fingerprint, domains):
+        self._put("domains", input_hash, fingerprint, [(str(domain), float(probability)) for domain, probability in domains])
+
+    def stats(self):
+        with self.lock:
+            return {
+                table: self.connection.execute(f"SELECT COUNT(*) FROM {table}").fetchone()[0]
+                for table in ("entities", "domains")
+            }
+
+    def clear(self):
+        with self.lock:
+            self.connection.execute("DELETE FROM entities")
+            self.connection.execute("DELETE FROM domains")
+            self.connection.commit()
+
+
+
+# Une connexion par processus et par base (les connexions SQLite ne traversent pas un fork),
+# partagée sous verrou par tous les fils du processus
+_caches = {}
+_caches_lock = threading.Lock()
+
+
+
+def get_cache(path=DEFAULT_CACHE_PATH):
+    """
+    Retourne le cache de ce processus pour la base 'path', ou None si elle est inaccessible
+    (l'analyse se poursuit alors sans cache).
+    """
+    key = (os.getpid(), path)
+    with _caches_lock:
+        if key not in _caches:
+            try:
+                _caches[key] = ResultCache(path)
+            except (OSError, sqlite3.Error) as e:
+                print(f"Cache des résultats indisponible ({path}) : {e}")
+                _caches[key] = None
+        return _caches[key]
+
+
+
+# *********************************** # 
+# --- POINT D'ENTRÉE DU PROGRAMME --- # 
+# *********************************** # 
+
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Statistiques et purge du cache des résultats d'analyse.")
+    parser.add_argument("--cache", default=DEFAULT_CACHE_PATH, help="Chemin de la base SQLite du cache")
+    parser.add_argument("--clear", action="store_true", help="Vide le cache")
+    args = parser.parse_args()
+
+    cache = get_cache(args.cache)
+    if cache is None:
+        raise SystemExit(1)
+    if args.clear:
+        cache.clear()
+        print("Cache vidé.")
+    for table, count in cache.stats().items():
+        print(f"{table:<10} : {count} entrées")
@@ -23,9 +23,11 @@
 
 import json  # Gestion des données au format JSON
 import csv  # Lecture et écriture de fichiers CSV
-import pdfplumber  # Extraction de texte depuis des fichiers PDF
+from Pdf_backends import extract_pages, stream_pages, DEFAULT_PDF_BACKEND, DEFAULT_PAGE_JOBS, DEFAULT_MAX_BYTES, DEFAULT_MAX_PAGES, DEFAULT_MAX_CHARS  # Extraction de texte depuis des fichiers PDF (pdfplumber ou moteur rapide)
+from Pdf_backends import TEXT_STORE_DIR, text_store_key, load_stored_pages, store_pages  # Textes déjà extraits, conservés par PDF et par moteur
+from Result_cache import sha256_file  # Empreinte du contenu des PDF
 import os  # Interaction avec le système de fichiers et les variables d'environnement
-import spacy  # Traitement du langage naturel (NLP)
+from Nlp_resources import process, LEMMATIZE_PROFILE  # Modèles spaCy partagés (chargés une seule fois)
 
 
 
@@ -62,9 +64,8 @@ def normalize_text(text):
     :param text: Chaîne de caractères à normaliser
     :return: Texte normalisé
     """
-    # Charge le modèle linguistique français de spaCy
-    nlp = spacy.load("fr_core_news_sm")
-    doc = nlp(text)  # Analyse le texte avec spaCy
+    # Analyse le texte avec fr_core_news_sm, chargé une seule fois par processus (lemmes et mots vides suffisent)
+    doc = process(text, LEMMATIZE_PROFILE)
     # Retourne le texte normalisé (lemmatisé, en minuscules, sans stopwords)
     return " ".join(token.lemma_.lower() for token in doc if not token.is_stop)
 
@@ -76,28 +77,51 @@ def normalize_text(text):
 
 
 
-def extract_text_from_pdf(pdf_path, output_folder="/var/lib/cv-classifier/output_text"):
+def _skip_oversized_pdf(pdf_path, max_bytes, report):
+    # PDF trop volumineux : ignoré sans être ouvert
+    report["bytes"] = os.path.getsize(pdf_path)
+    if max_bytes and report["bytes"] > max_bytes:
+        report["skipped"] = "max_bytes"
+        print(f"PDF ignoré ({report['bytes'] / 1048576:.1f} Mo, limite {max_bytes / 1048576:.1f} Mo) : {pdf_path}")
+        return True
+    return False
+
+
+
+def _load_stored_text(pdf_path, output_folder, backend, max_pages, text_cache, pdf_hash, report):
     """
-    Extrait le texte d'un fichier PDF et le sauvegarde dans un fichier .txt.
-    :param pdf_path: Chemin du fichier PDF à analyser
-    :param output_folder: Dossier où enregistrer le fichier texte extrait
-    :return: Texte brut extrait du PDF
+    Texte déjà extrait de ce PDF (clé : contenu du PDF, moteur et version de sa bibliothèque, limite de pages).
+
+    :return: Tuple (dossier des textes conservés, clé du PDF, texte conservé ou None)
     """
-    text = ""  # Chaîne accumulant le texte de toutes les pages
+    if not text_cache:
+        return None, None, None
+    store_folder = os.path.join(output_folder, TEXT_STORE_DIR)
+    store_key = text_store_key(pdf_hash or sha256_file(pdf_path), backend, max_pages)
+    stored = load_stored_pages(store_folder, store_key)
+    report["text_cache"] = stored is not None
+    if stored is not None:
+        print(f"Texte déjà extrait réutilisé pour : {os.path.basename(pdf_path)}")
+    return store_folder, store_key, stored
+
 
-    # Parcours chaque page du PDF pour récupérer le texte
-    with pdfplumber.open(pdf_path) as pdf:
-        for page in pdf.pages:
-            page_text = page.extract_text()
-            if page_text:
-                text += page_text + "\n"  # Ajoute un saut de ligne entre les pages
+
+def _save_extracted_text(pdf_path, output_folder, text, pages_read, max_chars, report):
+    """
+    Note les limites atteintes dans 'report' puis sauvegarde le texte (déjà tronqué à 'max_chars') dans un fichier .txt.
+    """
+    truncated = []
+    if report["pages"] > pages_read:
+        truncated.append("max_pages")
+    if max_chars and report["chars"] > max_chars:
+        truncated.append("max_chars")
+    if truncated:
+        report["truncated"] = truncated
+        print(f"Texte tronqué ({report['pages']} pages, {report['chars']} caractères ; limites : {', '.join(truncated)}) : {pdf_path}")
 
     # Assure l’existence du dossier de sortie
     os.makedirs(output_folder, exist_ok=True)
 
-    # Normalise le texte (suppression stopwords, passage en minuscules, etc.)
-    normalize_text(text)
-
     # Génère le nom du fichier texte à partir du PDF d’origine
     txt_filename = os.path.splitext(os.path.basename(pdf_path))[0] + ".txt"
     txt_path = os.path.join(output_folder, txt_filename)
@@ -107,10 +131,100 @@ def extract_text_from_pdf(pdf_path, output_folder="/var/lib/cv-classifier/output
         txt_file.write(text)
 
     print(f"Texte extrait sauvegardé dans : {txt_path}")
+
+
+
+def extract_text_from_pdf(pdf_path, output_folder="/var/lib/cv-classifier/output_text", backend=DEFAULT_PDF_BACKEND,
+                          page_jobs=DEFAULT_PAGE_JOBS, max_bytes=DEFAULT_MAX_BYTES, max_pages=DEFAULT_MAX_PAGES,
+                          max_chars=DEFAULT_MAX_CHARS, report=None, text_cache=True, text_compression=None, pdf_hash=None):
+    """
+    Extrait le texte d'un fichier PDF et le sauvegarde dans un fichier .txt.
+    :param pdf_path: Chemin du fichier PDF à analyser
+    :param output_folder: Dossier où enregistrer le fichier texte extrait
+    :param backend: Moteur d'extraction ("pdfplumber", "pymupdf", "pypdfium2", "pdfminer" ou "fast") ;
+                    un autre moteur est essayé s'il ne trouve aucun texte
+    :param page_jobs: Nombre de processus se partageant les pages des longs PDF (1 : extraction séquentielle)
+    :param max_bytes: Taille maximale du PDF, au-delà il est ignoré (None : aucune limite)
+    :param max_pages: Nombre maximal de pages extraites (None : aucune limite)
+    :param max_chars: Nombre maximal de caractères du texte retourné (None : aucune limite)
+    :param report: Dictionnaire complété avec la taille, le nombre de pages et de caractères du PDF,
+                   et les limites atteintes : "skipped" (PDF ignoré) ou "truncated" (texte tronqué)
+    :param text_cache: Réutilise le texte déjà extrait de ce PDF (même contenu, même moteur) au lieu de le ré-extraire
+    :param text_compression: Compression des textes conservés (None, "gzip" ou "zstd")
+    :param pdf_hash: Empreinte SHA-256 du PDF si elle est déjà calculée (ex : cache des résultats)
+    :return: Texte brut extrait du PDF (vide si le PDF est ignoré)
+    """
+    report = {} if report is None else report
+    if _skip_oversized_pdf(pdf_path, max_bytes, report):
+        return ""
+
+    store_folder, store_key, stored = _load_stored_text(pdf_path, output_folder, backend, max_pages, text_cache, pdf_hash, report)
+    if stored is not None:
+        pages, report["pages"] = stored["pages"], stored["page_count"]
+    else:
+        pages, backend_used, report["pages"] = extract_pages(pdf_path, backend, page_jobs=page_jobs, max_pages=max_pages)
+        if text_cache:
+            store_pages(store_folder, store_key, {"pages": pages, "page_count": report["pages"], "backend": backend_used},
+                        text_compression)
+
+    # Texte de chaque page, suivi d'un saut de ligne entre les pages (pages vides ignorées)
+    text = "".join(page_text + "\n" for page_text in pages if page_text)
+    report["chars"] = len(text)
+    if max_chars:
+        text = text[:max_chars]
+
+    _save_extracted_text(pdf_path, output_folder, text, len(pages), max_chars, report)
     return text
 
 
 
+def stream_text_from_pdf(pdf_path, output_folder="/var/lib/cv-classifier/output_text", backend=DEFAULT_PDF_BACKEND,
+                         page_jobs=None, max_bytes=DEFAULT_MAX_BYTES, max_pages=DEFAULT_MAX_PAGES,
+                         max_chars=DEFAULT_MAX_CHARS, report=None, text_cache=True, text_compression=None, pdf_hash=None):
+    """
+    Variante de extract_text_from_pdf qui produit le texte page par page, dès que chaque page est extraite :
+    mis bout à bout, les morceaux produits forment exactement le texte retourné par extract_text_from_pdf.
+
+    None est produit lorsque le moteur échoue après avoir produit du texte : les morceaux reçus jusque-là
+    doivent être oubliés, le texte est ensuite produit à nouveau par un autre moteur.
+
+    Les paramètres sont ceux de extract_text_from_pdf ; 'page_jobs' est ignoré (pages extraites dans l'ordre).
+    """
+    report = {} if report is None else report
+    if _skip_oversized_pdf(pdf_path, max_bytes, report):
+        return
+
+    store_folder, store_key, stored = _load_stored_text(pdf_path, output_folder, backend, max_pages, text_cache, pdf_hash, report)
+    info = {}
+    pages = stored["pages"] if stored is not None else stream_pages(pdf_path, backend, max_pages, info)
+
+    pieces, length = [], 0
+    for page_text in pages:
+        if page_text is None:
+            pieces, length = [], 0
+            yield None
+            continue
+        if not page_text:
+            continue
+        # Morceau de la page, tronqué à la limite de caractères du texte complet
+        piece = page_text + "\n"
+        if max_chars and length + len(piece) > max_chars:
+            piece = piece[:max(0, max_chars - length)]
+        length += len(page_text) + 1
+        if piece:
+            pieces.append(piece)
+            yield piece
+
+    if stored is not None:
+        info = {"pages": stored["pages"], "page_count": stored["page_count"]}
+    elif text_cache:
+        store_pages(store_folder, store_key, {"pages": info["pages"], "page_count": info["page_count"], "backend": info["backend"]},
+                    text_compression)
+    report["pages"], report["chars"] = info["page_count"], length
+    _save_extracted_text(pdf_path, output_folder, "".join(pieces), len(info["pages"]), max_chars, report)
+
+
+
 # *************************************************************************** # 
 # --- SAUVEGARDE DES DONNÉES ( FORMAT -> JSON ) SI PROBABILITÉ SUFFISANTE --- # 
 # *************************************************************************** # 
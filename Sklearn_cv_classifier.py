@@ -26,9 +26,15 @@
 import os
 import joblib
 import re
-import spacy
+from spacy.lang.fr.stop_words import STOP_WORDS as STOPWORDS
 from unidecode import unidecode
 
+# --- Registre des modèles, chargés à leur première utilisation ---
+from Model_registry import get_model, register_model, CV_CLASSIFIER_MODEL, CV_CLASSIFIER_MODEL_PATH
+
+# --- Accès unique aux modèles spaCy et profils de composants (tokenizer seul pour le prétraitement) ---
+from Nlp_resources import pipe, TOKENIZE_PROFILE
+
 # --- Bibliothèque numérique pour calculs vectoriels et manipulation de données ---
 import numpy as np
 
@@ -48,14 +54,25 @@ from sklearn.metrics import classification_report
 
 
 
-# ***************************************** # 
-# --- Chargement du modèle linguistique --- # 
-# ***************************************** # 
+# ********************************* # 
+# --- Chargement du classifieur --- # 
+# ********************************* # 
+
 
 
+# --- Nom du classifieur dans le registre (un modèle par fichier .pkl) ---
+def classifier_model_name(model_path):
+    if model_path == CV_CLASSIFIER_MODEL_PATH:
+        return CV_CLASSIFIER_MODEL
+    return f"{CV_CLASSIFIER_MODEL}:{model_path}"
 
-nlp = spacy.load("fr_core_news_md")
-STOPWORDS = spacy.lang.fr.stop_words.STOP_WORDS
+
+
+# --- Chargement du classifieur (modèle, vectorizer, binarizer), gardé en cache entre deux prédictions ---
+def load_cv_classifier(model_path=CV_CLASSIFIER_MODEL_PATH):
+    name = classifier_model_name(model_path)
+    register_model(name, lambda: joblib.load(model_path))
+    return get_model(name)
 
 
 
@@ -76,9 +93,8 @@ def normalize(text):
 # --- Prétraitement de chaque texte avant vectorisation (applique le tokenizer) ---
 def preprocess_texts(texts):
     processed = []
-    for text in texts:
-        text = normalize(text)
-        doc = nlp(text)
+    # Seuls les tokens sont utilisés : le tokenizer suffit, sans exécuter le reste du pipeline
+    for doc in pipe((normalize(text) for text in texts), TOKENIZE_PROFILE):
         #lemmatized = [token.lemma_ for token in doc if token.lemma_ not in STOPWORDS and not token.is_punct and not token.is_space]
         tokens = [token.text for token in doc if token.text.lower() not in STOPWORDS and not token.is_punct and not token.is_space]
         #processed.append(" ".join(lemmatized))
@@ -139,7 +155,7 @@ def load_corpus_from_file(filename="/var/lib/cv-classifier/data/cv_corpus.txt"):
 
 
 # --- Entraînement d’un classifieur SVM multi-label sur un corpus de CV ---
-def train_model(corpus_file="/var/lib/cv-classifier/data/cv_corpus.txt", model_path="/var/lib/cv-classifier/data/models/cv_classifier_model.pkl"):
+def train_model(corpus_file="/var/lib/cv-classifier/data/cv_corpus.txt", model_path=CV_CLASSIFIER_MODEL_PATH):
     """
     Entraîne un modèle SVM pour classifier les CV en plusieurs domaines.
 
@@ -185,6 +201,9 @@ def train_model(corpus_file="/var/lib/cv-classifier/data/cv_corpus.txt", model_p
     joblib.dump((model, vectorizer, mlb), model_path)
     print(f"Modèle sauvegardé sous {model_path}")
 
+    # Le classifieur éventuellement gardé en cache par le registre est désormais obsolète
+    register_model(classifier_model_name(model_path), lambda: joblib.load(model_path), replace=True)
+
     return model, vectorizer, mlb
 
 
@@ -195,14 +214,14 @@ def train_model(corpus_file="/var/lib/cv-classifier/data/cv_corpus.txt", model_p
 
 
 
-def predict_cv_domain(cv_text, model_path="/var/lib/cv-classifier/data/models/cv_classifier_model.pkl", top_n=3):
+def predict_cv_domain(cv_text, model_path=CV_CLASSIFIER_MODEL_PATH, top_n=3):
     """
     Prédit les domaines les plus probables d'un candidat selon son CV.
     """
     # Vérification et chargement du modèle existant
     if not os.path.exists(model_path):
         raise FileNotFoundError("Modèle non trouvé. Entraînez d'abord le modèle avec train_model().")
-    model, vectorizer, mlb = joblib.load(model_path)
+    model, vectorizer, mlb = load_cv_classifier(model_path)
 
     # Prétraitement et vectorisation du texte unique
     processed_text = preprocess_texts([cv_text])
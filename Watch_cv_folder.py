@@ -0,0 +1,324 @@
+# /**************************************************************************************************************************************************************************************
+# Nom du fichier : Watch_cv_folder.py
+# Rôle du fichier : Ce fichier surveille le dossier des CV à traiter et analyse chaque nouveau CV (ou CV modifié) dès qu'il est complètement écrit, sans re-parcourir tout le dossier.
+
+# Auteur : Maxime BRONNY
+# Version : V1
+# Licence : Réalisé dans le cadre des cours "Fouille de données, Ingéniérie des langues, Développement logiciel libre, IA & Apprentisage" L3 INFORMATIQUE IED
+# Usage : Un paquetage a été mit en place pour l'utiliser veuillez utiliser dans un système debian la commande suivante :
+#           - INSTALLATION DU PAQUET GÉNÉRÉ
+#               - sudo apt install ./cv-classifier_1.0-1_all.deb
+
+#           Puis exécute ton programme avec :
+#               - cv-classifier
+# ***************************************************************************************************************************************************************************************/
+
+
+
+# ******************************************************************* # 
+# --- LIBRAIRIES UTILISÉES POUR LA SURVEILLANCE DU DOSSIER DES CV --- # 
+# ******************************************************************* # 
+
+
+
+import os          # Parcours du dossier et informations sur les fichiers
+import json        # Fichier d'état des CV déjà traités
+import time        # Attente entre deux vérifications du dossier
+import argparse    # Interface en ligne de commande
+
+# --- Notifications du noyau (inotify), facultatives : à défaut le dossier est scruté périodiquement ---
+try:
+    from inotify_simple import INotify, flags as inotify_flags
+except ImportError:
+    INotify = None
+
+
+
+# ************************************* # 
+# --- PARAMÈTRES DE LA SURVEILLANCE --- # 
+# ************************************* # 
+
+
+
+# Dossier surveillé par défaut
+DEFAULT_WATCH_FOLDER = "CV_A_TRAITER"
+
+# Nom du fichier d'état, placé dans le dossier surveillé
+STATE_FILENAME = ".cv_watch_state.json"
+
+# Durée (en secondes) pendant laquelle taille et date de modification doivent rester inchangées
+# avant qu'un PDF soit considéré comme complètement écrit
+DEFAULT_SETTLE_SECONDS = 2.0
+
+# Intervalle (en secondes) entre deux parcours du dossier lorsque inotify n'est pas disponible
+DEFAULT_POLL_INTERVAL = 2.0
+
+
+
+# ******************************** # 
+# --- ÉTAT DES CV DÉJÀ TRAITÉS --- # 
+# ******************************** # 
+
+
+
+def file_signature(path):
+    """
+    Signature d'un fichier (taille, date de modification), ou None s'il a disparu.
+    """
+    try:
+        stat = os.stat(path)
+    except OSError:
+        return None
+    return [stat.st_size, stat.st_mtime_ns]
+
+
+
+def load_state(state_path):
+    """
+    Charge l'état { nom du PDF : { "signature": [...], "error": ... } } des CV déjà traités.
+    """
+    try:
+        with open(state_path, "r", encoding="utf-8") as file:
+            return json.load(file)
+    except FileNotFoundError:
+        return {}
+    except ValueError:
+        print(f"Fichier d'état illisible, il sera recréé : {state_path}")
+        return {}
+
+
+
+def save_state(state, state_path):
+    """
+    Enregistre l'état de manière atomique : un arrêt brutal ne laisse jamais un fichier à moitié écrit.
+    """
+    temporary_path = state_path + ".tmp"
+    with open(temporary_path, "w", encoding="utf-8") as file:
+        json.dump(state, file, ensure_ascii=False, indent=2)
+    os.replace(temporary_path, state_path)
+
+
+
+# ********************************************* # 
+# --- DÉTECTION DES CV NOUVEAUX OU MODIFIÉS --- # 
+# ********************************************* # 
+
+
+
+class FolderWatcher:
+    """
+    Détecte les PDF nouveaux ou modifiés d'un dossier et ne les signale qu'une fois stables :
+    un fichier en cours de copie change de taille ou de date et reste donc en attente.
+    """
+
+    def __init__(self, folder, state, settle_seconds=DEFAULT_SETTLE_SECONDS):
+        self.folder = folder
+        self.state = state
+        self.settle_seconds = settle_seconds
+        self.pending = {}   # { nom du PDF : (signature, instant où elle a été observée) }
+
+    def scan(self):
+        """
+        Parcourt le dossier et retourne la liste des PDF prêts à être traités.
+        Les PDF supprimés sont retirés de l'état.
+        """
+        now = time.monotonic()
+        present = set()
+        ready = []
+
+        for filename in sorted(os.listdir(self.folder)):
+            if not filename.endswith(".pdf"):
+                continue
+            present.add(filename)
+            signature = file_signature(os.path.join(self.folder, filename))
+            if signature is None:
+                continue
+
+            # Déjà traité (avec succès ou non) et inchangé depuis
+            if self.state.get(filename, {}).get("signature") == signature:
+                self.pending.pop(filename, None)
+                continue
+
+            previous = self.pending.get(filename)
+            if previous is None or previous[0] != signature:
+                self.pending[filename] = (signature, now)
+            elif now - previous[1] >= self.settle_seconds:
+                ready.append(filename)
+
+        for filename in set(self.pending) - present:
+            del self.pending[filename]
+        for filename in set(self.state) - present:
+            del self.state[filename]
+
+        return ready
+
+    def mark_processed(self, filenames, error=None):
+        for filename in filenames:
+            signature, _ = self.pending.pop(filename)
+            self.state[filename] = {"signature": signature, "processed_at": time.time(), "error": error}
+
+
+
+# *********************************************** # 
+# --- ATTENTE DES CHANGEMENTS DANS LE DOSSIER --- # 
+# *********************************************** # 
+
+
+
+class _InotifyWaiter:
+    """
+    Attend une notification du noyau : aucun parcours du dossier tant que rien n'y arrive.
+    """
+
+    def __init__(self, folder):
+        self.inotify = INotify()
+        watch_flags = (inotify_flags.CREATE | inotify_flags.CLOSE_WRITE | inotify_flags.MODIFY
+                       | inotify_flags.MOVED_TO | inotify_flags.MOVED_FROM | inotify_flags.DELETE)
+        self.inotify.add_watch(folder, watch_flags)
+
+    def wait(self, timeout):
+        # timeout=None : bloque jusqu'au prochain événement
+        self.inotify.read(timeout=None if timeout is None else int(timeout * 1000))
+
+
+
+class _PollingWaiter:
+    """
+    Repli sans inotify : attend simplement l'intervalle de scrutation.
+    """
+
+    def __init__(self, poll_interval):
+        self.poll_interval = poll_interval
+
+    def wait(self, timeout):
+        time.sleep(self.poll_interval if timeout is None else min(timeout, self.poll_interval))
+
+
+
+# ****************************** # 
+# --- BOUCLE DE SURVEILLANCE --- # 
+# ****************************** # 
+
+
+
+def _process_ready_files(main, folder, ready, options):
+    """
+    Analyse les PDF 'ready' de 'folder' et retourne { nom du PDF : message d'erreur } pour ceux en échec.
+    Les erreurs propres à un CV sont renvoyées par main.process_cv_files ; si le traitement entier échoue,
+    chaque PDF est ré-analysé seul pour ne marquer en échec que ceux qui en sont la cause.
+    """
+    error_records = []
+    try:
+        main.process_cv_files([os.path.join(folder, filename) for filename in ready], error_records=error_records, **options)
+    except Exception as e:
+        if len(ready) == 1:
+            print(f"Erreur lors de l'analyse : {e}")
+            return {ready[0]: str(e)}
+        errors = {}
+        for filename in ready:
+            errors.update(_process_ready_files(main, folder, [filename], options))
+        return errors
+    return {os.path.basename(record["cv"]): record["error"] for record in error_records}
+
+
+
+def watch_folder(folder=DEFAULT_WATCH_FOLDER, state_path=None, settle_seconds=DEFAULT_SETTLE_SECONDS,
+                 poll_interval=DEFAULT_POLL_INTERVAL, use_inotify=True, prewarm_models=True, once=False, **options):
+    """
+    Surveille 'folder' et analyse chaque PDF nouveau ou modifié avec main.process_cv_files.
+
+    :param state_path: Fichier d'état (par défaut .cv_watch_state.json dans le dossier surveillé) ;
+                       au redémarrage, les CV inchangés qu'il référence ne sont pas ré-analysés
+    :param settle_seconds: Délai de stabilité avant de traiter un fichier en cours d'écriture
+    :param poll_interval: Intervalle de scrutation quand inotify n'est pas utilisé
+    :param use_inotify: Utilise inotify si le module inotify_simple est installé
+    :param prewarm_models: Pré-charge les modèles en arrière-plan pendant l'attente du premier CV
+    :param once: Traite les CV en attente puis s'arrête (sans surveiller la suite)
+    :param options: Paramètres de main.process_cv_files (batch_size, jobs, cache_path...)
+    """
+    # L'import de main est léger : les modèles sont chargés par Model_registry
+    import main
+    from Model_registry import prewarm
+
+    state_path = state_path or os.path.join(folder, STATE_FILENAME)
+    watcher = FolderWatcher(folder, load_state(state_path), settle_seconds)
+
+    if use_inotify and INotify is not None:
+        waiter = _InotifyWaiter(folder)
+        print(f"Surveillance du dossier {folder} (inotify)")
+    else:
+        waiter = _PollingWaiter(poll_interval)
+        print(f"Surveillance du dossier {folder} (scrutation toutes les {poll_interval:g} s)")
+
+    if prewarm_models and not once:
+        prewarm(background=True)
+
+    while True:
+        ready = watcher.scan()
+
+        if ready:
+            print(f"\n{len(ready)} CV à analyser : {', '.join(ready)}")
+            errors = _process_ready_files(main, folder, ready, options)
+            # Seuls les CV en échec sont marqués comme tels : ils ne sont pas retentés tant qu'ils ne sont pas modifiés
+            watcher.mark_processed([filename for filename in ready if filename not in errors])
+            for filename, error in errors.items():
+                watcher.mark_processed([filename], error=error)
+            save_state(watcher.state, state_path)
+            continue
+
+        if once and not watcher.pending:
+            save_state(watcher.state, state_path)
+            return
+
+        # Un fichier en attente de stabilité impose un réveil ; sinon on attend le prochain événement
+        waiter.wait(settle_seconds if watcher.pending else None)
+
+
+
+# *********************************** # 
+# --- POINT D'ENTRÉE DU PROGRAMME --- # 
+# *********************************** # 
+
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Analyse les CV dès leur arrivée dans le dossier surveillé.")
+    parser.add_argument("folder", nargs="?", default=DEFAULT_WATCH_FOLDER, help="Dossier des CV au format PDF")
+    parser.add_argument("--state", help="Fichier d'état des CV déjà traités")
+    parser.add_argument("--settle", type=float, default=DEFAULT_SETTLE_SECONDS, help="Délai de stabilité d'un fichier avant son analyse (s)")
+    parser.add_argument("--poll-interval", type=float, default=DEFAULT_POLL_INTERVAL, help="Intervalle de scrutation sans inotify (s)")
+    parser.add_argument("--no-inotify", action="store_true", help="Scrute le dossier périodiquement au lieu d'utiliser inotify")
+    parser.add_argument("--no-prewarm", action="store_true", help="Ne pré-charge pas les modèles au démarrage")
+    parser.add_argument("--once", action="store_true", help="Traite les CV nouveaux ou modifiés puis s'arrête")
+    parser.add_argument("--batch-size", type=int, help="Nombre de CV annotés ensemble")
+    parser.add_argument("--jobs", type=int, help="Nombre de processus de travail traitant les lots en parallèle")
+    parser.add_argument("--no-cache", action="store_true", help="Ré-analyse les CV sans lire ni écrire le cache")
+    parser.add_argument("--pdf-backend", help="Moteur d'extraction du texte des PDF (pdfplumber, pymupdf, pypdfium2, pdfminer ou fast)")
+    parser.add_argument("--trace", metavar="FICHIER", help="Fichier JSONL recevant la trace (temps par étape) de chaque CV")
+    args = parser.parse_args()
+
+    options = {}
+    if args.batch_size:
+        options["batch_size"] = args.batch_size
+    if args.jobs:
+        options["jobs"] = args.jobs
+    if args.no_cache:
+        options["cache_path"] = None
+    if args.pdf_backend:
+        options["pdf_options"] = {"backend": args.pdf_backend}
+    if args.trace:
+        options["trace_path"] = args.trace
+
+    try:
+        watch_folder(
+            args.folder,
+            state_path=args.state,
+            settle_seconds=args.settle,
+            poll_interval=args.poll_interval,
+            use_inotify=not args.no_inotify,
+            prewarm_models=not args.no_prewarm,
+            once=args.once,
+            **options
+        )
+    except KeyboardInterrupt:
+        print("\nSurveillance arrêtée.")
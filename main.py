@@ -24,25 +24,51 @@
 # --- Librairies standard pour gestion de chaînes et fichiers ---
 import re
 import os
+import gc
+import queue
+import argparse
+import threading
+import multiprocessing
+from collections import namedtuple
 
 # --- Librairies lié a la normalisation et lemmatisation ---
 from unidecode import unidecode
-import spacy
 
 # --- Comparaison floue de chaînes pour correction/ajustement de textes ---
-from rapidfuzz import fuzz, process
+from rapidfuzz import fuzz
+from Fuzzy_correction import FuzzyCorrector
+from Ngram_index import DEFAULT_INDEX_DIR, load_esco_skills, load_esco_occupations
 
-# --- Composants NLP Flair pour création et annotation de phrases ---
-from flair.data import Sentence
-from flair.models import SequenceTagger
-from pathlib import Path
+# --- Recherche de tous les termes connus d'un dictionnaire en un seul parcours (Aho-Corasick) ---
+from Gazetteer import Gazetteer
+
+# --- Extraction des emails, téléphones et langues en un seul parcours (motif combiné) ---
+from Regex_scanner import CVFieldScanner
+
+# --- Registre des modèles NLP/NER, chargés à leur première utilisation ---
+from Model_registry import get_model, prewarm, print_model_report, memory_breakdown
+from Model_registry import FLAIR_GENERIC_MODEL, FLAIR_FINETUNED_MODEL, SPACY_SMALL_MODEL, SPACY_BLANK_MODEL, CV_CLASSIFIER_MODEL
+
+# --- Lemmatisation par lots avec cache des expressions déjà lemmatisées ---
+from Lemmatization_service import get_lemmatizer
 
 # --- Fonctions de segmentation de PDF et export en JSON/CSV ---
-from Segmentation_cv_json_csv import extract_text_from_pdf, save_as_json, save_as_csv, extract_sections
+from Segmentation_cv_json_csv import extract_text_from_pdf, stream_text_from_pdf, save_as_json, save_as_csv, extract_sections
+
+# --- Moteurs d'extraction du texte des PDF (pdfplumber par défaut, moteurs rapides facultatifs) ---
+from Pdf_backends import (PDF_BACKENDS, DEFAULT_PDF_BACKEND, DEFAULT_PAGE_JOBS, TEXT_NEUTRAL_OPTIONS, DEFAULT_MAX_BYTES,
+                          DEFAULT_MAX_PAGES, DEFAULT_MAX_CHARS, resolve_backend, backend_version, extract_pages)
 
 # --- Prédiction du domaine de CV via un classifieur Sklearn ---
 from Sklearn_cv_classifier import predict_cv_domain
 
+# --- Cache persistant des résultats, indexé par le contenu des PDF et les versions des modèles ---
+from Model_registry import FLAIR_FINETUNED_MODEL_PATH, CV_CLASSIFIER_MODEL_PATH
+from Result_cache import DEFAULT_CACHE_PATH, get_cache, sha256_file, sha256_text, file_fingerprint, package_version, combine_fingerprints
+
+# --- Mesure du temps de chaque étape de l'analyse et trace détaillée optionnelle ---
+from Instrumentation import CVTrace, measure_batch, share_batch_stage, set_verbose, write_trace_records, print_stage_summary
+
 
 
 # ************************************************* # 
@@ -51,24 +77,16 @@ from Sklearn_cv_classifier import predict_cv_domain
 
 
 
-# --- Variables globales pour les taggers Flair ---
-global tagger, taggerEXPERIENCE
-
-# --- Chargement du modèle NER français générique ---
-print("\nChargement du modèle Flair/ner-french... \n")
-tagger = SequenceTagger.load("flair/ner-french")
-
-# --- Chargement du modèle NER personnalisé pour l'extraction d'expériences ---
-print("\nChargement du modèle local : flair_ner_model/best-model.pt\n")
-# Construire un chemin absolu vers le fichier best-model.pt
-model_path = Path(__file__).resolve().parent / "data/models/flair_ner_model/best-model.pt"
+# Les modèles ne sont plus chargés à l'import : Model_registry les charge à leur première
+# utilisation puis les garde en cache pour toute la durée de vie du processus.
 
-# Charger le modèle local correctement
-taggerEXPERIENCE = SequenceTagger.load(str(model_path))
+# --- Modèle NER français générique (flair/ner-french) ---
+def get_tagger():
+    return get_model(FLAIR_GENERIC_MODEL)
 
-# Chargement du modèle spacy pour lemmatisation
-print("\nChargement du modèle local pour la lemmatisation : fr_core_news_sm\n")
-nlp = spacy.load("fr_core_news_sm")
+# --- Modèle NER personnalisé pour l'extraction d'expériences (best-model.pt) ---
+def get_tagger_experience():
+    return get_model(FLAIR_FINETUNED_MODEL)
 
 
 
@@ -125,6 +143,12 @@ KNOWN_EXPERIENCES = {
 
 
 
+# Ajoute aux deux ensembles précédents les libellés ESCO (compétences et métiers) produits par
+# ESCO/ESCO_end2end_build.py ; la correction passe alors par un index de trigrammes enregistré dans data/index
+USE_ESCO_VOCABULARY = False
+
+
+
 # Liste des langues supportées ( A COMPLÉTER )
 LANGUAGES = {
     "français", "anglais", "espagnol", "allemand", "italien", "portugais", "néerlandais",
@@ -151,15 +175,48 @@ PHONE_PATTERN = r"(?:\+33|0)\s?[1-9](?:[\s.-]?\d{2}){4}"
 
 
 
+# ********************************************* # 
+# --- PARAMÈTRES DU TRAITEMENT PAR LOTS NER --- # 
+# ********************************************* # 
+
+
+
+# Nombre de CV dont le texte est extrait puis annoté ensemble par les taggers Flair
+DEFAULT_BATCH_SIZE = 16
+
+# Nombre de phrases envoyées simultanément au BiLSTM lors d'un appel à predict()
+DEFAULT_MINI_BATCH_SIZE = 32
+
+# Longueur maximale (en caractères) d'une ligne avant son découpage en phrases
+DEFAULT_MAX_CHUNK_CHARS = 300
+
+# Fin de phrase utilisée pour découper les lignes trop longues
+SENTENCE_BOUNDARY_PATTERN = re.compile(r"(?<=[.!?;])\s+")
+
+
+
 # ***************************************************** # 
 # --- EXTRACTION DES EMAILS ET NUMEROS DE TELEPHONE --- # 
 # ***************************************************** # 
 
 
+# Motifs des champs compilés une seule fois en un motif combiné (emails, téléphones, langues)
+CV_FIELD_SCANNER = CVFieldScanner(EMAIL_PATTERN, PHONE_PATTERN, LANGUAGES, LANGUAGE_LEVELS)
+
+
+
+# Parcours unique du texte : les champs trouvés sont partagés par les fonctions d'extraction
+def scan_cv_fields(text):
+    return CV_FIELD_SCANNER.scan_by_kind(text)
+
+
+
 # Extraction des emails et numéros de téléphone via regex 
-def extract_emails_phones_ReGex(text):
-    emails = re.findall(EMAIL_PATTERN, text)
-    phones = re.findall(PHONE_PATTERN, text)
+def extract_emails_phones_ReGex(text, fields=None):
+    if fields is None:
+        fields = scan_cv_fields(text)
+    emails = [match.text for match in fields["email"]]
+    phones = [match.text for match in fields["phone"]]
     return {"Emails": emails, "Téléphone": list(set(phones))}
 
 
@@ -168,9 +225,9 @@ def extract_emails_phones_ReGex(text):
 # ************************************** # 
 
 
-# Fonction de lemmatisation
+# Fonction de lemmatisation (service partagé : pipes inutiles désactivés, résultats en cache)
 def lemmatize(text):
-    return " ".join([token.lemma_ for token in nlp(text)])
+    return get_lemmatizer(SPACY_SMALL_MODEL).lemmatize(text)
 
 # Fonction de normalisation
 def normalize(text):
@@ -181,39 +238,166 @@ def normalize(text):
 
 
 
+# **************************************************************************************** # 
+# --- REPRÉSENTATION D'UN CV TOKENISÉE UNE SEULE FOIS ET PARTAGÉE PAR LES DEUX TAGGERS --- # 
+# **************************************************************************************** # 
+
+
+
+# Types de labels sous lesquels chaque tagger range ses annotations dans la représentation partagée
+GENERIC_LABEL_TYPE   = "ner_generique"
+FINETUNED_LABEL_TYPE = "ner_finetune"
+
+# Entité annotée, avec ses positions de début et de fin dans le texte complet du CV
+EntitySpan = namedtuple("EntitySpan", ["text", "tag", "start", "end"])
+
+
+
+# --- Découpage du texte d'un CV en lignes / phrases courtes avant l'annotation NER ---
+def chunk_cv_text(text, max_chunk_chars=DEFAULT_MAX_CHUNK_CHARS):
+    """
+    Découpe le texte extrait d'un PDF en segments courts pour le NER.
+
+    Le texte est découpé ligne par ligne (les pages sont elles-mêmes séparées par '\\n'
+    dans extract_text_from_pdf), puis les lignes plus longues que 'max_chunk_chars'
+    sont redécoupées en phrases. Les segments vides sont ignorés.
+
+    :return: Liste de tuples (position du segment dans le texte, texte du segment)
+    """
+    chunks = []
+
+    for line_match in re.finditer(r"[^\n]+", text):
+        line, line_start = line_match.group(), line_match.start()
+
+        # Positions de début/fin des morceaux de la ligne
+        if len(line) <= max_chunk_chars:
+            pieces = [(0, len(line))]
+        else:
+            pieces, piece_start = [], 0
+            for boundary in SENTENCE_BOUNDARY_PATTERN.finditer(line):
+                pieces.append((piece_start, boundary.start()))
+                piece_start = boundary.end()
+            pieces.append((piece_start, len(line)))
+
+        for start, end in pieces:
+            piece = line[start:end]
+            stripped = piece.strip()
+            if stripped:
+                offset = line_start + start + len(piece) - len(piece.lstrip())
+                chunks.append((offset, stripped))
+
+    return chunks
+
+
+
+class CVAnalysis:
+    """
+    Analyse d'un CV : le texte est découpé en segments (chunk_cv_text) tokenisés une seule fois
+    dans des phrases Flair, que les deux taggers (générique et fine-tuné) annotent chacun sous leur propre
+    type de label.
+    """
+
+    def __init__(self, text, max_chunk_chars=DEFAULT_MAX_CHUNK_CHARS):
+        self.text, self.chunks, self.sentences = "", [], []
+        self.max_chunk_chars = max_chunk_chars
+        self.extend(text)
+
+    def extend(self, text):
+        """
+        Ajoute 'text' à la fin du texte analysé (ex : page suivante, terminée par un saut de ligne) :
+        le découpage en lignes étant indépendant d'une ligne à l'autre, les segments obtenus sont
+        ceux du texte complet. Retourne les nouvelles phrases, à annoter.
+        """
+        # Import local : Flair (et torch) ne sont importés que lorsqu'un CV est réellement analysé
+        from flair.data import Sentence
+
+        offset = len(self.text)
+        chunks = [(offset + start, chunk_text) for start, chunk_text in chunk_cv_text(text, self.max_chunk_chars)]
+        sentences = [Sentence(chunk_text) for _, chunk_text in chunks]
+        self.text += text
+        self.chunks.extend(chunks)
+        self.sentences.extend(sentences)
+        return sentences
+
+    def spans(self, label_type):
+        """
+        Retourne la liste des entités (EntitySpan) annotées sous 'label_type',
+        dans l'ordre du document et avec des positions relatives au texte complet.
+        """
+        return [
+            EntitySpan(
+                span.text,
+                span.get_label(label_type).value,
+                offset + span.start_position,
+                offset + span.end_position
+            )
+            for (offset, _), sentence in zip(self.chunks, self.sentences)
+            for span in sentence.get_spans(label_type)
+        ]
+
+    def spans_by_tag(self, label_type, tags=()):
+        """
+        Regroupe les textes des entités annotées sous 'label_type' par tag.
+        Les tags de 'tags' sont toujours présents dans le dictionnaire, même vides.
+        """
+        grouped = {tag: [] for tag in tags}
+        for span in self.spans(label_type):
+            grouped.setdefault(span.tag, []).append(span.text)
+        return grouped
+
+
+
 # *************************************************************************************************************** # 
 # --- FONCTION POUR EXTRAIRE LES EXPERIENCES & DIPLÔMES AINSI QUE LES COMPÉTENCES A L'AIDE DU MODÈLE ENTRAINÉ --- # 
 # *************************************************************************************************************** # 
 
 
 
+# Types d'entités présents dans le dictionnaire de tags du modèle fine-tuné
+FINETUNED_ENTITY_TYPES = ("EXPERIENCE", "DIPLOME", "COMPETENCE", "ORG", "DUREE", "DATE", "LOC")
+
+
+
+# Extraction de toutes les entités du modèle fine-tuné en un seul passage
+def extract_finetuned_entities(text, taggerEXPERIENCE=None, analysis=None):
+    """
+    Annote le texte une seule fois avec le modèle fine-tuné et regroupe les entités par type.
+    Si 'analysis' est fournie, elle est supposée déjà annotée par le modèle fine-tuné.
+    Sans 'taggerEXPERIENCE', le modèle fine-tuné du registre est utilisé.
+
+    :return: Dictionnaire { type d'entité : liste des textes détectés }, contenant au minimum
+             toutes les clés de FINETUNED_ENTITY_TYPES
+    """
+    if analysis is None:
+        analysis = CVAnalysis(text)
+        taggerEXPERIENCE = taggerEXPERIENCE or get_tagger_experience()
+        taggerEXPERIENCE.predict(analysis.sentences, label_name=FINETUNED_LABEL_TYPE)
+
+    return analysis.spans_by_tag(FINETUNED_LABEL_TYPE, FINETUNED_ENTITY_TYPES)
+
+
+
 # Extraction des expériences et diplômes via NER Flair
-def extract_experiences_flair(text, taggerEXPERIENCE):
+def extract_experiences_flair(text, taggerEXPERIENCE=None, analysis=None, entities=None):
     """
     Extrait toutes les entités de type 'EXPERIENCE' et 'DIPLOME' d'un texte.
+    'entities' permet de réutiliser le résultat de extract_finetuned_entities().
     """
-    sentence = Sentence(text)
-    taggerEXPERIENCE.predict(sentence)
-    return [
-        entity.text
-        for entity in sentence.get_spans('ner')
-        if entity.tag in ['EXPERIENCE', 'DIPLOME']
-    ]
+    if entities is None:
+        entities = extract_finetuned_entities(text, taggerEXPERIENCE, analysis)
+    return entities["EXPERIENCE"] + entities["DIPLOME"]
 
 
 
 # Extraction des compétences via NER Flair
-def extract_competences_flair(text, taggerEXPERIENCE):
+def extract_competences_flair(text, taggerEXPERIENCE=None, analysis=None, entities=None):
     """
     Extrait toutes les entités de type 'COMPETENCE' d'un texte.
+    'entities' permet de réutiliser le résultat de extract_finetuned_entities().
     """
-    sentence = Sentence(text)
-    taggerEXPERIENCE.predict(sentence)
-    return [
-        entity.text
-        for entity in sentence.get_spans('ner')
-        if entity.tag == 'COMPETENCE'
-    ]
+    if entities is None:
+        entities = extract_finetuned_entities(text, taggerEXPERIENCE, analysis)
+    return entities["COMPETENCE"]
 
 
 
@@ -233,7 +417,8 @@ def merge_and_clean_competencies(competences):
     remove_if_part_of_phrase = {"base", "de", "niveau", "expert"}
     remove_completely = {"misc", "loc", "per", "org"}
 
-    cleaned_competencies = set()
+    # Expressions à lemmatiser, toutes envoyées ensemble au service de lemmatisation
+    to_lemmatize = []
 
     for comp in competences:
         norm = normalize(comp)
@@ -244,33 +429,41 @@ def merge_and_clean_competencies(competences):
             word = words[0]
             if word in remove_if_alone or word in remove_completely:
                 continue
-            cleaned_competencies.add(lemmatize(word))
+            to_lemmatize.append(word)
             continue
 
         # Cas 2 : expression
         filtered_words = [word for word in words if word not in remove_if_part_of_phrase and word not in remove_completely]
         cleaned = " ".join(filtered_words).strip()
         if cleaned and len(cleaned) > 1 and not re.match(r"^[^a-zA-Z0-9]+$", cleaned):
-            cleaned_competencies.add(lemmatize(cleaned))
+            to_lemmatize.append(cleaned)
 
+    cleaned_competencies = set(get_lemmatizer(SPACY_SMALL_MODEL).lemmatize_many(to_lemmatize))
     return list(cleaned_competencies)
 
 
 
 
+# Références triées une seule fois pour la correction par fuzzy matching ; elles sont comparées telles quelles
+# aux compétences normalisées (comme process.extractOne), la normalisation ne servant qu'à l'index de trigrammes
+COMPETENCE_CORRECTOR = FuzzyCorrector(
+    KNOWN_COMPETENCIES | set(load_esco_skills()) if USE_ESCO_VOCABULARY else KNOWN_COMPETENCIES,
+    scorer=fuzz.WRatio, index_processor=normalize, index_dir=DEFAULT_INDEX_DIR / "competences"
+)
+
+
+
 # --- Correction des compétences mal orthographiées par fuzzy matching ---
-def correct_misspelled_competences(detected_competencies):
-    
-    corrected = []
+def correct_misspelled_competences(detected_competencies, with_scores=False):
+    """
+    Remplace chaque compétence par la compétence connue la plus proche (seuil : 80).
+    Toutes les compétences sont comparées à toutes les références en un seul calcul.
 
-    for comp in detected_competencies:
-        comp = normalize(comp)
-        match, score, _ = process.extractOne(comp, KNOWN_COMPETENCIES)
-        if score > 80:
-            corrected.append(match)
-        else:
-            corrected.append(comp)
-    return list(set(corrected))
+    :param with_scores: Retourne aussi le détail (référence retenue et score) de chaque correction
+    """
+    corrections = COMPETENCE_CORRECTOR.correct([normalize(comp) for comp in detected_competencies])
+    corrected = list(set(correction.corrected for correction in corrections))
+    return (corrected, corrections) if with_scores else corrected
 
 
 
@@ -299,14 +492,47 @@ def merge_and_clean_locations(detected_locations):
 
 
 # --- Extraction des langues et niveaux depuis le texte ---
-def extract_languages(text):
-    lang_pattern = rf"(\b(?:{'|'.join(LANGUAGES)})\b)\s*:\s*(\b(?:{'|'.join(LANGUAGE_LEVELS)})\b)"
-    matches = re.findall(lang_pattern, text, re.IGNORECASE)
-    extracted_languages = [{"Langue": match[0].capitalize(), "Niveau": match[1].capitalize()} for match in matches]
+def extract_languages(text, fields=None):
+    if fields is None:
+        fields = scan_cv_fields(text)
+    extracted_languages = [
+        {"Langue": match.fields["language"].capitalize(), "Niveau": match.fields["level"].capitalize()}
+        for match in fields["language"]
+    ]
     return extracted_languages
 
 
 
+# ********************************************************* # 
+# --- DICTIONNAIRE DES TERMES CONNUS (AUTOMATE COMPILÉ) --- # 
+# ********************************************************* # 
+
+
+
+# Compétences (ESCO comprises si USE_ESCO_VOCABULARY), diplômes, langues et niveaux compilés en un
+# seul automate : toutes les occurrences sont trouvées en un parcours du texte normalisé
+CV_GAZETTEER = Gazetteer.from_categories({
+    "COMPETENCE": COMPETENCE_CORRECTOR.choices,
+    "DIPLOME":    DEGREES,
+    "LANGUE":     LANGUAGES,
+    "NIVEAU":     LANGUAGE_LEVELS
+})
+
+# Ajoute aux compétences Flair celles du dictionnaire trouvées directement dans le texte du CV.
+# Désactivé par défaut : à activer seulement si Accuracy_regression.py compare
+# --set main.GAZETTEER_RECALL=True ne montre aucune baisse de F1 sur le corpus de référence
+GAZETTEER_RECALL = False
+
+# Reconnaît les diplômes des formations avec le dictionnaire (mot entier, sans tenir compte de la casse ni des accents)
+# au lieu de la recherche exacte des libellés de DEGREES. Désactivé par défaut : à activer seulement si
+# Accuracy_regression.py compare --set main.GAZETTEER_DEGREES=True ne montre aucune baisse de F1
+GAZETTEER_DEGREES = False
+
+# Libellés de DEGREES recherchés tels quels dans le texte (sensible à la casse, y compris au sein d'un mot)
+DEGREE_SUBSTRING_REGEX = re.compile("|".join(re.escape(degree) for degree in sorted(DEGREES)))
+
+
+
 # ********************************************************************************************** # 
 # --- DETECTION DES FORMATIONS AU SEIN DES EXPERIENCES ET DIPLÔMES EXTRAIT A L'AIDE DE FLAIR --- # 
 # ********************************************************************************************** # 
@@ -318,10 +544,13 @@ def detect_formations_finetuning(entries):
     """
     Filtre les diplômes à partir d'une liste d'entrées.
     
-    Seuls les éléments contenant un diplôme défini dans DEGREES sont conservés.
+    Seuls les éléments contenant un diplôme défini dans DEGREES sont conservés (avec GAZETTEER_DEGREES :
+    mot entier, sans tenir compte de la casse ni des accents).
     """
     
-    return [entry for entry in entries if any(degree in entry for degree in DEGREES)]
+    if GAZETTEER_DEGREES:
+        return [entry for entry in entries if CV_GAZETTEER.contains(entry, "DIPLOME")]
+    return [entry for entry in entries if DEGREE_SUBSTRING_REGEX.search(entry)]
 
 
 
@@ -344,13 +573,13 @@ def detect_name_filter_experience(entries, names):
         split_names = n.split()
         norm_names.extend(normalize(x) for x in split_names)
 
-    result = []
-    for entry in entries:
-        norm_entry = normalize(entry)
-        if not any(name in norm_entry for name in norm_names):
-            result.append(entry)
+    # Un nom vide après normalisation (ex : "-") est contenu dans toute expérience, comme avec la recherche « name in entry »
+    if "" in norm_names:
+        return []
 
-    return result
+    # Tous les noms sont recherchés en un seul parcours de chaque expérience
+    names_gazetteer = Gazetteer.from_categories({"NOM": norm_names}, whole_words=False)
+    return [entry for entry in entries if not names_gazetteer.contains(entry)]
 
 
 
@@ -396,20 +625,26 @@ def merge_and_clean_experiences(flair_experiences):
 
 
 
+# Références triées une seule fois pour la correction des expériences (comparées telles quelles aux expériences détectées,
+# la normalisation ne servant qu'à l'index de trigrammes)
+EXPERIENCE_CORRECTOR = FuzzyCorrector(
+    KNOWN_EXPERIENCES | set(load_esco_occupations()) if USE_ESCO_VOCABULARY else KNOWN_EXPERIENCES,
+    scorer=fuzz.ratio, index_processor=normalize, index_dir=DEFAULT_INDEX_DIR / "experiences"
+)
+
+
+
 # Correction des expériences détectées par similarité fuzzy
-def correct_experiences_with_rapidfuzz(detected_experiences):
+def correct_experiences_with_rapidfuzz(detected_experiences, with_scores=False):
     """
     Ajuste les libellés d'expériences détectées en les comparant
     à une liste de références connues (seuil de ressemblance : 80).
+
+    :param with_scores: Retourne aussi le détail (référence retenue et score) de chaque correction
     """
-    corrected_experiences = []
-    for exp in detected_experiences:
-        match, score, _ = process.extractOne(exp, KNOWN_EXPERIENCES, scorer=fuzz.ratio)
-        if score > 80:
-            corrected_experiences.append(match)
-        else:
-            corrected_experiences.append(exp)
-    return list(set(corrected_experiences))
+    corrections = EXPERIENCE_CORRECTOR.correct(detected_experiences)
+    corrected_experiences = list(set(correction.corrected for correction in corrections))
+    return (corrected_experiences, corrections) if with_scores else corrected_experiences
 
 
 
@@ -449,18 +684,230 @@ def clean_names_with_blacklist(names):
 
 
 
+# ********************************************************** # 
+# --- ANNOTATION NER PAR LOTS DE PLUSIEURS CV SIMULTANÉS --- # 
+# ********************************************************** # 
+
+
+
+def annotate_cv_texts(texts, mini_batch_size=DEFAULT_MINI_BATCH_SIZE, max_chunk_chars=DEFAULT_MAX_CHUNK_CHARS, traces=None):
+    """
+    Annote un lot de textes de CV avec les deux taggers Flair en un seul appel predict() par tagger.
+    Chaque texte est découpé en segments courts tokenisés une seule fois : les segments de tous
+    les CV forment un seul lot, annoté par les deux taggers.
+
+    :param texts: Liste des textes bruts des CV
+    :param mini_batch_size: Nombre de phrases traitées simultanément par le BiLSTM
+    :param max_chunk_chars: Longueur maximale d'une ligne avant son découpage en phrases
+    :param traces: CVTrace de chaque texte ; le temps de chaque tagger y est réparti au prorata des phrases
+    :return: Liste d'objets CVAnalysis annotés, dans le même ordre que 'texts'
+    """
+    with measure_batch() as tokenization:
+        analyses  = [CVAnalysis(text, max_chunk_chars) for text in texts]
+        sentences = [sentence for analysis in analyses for sentence in analysis.sentences]
+
+    # Chargement des taggers hors mesure : seul le temps d'annotation est attribué aux CV
+    tagger, tagger_experience = get_tagger(), get_tagger_experience()
+
+    with measure_batch() as generic_ner:
+        tagger.predict(sentences, mini_batch_size=mini_batch_size, label_name=GENERIC_LABEL_TYPE)
+    with measure_batch() as finetuned_ner:
+        tagger_experience.predict(sentences, mini_batch_size=mini_batch_size, label_name=FINETUNED_LABEL_TYPE)
+
+    if traces is not None:
+        weights = [len(analysis.sentences) for analysis in analyses]
+        share_batch_stage(traces, "tokenisation", tokenization, weights)
+        share_batch_stage(traces, "ner_generique", generic_ner, weights)
+        share_batch_stage(traces, "ner_finetune", finetuned_ner, weights)
+
+    return analyses
+
+
+
+def _record_cv_error(report, stage, error):
+    """
+    Inscrit dans le rapport d'un CV l'erreur qui a interrompu son analyse : le CV est produit sans résultat
+    et le reste du lot continue. 'stage' est l'étape en échec ("pdf", "ner", "entites", "classification"...).
+    """
+    report["error"] = f"{type(error).__name__} : {error}"
+    report["error_stage"] = stage
+
+
+
+# Marque de fin des pages d'un CV dans la file du fil d'extraction
+_END_OF_CV = object()
+
+# Pages extraites en avance au plus : au-delà, le fil d'extraction attend que l'annotation les consomme
+STREAM_QUEUE_PAGES = 16
+
+# Intervalle (en secondes) auquel le fil d'extraction bloqué vérifie que l'annotation n'a pas été abandonnée
+_STREAM_PUT_TIMEOUT = 0.5
+
+
+
+class _StreamStopped(Exception):
+    # L'annotation a été abandonnée : le fil d'extraction s'arrête sans placer d'autre page
+    pass
+
+
+
+def _put_page(pages_queue, item, stop):
+    while not stop.is_set():
+        try:
+            pages_queue.put(item, timeout=_STREAM_PUT_TIMEOUT)
+            return
+        except queue.Full:
+            pass
+    raise _StreamStopped()
+
+
+
+def _produce_cv_pages(pdf_paths, pdf_options, pdf_hashes, reports, traces, pages_queue, stop):
+    """
+    Fil d'extraction : extrait les pages des CV les uns après les autres et place chaque page
+    dans 'pages_queue' sous la forme (position du CV, texte de la page). Une erreur y est placée
+    à la place de la fin du CV, et l'extraction continue avec le CV suivant. Le fil s'arrête dès que 'stop' est levé.
+    """
+    try:
+        for index, pdf_path in enumerate(pdf_paths):
+            print(f"\nTraitement du fichier : {os.path.basename(pdf_path)}")
+            try:
+                with traces[index].stage("pdf") as stage:
+                    length = 0
+                    for piece in stream_text_from_pdf(pdf_path, report=reports[index], pdf_hash=pdf_hashes[index], **pdf_options):
+                        length = length + len(piece) if piece is not None else 0
+                        _put_page(pages_queue, (index, piece), stop)
+                    stage["out"] = length
+                    stage.update(reports[index])
+            except _StreamStopped:
+                raise
+            except Exception as e:
+                _put_page(pages_queue, (index, e), stop)
+                continue
+            _put_page(pages_queue, (index, _END_OF_CV), stop)
+    except _StreamStopped:
+        return
+
+
+
+def _predict_sentences(sentences, taggers, mini_batch_size, measures):
+    # Annote 'sentences' avec les deux taggers et cumule leurs temps dans 'measures'
+    for (tagger, label_name), totals in zip(taggers, measures):
+        with measure_batch() as measure:
+            tagger.predict(sentences, mini_batch_size=mini_batch_size, label_name=label_name)
+        totals["wall"] += measure["wall"]
+        totals["cpu"] += measure["cpu"]
+
+
+
+def stream_annotate_cv_pdfs(pdf_paths, mini_batch_size=DEFAULT_MINI_BATCH_SIZE, max_chunk_chars=DEFAULT_MAX_CHUNK_CHARS,
+                            pdf_options=None, pdf_hashes=None, traces=None):
+    """
+    Variante d'annotate_cv_texts qui part des PDF : un fil extrait les pages des CV pendant que celui-ci
+    les tokenise et les annote dès que 'mini_batch_size' phrases sont prêtes. L'extraction des pages
+    suivantes recouvre ainsi l'annotation des précédentes, et chaque CV est disponible dès que sa dernière
+    page est annotée, sans attendre le reste du lot. Les annotations sont identiques à celles d'annotate_cv_texts :
+    chaque ligne est annotée indépendamment des autres.
+
+    Les CV ignorés par les limites de l'extraction (taille du PDF) sont produits sans texte, de même que
+    les CV dont l'extraction ou l'annotation échoue (erreur inscrite dans leur rapport).
+    Au plus STREAM_QUEUE_PAGES pages sont extraites en avance : la mémoire reste bornée quand l'annotation
+    est plus lente que l'extraction, et le temps de l'étape "pdf" inclut alors l'attente de l'annotation.
+    Le temps CPU des étapes inclut celui de l'autre fil, qui s'exécute en même temps.
+
+    :param pdf_options: Paramètres de stream_text_from_pdf (moteur d'extraction, limites...)
+    :param pdf_hashes: Empreintes SHA-256 des PDF déjà calculées (None : calculées à l'extraction)
+    :param traces: CVTrace de chaque PDF, recevant l'extraction, la tokenisation et les temps des taggers
+    :return: Générateur de tuples (position du CV dans 'pdf_paths', texte, CVAnalysis annotée, rapport de l'extraction),
+             dans l'ordre de 'pdf_paths'
+    """
+    pdf_hashes = pdf_hashes or [None] * len(pdf_paths)
+    traces = traces or [CVTrace(None) for _ in pdf_paths]
+    reports = [{} for _ in pdf_paths]
+    pages_queue, stop = queue.Queue(maxsize=STREAM_QUEUE_PAGES), threading.Event()
+    threading.Thread(target=_produce_cv_pages, args=(pdf_paths, pdf_options or {}, pdf_hashes, reports, traces, pages_queue, stop),
+                     daemon=True).start()
+    try:
+        yield from _annotate_streamed_pages(pdf_paths, pages_queue, reports, traces, mini_batch_size, max_chunk_chars)
+    finally:
+        # Erreur ou générateur abandonné : libère le fil d'extraction bloqué sur la file pleine
+        stop.set()
+
+
+
+def _annotate_streamed_pages(pdf_paths, pages_queue, reports, traces, mini_batch_size, max_chunk_chars):
+    # Annotation des pages de 'pages_queue' au fil de leur arrivée (voir stream_annotate_cv_pdfs)
+
+    # Chargement des taggers pendant l'extraction des premières pages
+    taggers = ((get_tagger(), GENERIC_LABEL_TYPE), (get_tagger_experience(), FINETUNED_LABEL_TYPE))
+
+    # Les pages arrivent CV après CV : les phrases en attente appartiennent toutes au CV en cours.
+    # 'failure' garde l'erreur d'annotation du CV en cours : ses pages suivantes sont ignorées
+    analysis, pending, failure = CVAnalysis("", max_chunk_chars), [], None
+    tokenization, generic_ner, finetuned_ner = ({"wall": 0.0, "cpu": 0.0} for _ in range(3))
+    finished = 0
+    while finished < len(pdf_paths):
+        index, piece = pages_queue.get()
+
+        if isinstance(piece, Exception):
+            # Extraction en échec : le CV est produit sans texte, les CV suivants sont extraits normalement
+            failure = ("pdf", piece)
+        elif failure is not None and piece is not _END_OF_CV:
+            continue
+        elif piece is None:
+            # Moteur d'extraction en échec : le texte du CV est reproduit depuis le début par un autre moteur
+            analysis, pending = CVAnalysis("", max_chunk_chars), []
+            continue
+        elif piece is not _END_OF_CV:
+            try:
+                with measure_batch() as measure:
+                    pending.extend(analysis.extend(piece))
+                tokenization["wall"] += measure["wall"]
+                tokenization["cpu"] += measure["cpu"]
+                if len(pending) >= mini_batch_size:
+                    _predict_sentences(pending, taggers, mini_batch_size, (generic_ner, finetuned_ner))
+                    pending = []
+            except Exception as e:
+                failure = ("ner", e)
+            continue
+        elif failure is None and pending:
+            try:
+                _predict_sentences(pending, taggers, mini_batch_size, (generic_ner, finetuned_ner))
+            except Exception as e:
+                failure = ("ner", e)
+
+        # Fin du CV (dernière page ou erreur d'extraction)
+        if failure is None:
+            sentence_count = len(analysis.sentences)
+            for name, measures in (("tokenisation", tokenization), ("ner_generique", generic_ner), ("ner_finetune", finetuned_ner)):
+                traces[index].add_stage(name, measures["wall"], measures["cpu"], **{"in": sentence_count, "batch_size": 1})
+            yield index, analysis.text, analysis, reports[index]
+        else:
+            _record_cv_error(reports[index], *failure)
+            yield index, "", None, reports[index]
+
+        finished += 1
+        analysis, pending, failure = CVAnalysis("", max_chunk_chars), [], None
+        tokenization, generic_ner, finetuned_ner = ({"wall": 0.0, "cpu": 0.0} for _ in range(3))
+
+
+
 # ****************************************************************************************************************************************************************** # 
 # --- FONCTION DE GESTIONS D'APPELS DES FONCTIONS PERMETTANT L'EXTRACTION CORRECT DES ENTITÉS PRÉSENTES DANS LES CV QUI SERVENT A CLASSIFIER LES CV PAR LA SUITE --- # 
 # ****************************************************************************************************************************************************************** # 
 
 
 
-def extract_all_entities(text):
+def extract_all_entities(text, analysis=None, trace=None):
     """
     Extrait différentes entités nommées (compétences, localisation, expériences, etc.)
     d'un texte en utilisant Flair NER.
     
     :param text: Texte à analyser
+    :param analysis: CVAnalysis déjà annotée par annotate_cv_texts() ; si absente,
+                     le texte est tokenisé et annoté ici
+    :param trace: CVTrace recevant le temps et le nombre d'entités de chaque étape ;
+                  les résultats intermédiaires ne sont affichés qu'avec la trace détaillée (--verbose)
     :return: Dictionnaire des entités classées par catégories
     """
 
@@ -469,6 +916,9 @@ def extract_all_entities(text):
     # --- Initialisation des listes d'entités --- #
     # ******************************************* # 
 
+    if trace is None:
+        trace = CVTrace(None)
+
     Compétences, extracted_localisation, Expériences, Noms  = [], [], [], []
 
     # ******************************************* # 
@@ -476,96 +926,116 @@ def extract_all_entities(text):
     # --- Extraction des emails et téléphones --- #
     # ******************************************* # 
 
-    extracted_info = extract_emails_phones_ReGex(text) 
-    Emails = extracted_info["Emails"]
-    Téléphone = extracted_info["Téléphone"]
+    # Un seul parcours du texte pour les emails, téléphones et langues (étape 6)
+    with trace.stage("regex_champs", len(text)) as stage:
+        fields = scan_cv_fields(text)
+        extracted_info = extract_emails_phones_ReGex(text, fields)
+        Emails = extracted_info["Emails"]
+        Téléphone = extracted_info["Téléphone"]
+        stage["out"] = sum(len(matches) for matches in fields.values())
     
     # ********************************* # 
     # -----------( ÉTAPE 3 )----------- #
     # --- Annotation NER avec Flair --- #
     # ********************************* # 
 
-    sentence = Sentence(text)
-    tagger.predict(sentence)
+    if analysis is None:
+        analysis = annotate_cv_texts([text], traces=[trace])[0]
 
     # *************************************************************************** # 
     # --------------------------------( ÉTAPE 4 )-------------------------------- #
     # --- Classification des entités par type a l'aide de Flair non fine-tuné --- #
     # *************************************************************************** # 
 
-    for entity in sentence.get_spans("ner"):
-        word  = entity.text.strip()
-        label = entity.get_label("ner").value
-        
-        if "MISC" in label:
-            if not re.match(EMAIL_PATTERN, word):
-                Compétences.append(word)
+    with trace.stage("tri_entites_generiques") as stage:
+        generic_entities = analysis.spans(GENERIC_LABEL_TYPE)
+        stage["in"] = len(generic_entities)
+
+        for entity in generic_entities:
+            word  = entity.text.strip()
+            label = entity.tag
+            
+            if "MISC" in label:
+                if not CV_FIELD_SCANNER.email_regex.match(word):
+                    Compétences.append(word)
+
+            elif "LOC" in label:
+                extracted_localisation.append(word)
 
-        elif "LOC" in label:
-            extracted_localisation.append(word)
+            elif "PER" in label:
+                Noms.append(word)
 
-        elif "PER" in label:
-            Noms.append(word)
+            elif "ORG" in label:
+                Expériences.append(word)
 
-        elif "ORG" in label:
-            Expériences.append(word)
+        stage["out"] = len(Compétences) + len(extracted_localisation) + len(Noms) + len(Expériences)
 
     # ******************************************* # 
     # ----------------( ÉTAPE 5 )---------------- #
     # --- Nettoyage et test des localisations --- #
     # ******************************************* # 
 
-    corrected_localisation = merge_and_clean_locations(extracted_localisation)
-    print(" \n ")
-    print("Localisations TEST : \n ")
-    print("Localisations extraites : ", extracted_localisation)
-    print("Localisations corrigées : ", corrected_localisation)
-    print(" \n ")
+    with trace.stage("localisations_nettoyage", len(extracted_localisation)) as stage:
+        corrected_localisation = merge_and_clean_locations(extracted_localisation)
+        stage["out"] = len(corrected_localisation)
+
+    trace.log("\nLocalisations TEST :\n")
+    trace.log("Localisations extraites ", extracted_localisation)
+    trace.log("Localisations corrigées ", corrected_localisation)
 
     # ************************************************************ # 
     # -------------------------( ÉTAPE 6 )------------------------ #
     # --- Détection des langues et niveaux a l'aide de 'ReGex' --- #
     # ************************************************************ # 
 
-    extracted_languages = extract_languages(text)
-    print(" \n ")
-    print("Langues TEST : \n ")
-    print("Langues extraites : ", extracted_languages)
-    print(" \n ")
+    with trace.stage("langues", len(fields["language"])) as stage:
+        extracted_languages = extract_languages(text, fields)
+        stage["out"] = len(extracted_languages)
+
+    trace.log("\nLangues TEST :\n")
+    trace.log("Langues extraites ", extracted_languages)
 
     # ********************************************************** # 
     # ------------------------( ÉTAPE 7 )----------------------- #
     # --- Traitement des expériences détectées dans le texte --- #
     # ********************************************************** # 
 
+    # Un seul passage du modèle fine-tuné fournit expériences, diplômes et compétences #
+    with trace.stage("entites_finetune") as stage:
+        finetuned_entities = extract_finetuned_entities(text, analysis=analysis)
+        stage["out"] = sum(len(entities) for entities in finetuned_entities.values())
+
     # Extraction brute via Flair fine-tuné sur les expériences # 
-    extracted_experiences = extract_experiences_flair(text, taggerEXPERIENCE)
+    extracted_experiences = extract_experiences_flair(text, entities=finetuned_entities)
 
     # Correction orthographique et regroupement par similarité via RapidFuzz ( correction des fautes ou variantes proches (ex: développeur / developpeur))
-    corrected_experiences = correct_experiences_with_rapidfuzz(extracted_experiences)
+    with trace.stage("experiences_fuzzy", len(extracted_experiences)) as stage:
+        corrected_experiences = correct_experiences_with_rapidfuzz(extracted_experiences)
+        stage["out"] = len(corrected_experiences)
 
     # Suppression des expériences contenant des noms de personnes détectés (ex: "Jean Dupont ingénieur" devient "ingénieur" ou est supprimé selon le cas)
-    experiences_without_names = detect_name_filter_experience(corrected_experiences, Noms)
+    with trace.stage("experiences_filtre_noms", len(corrected_experiences)) as stage:
+        experiences_without_names = detect_name_filter_experience(corrected_experiences, Noms)
+        stage["out"] = len(experiences_without_names)
 
     # Nettoyage final avec suppression des termes parasites (ex: "Professionnelle ingénieur cybersécurité" → "ingénieur cybersécurité")
     # Applique aussi la NORMALISATION (minuscule, accents supprimés) temporairement pour comparer avec des blacklist de mots comme "informatique", "experience", "data", etc.
-    blacklist_experiences = merge_and_clean_experiences(experiences_without_names)
+    with trace.stage("experiences_nettoyage", len(experiences_without_names)) as stage:
+        blacklist_experiences = merge_and_clean_experiences(experiences_without_names)
+        stage["out"] = len(blacklist_experiences)
 
     # *********************************************** # 
     # ------------------( ÉTAPE 8 )------------------ #
     # --- Affichage du traitement des EXPERIENCES --- #
     # *********************************************** # 
 
-    print("\n")
-    print("Expériences TEST :\n")
-
-    print("Via Flair non fine-tuné              : ", Expériences, "\n")
-    print("Via Flair fine-tune (brut)           : ", extracted_experiences, "\n")
-    print("Après correction fuzzy (orthographe) : ", corrected_experiences, "\n")
-    print("Noms détectés à filtrer              : ", Noms, "\n")
-    print("Expériences sans noms de personnes   : ", experiences_without_names, "\n")
-    print("Nettoyage final (blacklist + mots parasites supprimés, normalisation incluse) : ", blacklist_experiences, "\n")
-    print("\n")
+    trace.log("\nExpériences TEST :\n")
+    trace.log("Via Flair non fine-tuné              ", Expériences)
+    trace.log("Via Flair fine-tune (brut)           ", extracted_experiences)
+    trace.log("Après correction fuzzy (orthographe) ", corrected_experiences)
+    trace.log("Noms détectés à filtrer              ", Noms)
+    trace.log("Expériences sans noms de personnes   ", experiences_without_names)
+    trace.log("Nettoyage final (blacklist + mots parasites supprimés, normalisation incluse) ", blacklist_experiences)
 
 
     # ***************************************** # 
@@ -573,17 +1043,17 @@ def extract_all_entities(text):
     # --- Filtrage des formations détectées --- #
     # ***************************************** # 
 
-    extracted_diplomes = detect_formations_finetuning(blacklist_experiences)
+    with trace.stage("diplomes", len(blacklist_experiences)) as stage:
+        extracted_diplomes = detect_formations_finetuning(blacklist_experiences)
+        stage["out"] = len(extracted_diplomes)
 
     # ***************************************************** # 
     # ---------------------( ÉTAPE 11 )-------------------- #
     # --- Affichage du traitement des DIPLÔMES extraits --- #
     # ***************************************************** # 
 
-    print(" \n ")
-    print("Diplômes TEST : \n ")
-    print("Diplômes extraits : ", extracted_diplomes)
-    print(" \n ")
+    trace.log("\nDiplômes TEST :\n")
+    trace.log("Diplômes extraits ", extracted_diplomes)
 
     # ********************************************************** # 
     # -----------------------( ÉTAPE 12 )----------------------- #
@@ -591,50 +1061,59 @@ def extract_all_entities(text):
     # ********************************************************** # 
 
     # Extraction brute des compétences via Flair
-    extracted_competences = extract_competences_flair(text, taggerEXPERIENCE)
+    extracted_competences = extract_competences_flair(text, entities=finetuned_entities)
 
     # Nettoyage, normalisation (minuscule, accents, etc.) et lemmatisation
     # - Retire les mots seuls parasites comme "informatique"
     # - Filtre les mots inutiles dans des expressions ("de", "base", etc.)
     # - Lemmatisation avec spaCy pour uniformiser les formes (ex: "analysant" → "analyser")
-    cleaned_competencies_with_ReGex = merge_and_clean_competencies(extracted_competences)
+    with trace.stage("competences_lemmatisation", len(extracted_competences)) as stage:
+        cleaned_competencies_with_ReGex = merge_and_clean_competencies(extracted_competences)
+        stage["out"] = len(cleaned_competencies_with_ReGex)
 
     # 3. Correction orthographique avec RapidFuzz
     # - Compare les formes nettoyées aux compétences connues
     # - Corrige les fautes proches (ex: "devolopper" → "développer")
-    corrected_competences = correct_misspelled_competences(cleaned_competencies_with_ReGex)
+    with trace.stage("competences_fuzzy", len(cleaned_competencies_with_ReGex)) as stage:
+        corrected_competences = correct_misspelled_competences(cleaned_competencies_with_ReGex)
+        stage["out"] = len(corrected_competences)
+
+    # 4. Compétences connues présentes dans le texte mais non étiquetées par Flair
+    with trace.stage("competences_dictionnaire", len(corrected_competences)) as stage:
+        dictionary_competences = CV_GAZETTEER.terms(text, "COMPETENCE") if GAZETTEER_RECALL else []
+        corrected_competences = list(set(corrected_competences) | set(dictionary_competences))
+        stage["out"] = len(corrected_competences)
 
     # *********************************************** # 
     # ------------------( ÉTAPE 13 )----------------- #
     # --- Affichage du traitement des COMPÉTENCES --- #
     # *********************************************** # 
 
-    print("\n")
-    print("Compétences TEST :\n")
-    print("Compétences extraites (brutes - Flair MISC)         : ", extracted_competences, "\n")
-    print("Après nettoyage, normalisation et lemmatisation     : ", cleaned_competencies_with_ReGex, "\n")
-    print("Après correction orthographique (fuzzy RapidFuzz)   : ", corrected_competences, "\n")
-    print("\n")
+    trace.log("\nCompétences TEST :\n")
+    trace.log("Compétences extraites (brutes - Flair MISC)         ", extracted_competences)
+    trace.log("Après nettoyage, normalisation et lemmatisation     ", cleaned_competencies_with_ReGex)
+    trace.log("Trouvées dans le texte (dictionnaire)               ", dictionary_competences)
+    trace.log("Après correction orthographique (fuzzy RapidFuzz)   ", corrected_competences)
 
     # *************************************************************************************************** # 
     # --------------------------------------------( ÉTAPE 13 )------------------------------------------- #
     # --- Déduplication des noms extraits & Nettoyage des mots faisant partie de la blacklist définie --- #
     # *************************************************************************************************** # 
 
-    Noms_sans_doublons = list({nom.lower(): nom for nom in Noms}.values())
-    Noms_blacklist = clean_names_with_blacklist(Noms_sans_doublons)
+    with trace.stage("noms_nettoyage", len(Noms)) as stage:
+        Noms_sans_doublons = list({nom.lower(): nom for nom in Noms}.values())
+        Noms_blacklist = clean_names_with_blacklist(Noms_sans_doublons)
+        stage["out"] = len(Noms_blacklist)
 
     # ****************************************************** # 
     # ----------------------( ÉTAPE 14 )-------------------- #
     # --- Affichage des informations liés a l'indentités --- #
     # ****************************************************** # 
 
-    print(" \n ")
-    print("Identité TEST : \n ")
-    print("Noms      : ", Noms_blacklist, "\n")
-    print("Emails    : ", list(set(Emails)), "\n")
-    print("Téléphones: ", list(set(Téléphone)), "\n")
-    print(" \n ")
+    trace.log("\nIdentité TEST :\n")
+    trace.log("Noms      ", Noms_blacklist)
+    trace.log("Emails    ", list(set(Emails)))
+    trace.log("Téléphones", list(set(Téléphone)))
 
     # ********************************************** # 
     # ------------------( ÉTAPE 15 )---------------- #
@@ -662,36 +1141,495 @@ def extract_all_entities(text):
 
 
 
-def process_cv_folder(cv_folder):
-    for filename in os.listdir(cv_folder):
-        # Ne garder que les fichiers .pdf
-        if filename.endswith(".pdf"):
-            pdf_path = os.path.join(cv_folder, filename)
-            print(f"\nTraitement du fichier : {filename}")
-            
-            # --- Extraction et structuration des données du CV ---
-            text = extract_text_from_pdf(pdf_path)
-            extracted_entities = extract_all_entities(text)
-            structured_data = extract_sections(text)
-            structured_data.update(extracted_entities)
-            
-            # Affichage du contenu structuré pour vérification
-            print("\n\n")
-            print(structured_data)
-            print("\n\n")
+def ner_fingerprint(pdf_options=None):
+    """
+    Empreinte de tout ce qui détermine les données structurées d'un CV à partir de son PDF :
+    moteur d'extraction du texte, modèles Flair (best-model.pt), modèle spaCy de lemmatisation,
+    listes et regex de post-traitement et code de l'extraction. Toute modification invalide les entités en cache.
+
+    :param pdf_options: Paramètres de extract_text_from_pdf (moteur d'extraction...)
+    """
+    pdf_options = pdf_options or {}
+    return combine_fingerprints(
+        backend_version(resolve_backend(pdf_options.get("backend", DEFAULT_PDF_BACKEND))),
+        sorted((name, repr(value)) for name, value in pdf_options.items() if name not in TEXT_NEUTRAL_OPTIONS),
+        file_fingerprint(extract_pages.__code__.co_filename),
+        FLAIR_GENERIC_MODEL,
+        file_fingerprint(FLAIR_FINETUNED_MODEL_PATH),
+        package_version("flair"),
+        package_version("fr_core_news_sm"),
+        COMPETENCE_CORRECTOR.choices, EXPERIENCE_CORRECTOR.choices, sorted(LANGUAGES),
+        sorted(LANGUAGE_LEVELS), sorted(DEGREES),
+        DEGREE_PATTERN, EMAIL_PATTERN, PHONE_PATTERN, DEFAULT_MAX_CHUNK_CHARS,
+        # Règles de nettoyage codées en dur (listes noires, seuils de similarité...)
+        file_fingerprint(__file__),
+        file_fingerprint(extract_sections.__code__.co_filename),
+        file_fingerprint(FuzzyCorrector.correct.__code__.co_filename),
+        file_fingerprint(load_esco_skills.__code__.co_filename),
+        file_fingerprint(Gazetteer.find.__code__.co_filename),
+        file_fingerprint(CVFieldScanner.scan.__code__.co_filename),
+        file_fingerprint(get_lemmatizer.__code__.co_filename),
+        GAZETTEER_RECALL, GAZETTEER_DEGREES
+    )
+
+
+
+def classifier_fingerprint():
+    """
+    Empreinte du classifieur de domaines (cv_classifier_model.pkl et tokenizer spaCy de prétraitement).
+    """
+    return combine_fingerprints(
+        file_fingerprint(CV_CLASSIFIER_MODEL_PATH),
+        package_version("scikit-learn"),
+        package_version("spacy")
+    )
+
+
+
+def structure_cv(text, extracted_entities):
+    """
+    Regroupe les sections et les entités extraites d'un CV dans un même dictionnaire.
+    """
+    structured_data = extract_sections(text)
+    structured_data.update(extracted_entities)
+    return structured_data
+
+
+
+def classify_cv(structured_data, cache=None, trace=None):
+    """
+    Prédit le domaine d'un CV structuré.
+
+    :param cache: Cache des résultats (Result_cache) ; si le même texte a déjà été classé par
+                  le même classifieur, le SVM n'est pas relancé
+    :param trace: CVTrace recevant le temps de la classification
+    :return: Liste des (domaine, probabilité)
+    """
+    if trace is None:
+        trace = CVTrace(None)
+
+    # Affichage du contenu structuré pour vérification (trace détaillée uniquement)
+    trace.log("\nDonnées structurées ", structured_data)
+
+    # --- Prédiction du domaine professionnel du candidat ---
+    formatted_text_exp  = " ".join(structured_data["Expériences"])
+    formatted_text_comp = " ".join(structured_data["Compétences"])
+    formatted_text      = formatted_text_exp + formatted_text_comp
+
+    predicted_domain = None
+    if cache is not None:
+        with trace.stage("cache_domaines") as stage:
+            input_hash, fingerprint = sha256_text(formatted_text), classifier_fingerprint()
+            predicted_domain = cache.get_domains(input_hash, fingerprint)
+            stage["hit"] = predicted_domain is not None
+    if predicted_domain is None:
+        with trace.stage("svm", len(formatted_text)) as stage:
+            predicted_domain = predict_cv_domain(formatted_text)
+            stage["out"] = len(predicted_domain)
+        if cache is not None:
+            cache.put_domains(input_hash, fingerprint, predicted_domain)
+    print(f"Les domaines prédits sont : {predicted_domain}")
+
+    return predicted_domain
+
+
+
+def save_cv_results(filename, structured_data, predicted_domain):
+    """
+    Sauvegarde les résultats d'un CV en JSON/CSV dans les dossiers des domaines prédits.
+    """
+    json_name = filename.replace(".pdf", ".json")
+    csv_name  = filename.replace(".pdf", ".csv")
+    save_as_json(structured_data, json_name, predicted_domain)
+    save_as_csv(structured_data, csv_name, predicted_domain)
+
+
+
+def _extract_and_annotate(pdf_paths, missing, mini_batch_size, pdf_options, pdf_hashes, traces):
+    """
+    Extrait le texte des CV d'indices 'missing', puis les annote tous en un seul lot (annotate_cv_texts).
+    Un CV dont l'extraction échoue est produit sans texte ; si l'annotation du lot échoue, chaque CV
+    est annoté seul pour que seul le CV en cause reste sans annotation.
+
+    :return: Liste de tuples (indice du CV, texte, CVAnalysis annotée ou None si le CV est ignoré ou en échec, rapport de l'extraction)
+    """
+    texts, reports = {}, {}
+    for index in missing:
+        print(f"\nTraitement du fichier : {os.path.basename(pdf_paths[index])}")
+        texts[index], reports[index] = "", {}
+        try:
+            with traces[index].stage("pdf") as stage:
+                texts[index] = extract_text_from_pdf(pdf_paths[index], report=reports[index], pdf_hash=pdf_hashes[index], **(pdf_options or {}))
+                stage["out"] = len(texts[index])
+                stage.update(reports[index])
+        except Exception as e:
+            _record_cv_error(reports[index], "pdf", e)
+
+    kept = [index for index in missing if "skipped" not in reports[index] and "error" not in reports[index]]
+    analyses = {}
+    if kept:
+        try:
+            analyses = dict(zip(kept, annotate_cv_texts([texts[index] for index in kept], mini_batch_size=mini_batch_size,
+                                                        traces=[traces[index] for index in kept])))
+        except Exception:
+            for index in kept:
+                try:
+                    analyses[index] = annotate_cv_texts([texts[index]], mini_batch_size=mini_batch_size, traces=[traces[index]])[0]
+                except Exception as e:
+                    _record_cv_error(reports[index], "ner", e)
+    return [(index, texts[index], analyses.get(index), reports[index]) for index in missing]
+
+
+
+def analyse_cv_batch(pdf_paths, mini_batch_size=DEFAULT_MINI_BATCH_SIZE, cache_path=DEFAULT_CACHE_PATH, trace_records=None,
+                     pdf_options=None, limit_records=None, stream_pages=False, error_records=None):
+    """
+    Analyse un lot de CV PDF sans rien écrire : le texte de tout le lot est extrait,
+    puis chaque tagger Flair est appelé une seule fois sur tout le lot. Avec 'stream_pages',
+    les pages sont annotées au fil de leur extraction et chaque CV est exploité dès qu'il est annoté.
+
+    Les CV dont le contenu a déjà été analysé avec les mêmes modèles sont lus dans le cache :
+    ni pdfplumber, ni Flair, ni le SVM ne sont relancés pour eux.
+
+    Une erreur sur un CV (PDF illisible, échec d'un modèle...) n'interrompt pas le lot : le CV est
+    produit sans résultat et l'erreur est ajoutée à 'error_records' et à sa trace.
+
+    :param cache_path: Base SQLite du cache des résultats (None pour le désactiver)
+    :param trace_records: Liste recevant la trace (temps par étape) de chaque CV, au format de CVTrace.to_record()
+    :param pdf_options: Paramètres de extract_text_from_pdf (ex : {"backend": "fast"})
+    :param limit_records: Liste recevant les CV ignorés ou tronqués par les limites de l'extraction (taille, pages, caractères)
+    :param stream_pages: Annote les pages au fil de leur extraction (stream_annotate_cv_pdfs) au lieu d'extraire tout le lot d'abord
+    :param error_records: Liste recevant les CV en échec : { "cv": chemin, "stage": étape, "error": message }
+    :return: Liste de tuples (nom du fichier, données structurées, domaines prédits),
+             dans le même ordre que 'pdf_paths' ; données et domaines valent None pour un CV ignoré ou en échec
+    """
+    cache = get_cache(cache_path) if cache_path else None
+    traces = [CVTrace(os.path.basename(pdf_path)) for pdf_path in pdf_paths]
+    failures = {}
+
+    def _fail(index, report):
+        # Le CV en échec est écarté des étapes suivantes ; l'erreur suit le CV dans sa trace et dans 'error_records'
+        failures[index] = report
+        print(f"\nÉchec de l'analyse du fichier {os.path.basename(pdf_paths[index])} (étape {report['error_stage']}) : {report['error']}")
+        traces[index].error = {"stage": report["error_stage"], "error": report["error"]}
+        if error_records is not None:
+            error_records.append({"cv": pdf_paths[index], "stage": report["error_stage"], "error": report["error"]})
+
+    # --- Recherche des CV déjà analysés ---
+    structured = [None] * len(pdf_paths)
+    pdf_hashes = [None] * len(pdf_paths)
+    if cache is not None:
+        fingerprint = ner_fingerprint(pdf_options)
+        for index, pdf_path in enumerate(pdf_paths):
+            try:
+                with traces[index].stage("cache_entites") as stage:
+                    pdf_hashes[index] = sha256_file(pdf_path)
+                    structured[index] = cache.get_entities(pdf_hashes[index], fingerprint)
+                    stage["hit"] = structured[index] is not None
+            except Exception as e:
+                report = {}
+                _record_cv_error(report, "cache_entites", e)
+                _fail(index, report)
+                continue
+            if structured[index] is not None:
+                print(f"\nRésultat en cache pour le fichier : {os.path.basename(pdf_path)}")
+    missing = [index for index, data in enumerate(structured) if data is None and index not in failures]
+
+    # --- Extraction du texte et annotation NER des CV absents du cache (les taggers ne sont pas chargés si tout est en cache) ---
+    if stream_pages and missing:
+        # Pages annotées au fil de leur extraction : chaque CV est exploité dès sa dernière page annotée
+        annotated = (
+            (missing[position], text, analysis, pdf_report)
+            for position, text, analysis, pdf_report in stream_annotate_cv_pdfs(
+                [pdf_paths[index] for index in missing], mini_batch_size, pdf_options=pdf_options,
+                pdf_hashes=[pdf_hashes[index] for index in missing], traces=[traces[index] for index in missing]
+            )
+        )
+    else:
+        annotated = _extract_and_annotate(pdf_paths, missing, mini_batch_size, pdf_options, pdf_hashes, traces)
+
+    for index, text, analysis, pdf_report in annotated:
+        if ("skipped" in pdf_report or "truncated" in pdf_report) and limit_records is not None:
+            limit_records.append({"cv": pdf_paths[index], **pdf_report})
+        if "error" in pdf_report:
+            _fail(index, pdf_report)
+            continue
+        if "skipped" in pdf_report:
+            continue
+        print(f"\nAnalyse des entités du fichier : {os.path.basename(pdf_paths[index])}")
+        try:
+            extracted_entities = extract_all_entities(text, analysis, traces[index])
+            with traces[index].stage("sections"):
+                structured[index] = structure_cv(text, extracted_entities)
+            if cache is not None:
+                cache.put_entities(pdf_hashes[index], fingerprint, structured[index])
+        except Exception as e:
+            structured[index] = None
+            report = {}
+            _record_cv_error(report, "entites", e)
+            _fail(index, report)
+
+    # --- Classification de chaque CV ---
+    results = []
+    for index, (pdf_path, structured_data, trace) in enumerate(zip(pdf_paths, structured, traces)):
+        predicted_domain = None
+        if structured_data is not None:
+            try:
+                predicted_domain = classify_cv(structured_data, cache, trace)
+            except Exception as e:
+                structured_data = None
+                report = {}
+                _record_cv_error(report, "classification", e)
+                _fail(index, report)
+        results.append((os.path.basename(pdf_path), structured_data, predicted_domain))
+
+    if trace_records is not None:
+        trace_records.extend(trace.to_record() for trace in traces)
+    return results
+
+
+
+# ************************************************************************* # 
+# --- PROCESSUS DE TRAVAIL POUR LE TRAITEMENT PARALLÈLE (OPTION --jobs) --- # 
+# ************************************************************************* # 
+
+
+
+def _init_worker(torch_threads, verbose=False):
+    """
+    Initialise un processus de travail : limite le nombre de threads de calcul de torch pour
+    que les processus ne se disputent pas les cœurs. Les modèles sont chargés une seule fois
+    par processus, au premier lot traité (Model_registry).
+    """
+    # Un processus créé par 'spawn' n'hérite pas de l'option --verbose du parent
+    set_verbose(verbose)
+
+    os.environ["OMP_NUM_THREADS"] = str(torch_threads)
+    os.environ["MKL_NUM_THREADS"] = str(torch_threads)
+
+    import torch
+    torch.set_num_threads(torch_threads)
+    try:
+        torch.set_num_interop_threads(1)
+    except RuntimeError:
+        # Déjà fixé dans le processus parent (mode --share-models) : réglage hérité
+        pass
+
+
+
+def _analyse_cv_batch_in_worker(args):
+    pdf_paths, mini_batch_size, cache_path, pdf_options, stream_pages = args
+    trace_records, limit_records, error_records = [], [], []
+    results = analyse_cv_batch(pdf_paths, mini_batch_size, cache_path, trace_records, pdf_options, limit_records, stream_pages,
+                               error_records)
+    # La mémoire du processus, les traces, les CV limités et les CV en échec accompagnent chaque lot :
+    # seul le parent les affiche et les écrit
+    return os.getpid(), memory_breakdown(), results, trace_records, limit_records, error_records
+
+
+
+# Modèles chargés par le parent avant le fork en mode --share-models
+SHARED_MODELS = (FLAIR_GENERIC_MODEL, FLAIR_FINETUNED_MODEL, SPACY_SMALL_MODEL, SPACY_BLANK_MODEL, CV_CLASSIFIER_MODEL)
 
-            # --- Prédiction du domaine professionnel du candidat ---
-            formatted_text_exp  = " ".join(structured_data["Expériences"])
-            formatted_text_comp = " ".join(structured_data["Compétences"])
-            formatted_text      = formatted_text_exp + formatted_text_comp
-            predicted_domain    = predict_cv_domain(formatted_text)
-            print(f"Les domaines prédits sont : {predicted_domain}")
 
-            # --- Génération des noms de fichiers et sauvegarde des résultats ---
-            json_name = filename.replace(".pdf", ".json")
-            csv_name  = filename.replace(".pdf", ".csv")
-            save_as_json(structured_data, json_name, predicted_domain)
-            save_as_csv(structured_data, csv_name, predicted_domain)
+
+def _load_models_for_fork():
+    """
+    Charge tous les modèles dans le processus parent puis gèle le tas du ramasse-miettes :
+    les processus créés par fork héritent des poids en copie sur écriture, et gc.freeze()
+    évite que les passes du ramasse-miettes ne recopient ces pages dans chaque processus.
+    """
+    prewarm(SHARED_MODELS, background=False)
+    for name in (FLAIR_GENERIC_MODEL, FLAIR_FINETUNED_MODEL):
+        get_model(name).eval()
+    gc.collect()
+    gc.freeze()
+
+
+
+def print_worker_memory_report(worker_memory):
+    """
+    Affiche, pour le parent et chaque processus de travail, la mémoire partagée et la mémoire propre.
+    """
+    def _mb(value):
+        return value / (1024 * 1024)
+
+    print("\nRapport mémoire des processus de travail (Mo) :\n")
+    print(f"  {'processus':<18}{'RSS':>10}{'PSS':>10}{'partagée':>12}{'propre':>10}")
+    rows = [("parent", memory_breakdown())] + [(f"worker {pid}", memory) for pid, memory in sorted(worker_memory.items())]
+    total_private = 0
+    for label, memory in rows:
+        if memory is None:
+            print(f"  {label:<18}{'indisponible':>42}")
+            continue
+        total_private += memory["private"]
+        print(f"  {label:<18}{_mb(memory['rss']):>10.1f}{_mb(memory['pss']):>10.1f}{_mb(memory['shared']):>12.1f}{_mb(memory['private']):>10.1f}")
+    print(f"\n  Mémoire propre cumulée : {_mb(total_private):.1f} Mo\n")
+
+
+
+def process_cv_files(pdf_paths, batch_size=DEFAULT_BATCH_SIZE, mini_batch_size=DEFAULT_MINI_BATCH_SIZE, jobs=1,
+                     share_models=False, memory_report=False, cache_path=DEFAULT_CACHE_PATH,
+                     verbose=False, trace_path=None, timings=False, trace_records=None, save_results=True,
+                     pdf_options=None, limit_records=None, stream_pages=False, error_records=None):
+    """
+    Traite une liste de CV PDF par lots de 'batch_size' CV. Les résultats d'un lot sont écrits dès la fin
+    de son analyse ; un CV en échec est écarté sans interrompre son lot ni les lots suivants.
+
+    Avec jobs > 1, les lots sont répartis entre 'jobs' processus de travail qui renvoient leurs
+    résultats ; seul ce processus écrit les fichiers JSON/CSV, dans l'ordre de 'pdf_paths'.
+    Par défaut chaque processus charge ses propres modèles ; avec 'share_models', les modèles
+    sont chargés une fois ici puis partagés en copie sur écriture avec des processus créés par fork.
+
+    :param pdf_paths: Chemins des CV au format PDF
+    :param batch_size: Nombre de CV annotés ensemble
+    :param mini_batch_size: Nombre de phrases traitées simultanément par le BiLSTM
+    :param jobs: Nombre de processus de travail
+    :param share_models: Charge les modèles avant le fork pour les partager entre processus (Linux)
+    :param memory_report: Affiche la mémoire partagée / propre de chaque processus de travail
+    :param cache_path: Base SQLite du cache des résultats (None pour le désactiver)
+    :param verbose: Affiche les résultats intermédiaires de chaque étape de l'extraction des entités
+    :param trace_path: Fichier JSONL recevant la trace (temps et nombre d'entités par étape) de chaque CV
+    :param timings: Affiche le temps cumulé de chaque étape à la fin du traitement
+    :param trace_records: Liste recevant la trace de chaque CV (ex : mesures du banc d'essai Benchmark.py)
+    :param save_results: Écrit les fichiers JSON/CSV de chaque CV (désactivé par le banc d'essai)
+    :param pdf_options: Paramètres de extract_text_from_pdf (ex : {"backend": "fast"})
+    :param limit_records: Liste recevant les CV ignorés ou tronqués par les limites de l'extraction
+    :param stream_pages: Annote les pages de chaque CV au fil de leur extraction
+    :param error_records: Liste recevant les CV en échec (chemin, étape et message de l'erreur)
+    """
+    set_verbose(verbose)
+    if limit_records is None:
+        limit_records = []
+    if error_records is None:
+        error_records = []
+    if trace_records is None and (trace_path or timings):
+        trace_records = []
+
+    # En parallèle, les lots sont réduits si besoin pour que chaque processus ait au moins un lot
+    if jobs > 1 and pdf_paths:
+        batch_size = max(1, min(batch_size, -(-len(pdf_paths) // jobs)))
+
+    batches = [pdf_paths[start:start + batch_size] for start in range(0, len(pdf_paths), batch_size)]
+
+    if jobs <= 1 or len(batches) <= 1:
+        for batch in batches:
+            batch_records = [] if trace_records is not None else None
+            for filename, structured_data, predicted_domain in analyse_cv_batch(batch, mini_batch_size, cache_path, batch_records,
+                                                                                pdf_options, limit_records, stream_pages,
+                                                                                error_records):
+                if save_results and structured_data is not None:
+                    save_cv_results(filename, structured_data, predicted_domain)
+            _collect_trace_records(batch_records, trace_records, trace_path)
+        _report_timings(trace_records, timings)
+        print_limit_report(limit_records)
+        print_error_report(error_records)
+        return
+
+    # Les cœurs disponibles sont partagés entre les processus de travail
+    jobs = min(jobs, len(batches))
+    torch_threads = max(1, (os.cpu_count() or 1) // jobs)
+
+    if share_models:
+        # 'fork' après chargement : les poids des modèles sont partagés en copie sur écriture
+        _load_models_for_fork()
+        context = multiprocessing.get_context("fork")
+    else:
+        # 'spawn' : chaque processus part d'un interpréteur neuf et charge ses propres modèles
+        context = multiprocessing.get_context("spawn")
+
+    worker_memory = {}
+    with context.Pool(processes=jobs, initializer=_init_worker, initargs=(torch_threads, verbose)) as pool:
+        tasks = [(batch, mini_batch_size, cache_path, pdf_options, stream_pages) for batch in batches]
+        # imap conserve l'ordre des lots : la sortie est identique d'une exécution à l'autre
+        for pid, memory, batch_results, batch_records, batch_limits, batch_errors in pool.imap(_analyse_cv_batch_in_worker, tasks):
+            worker_memory[pid] = memory
+            limit_records.extend(batch_limits)
+            error_records.extend(batch_errors)
+            for filename, structured_data, predicted_domain in batch_results:
+                if save_results and structured_data is not None:
+                    save_cv_results(filename, structured_data, predicted_domain)
+            _collect_trace_records(batch_records, trace_records, trace_path)
+
+    if share_models:
+        gc.unfreeze()
+
+    if memory_report:
+        print_worker_memory_report(worker_memory)
+
+    _report_timings(trace_records, timings)
+    print_limit_report(limit_records)
+    print_error_report(error_records)
+
+
+
+def _collect_trace_records(batch_records, trace_records, trace_path):
+    """
+    Ajoute les traces d'un lot au fichier JSONL dès la fin du lot (rien n'est perdu si le traitement est interrompu).
+    """
+    if trace_records is None:
+        return
+    trace_records.extend(batch_records)
+    if trace_path:
+        write_trace_records(trace_path, batch_records)
+
+
+
+def _report_timings(trace_records, timings):
+    if timings and trace_records:
+        print_stage_summary(trace_records)
+
+
+
+def print_limit_report(limit_records):
+    """
+    Récapitulatif de fin de traitement des CV ignorés ou tronqués par les limites de l'extraction.
+    """
+    if not limit_records:
+        return
+    print(f"\n{len(limit_records)} CV limité(s) lors de l'extraction du texte :")
+    for record in limit_records:
+        size = f"{record['bytes'] / 1048576:.1f} Mo"
+        if "skipped" in record:
+            print(f"  - {record['cv']} : ignoré ({size}, limite {record['skipped']})")
+        else:
+            print(f"  - {record['cv']} : tronqué ({size}, {record['pages']} pages, {record['chars']} caractères ; "
+                  f"limites {', '.join(record['truncated'])})")
+
+
+
+def print_error_report(error_records):
+    """
+    Récapitulatif de fin de traitement des CV dont l'analyse a échoué.
+    """
+    if not error_records:
+        return
+    print(f"\n{len(error_records)} CV en échec (aucun résultat écrit) :")
+    for record in error_records:
+        print(f"  - {record['cv']} : {record['error']} (étape {record['stage']})")
+
+
+
+def list_cv_files(cv_folder):
+    """
+    Retourne les chemins des CV PDF d'un dossier, triés par nom de fichier.
+    """
+    return [
+        os.path.join(cv_folder, filename)
+        for filename in sorted(os.listdir(cv_folder))
+        if filename.endswith(".pdf")
+    ]
+
+
+
+def process_cv_folder(cv_folder, **options):
+    """
+    Traite tous les CV PDF d'un dossier par lots.
+
+    :param cv_folder: Dossier contenant les CV au format PDF
+    :param options: Paramètres de process_cv_files (batch_size, mini_batch_size, jobs...)
+    """
+    process_cv_files(list_cv_files(cv_folder), **options)
 
 
 
@@ -700,7 +1638,56 @@ def process_cv_folder(cv_folder):
 # ************************************************************** # 
 
 if __name__ == "__main__":
-    process_cv_folder("CV_A_TRAITER")
+    parser = argparse.ArgumentParser(description="Analyse et classement des CV PDF d'un dossier.")
+    parser.add_argument("cv_folder", nargs="?", default="CV_A_TRAITER", help="Dossier contenant les CV au format PDF")
+    parser.add_argument("--batch-size", type=int, default=DEFAULT_BATCH_SIZE, help="Nombre de CV annotés ensemble par les taggers Flair")
+    parser.add_argument("--mini-batch-size", type=int, default=DEFAULT_MINI_BATCH_SIZE, help="Nombre de phrases traitées simultanément par le BiLSTM")
+    parser.add_argument("--jobs", type=int, default=1, help="Nombre de processus de travail traitant les lots en parallèle")
+    parser.add_argument("--share-models", action="store_true", help="Avec --jobs : charge les modèles une fois puis les partage entre processus (fork)")
+    parser.add_argument("--memory-report", action="store_true", help="Avec --jobs : affiche la mémoire partagée / propre de chaque processus")
+    parser.add_argument("--cache", default=DEFAULT_CACHE_PATH, help="Base SQLite du cache des résultats")
+    parser.add_argument("--no-cache", action="store_true", help="Ré-analyse tous les CV sans lire ni écrire le cache")
+    parser.add_argument("--model-report", action="store_true", help="Affiche le temps de chargement et la mémoire de chaque modèle")
+    parser.add_argument("--pdf-backend", choices=list(PDF_BACKENDS) + ["fast"], default=DEFAULT_PDF_BACKEND,
+                        help="Moteur d'extraction du texte des PDF (fast : moteur rapide installé, sans analyse de mise en page)")
+    parser.add_argument("--page-jobs", type=int, default=DEFAULT_PAGE_JOBS,
+                        help="Nombre de processus se partageant les pages des longs PDF (1 : extraction séquentielle)")
+    parser.add_argument("--max-mb", type=float, default=DEFAULT_MAX_BYTES / 1048576, help="Taille maximale d'un PDF en Mo, au-delà il est ignoré (0 : aucune limite)")
+    parser.add_argument("--max-pages", type=int, default=DEFAULT_MAX_PAGES, help="Nombre maximal de pages extraites par CV (0 : aucune limite)")
+    parser.add_argument("--max-chars", type=int, default=DEFAULT_MAX_CHARS, help="Nombre maximal de caractères conservés par CV (0 : aucune limite)")
+    parser.add_argument("--no-text-cache", action="store_true", help="Ré-extrait le texte de tous les PDF sans réutiliser les textes déjà extraits")
+    parser.add_argument("--text-compression", choices=["gzip", "zstd"], help="Compression des textes extraits conservés dans output_text")
+    parser.add_argument("--stream-pages", action="store_true",
+                        help="Annote les pages de chaque CV au fil de leur extraction (longs PDF : premiers résultats plus tôt)")
+    parser.add_argument("--verbose", action="store_true", help="Affiche les résultats intermédiaires de chaque étape de l'extraction des entités")
+    parser.add_argument("--trace", metavar="FICHIER", help="Ajoute à ce fichier JSONL la trace (temps et nombre d'entités par étape) de chaque CV")
+    parser.add_argument("--timings", action="store_true", help="Affiche le temps cumulé de chaque étape à la fin du traitement")
+    args = parser.parse_args()
+
+    process_cv_folder(
+        args.cv_folder,
+        batch_size=args.batch_size,
+        mini_batch_size=args.mini_batch_size,
+        jobs=args.jobs,
+        share_models=args.share_models,
+        memory_report=args.memory_report,
+        cache_path=None if args.no_cache else args.cache,
+        verbose=args.verbose,
+        trace_path=args.trace,
+        timings=args.timings,
+        pdf_options={
+            "backend": args.pdf_backend,
+            "page_jobs": args.page_jobs,
+            "max_bytes": int(args.max_mb * 1048576) or None,
+            "max_pages": args.max_pages or None,
+            "max_chars": args.max_chars or None,
+            "text_cache": not args.no_text_cache,
+            "text_compression": args.text_compression
+        },
+        stream_pages=args.stream_pages
+    )
+    if args.model_report:
+        print_model_report()
     print("\n\nAnalyse terminé !\n\n")
 
 
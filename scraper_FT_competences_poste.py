@@ -32,17 +32,9 @@ import unicodedata
 # Correspondance floue de chaînes
 from rapidfuzz import fuzz
 
-# Traitement du langage naturel
-import spacy
-
-
-# ***************************************** # 
-# --- Chargement du modèle linguistique --- # 
-# ***************************************** # 
-
-
-
-nlp = spacy.load('fr_core_news_sm')
+# Traitement du langage naturel : lemmatisation par lots et en cache (fr_core_news_sm chargé à la première utilisation)
+from Lemmatization_service import get_lemmatizer
+from Model_registry import SPACY_SMALL_MODEL
 
 
 
@@ -180,18 +172,30 @@ def extraire_competences(offre, categorie):
 # ************************************************************************ #
 
 
+# Normalisation Unicode et passage en minuscules d’un token avant lemmatisation
+def preparer_token(token):
+    return unicodedata.normalize('NFKD', token).lower()
+
+
+
 # Normalisation et lemmatisation d’un token (Unicode, minuscules, suppression stopwords/ponctuation
 def nettoyer_token(token):
-    token = unicodedata.normalize('NFKD', token)
-    token = token.lower()
-    doc = nlp(token)
-    lemmatized_words = [t.lemma_ for t in doc if not t.is_stop and not t.is_punct]
-    cleaned_token = ' '.join(lemmatized_words)
+    cleaned_token = get_lemmatizer(SPACY_SMALL_MODEL).lemmatize(preparer_token(token), drop_stopwords=True, drop_punct=True)
     cleaned_token = re.sub(r'\s+', ' ', cleaned_token).strip()
     return cleaned_token
 
 
 
+# Lemmatisation de toutes les compétences du corpus en un seul passage (nlp.pipe) : les appels
+# suivants à nettoyer_token trouvent leur résultat dans le cache du service
+def prelemmatiser_corpus(corpus):
+    tokens = [ligne.rsplit('|', 1)[0] for ligne in corpus if '|' in ligne]
+    get_lemmatizer(SPACY_SMALL_MODEL).lemmatize_many(
+        [preparer_token(token) for token in tokens], drop_stopwords=True, drop_punct=True
+    )
+
+
+
 # Nettoyage partiel d’une ligne “compétence|catégorie” en appliquant nettoyer_token
 def nettoyer_ligne_partielle(ligne):
     try:
@@ -255,6 +259,7 @@ def main():
         corpus.append("")  # Marqueur de séparation entre catégories
 
     # Déduplication floue des compétences par catégorie
+    prelemmatiser_corpus(corpus)
     corpus = deduplicate_by_category(corpus, threshold=90)
 
     # Nettoyage final et sauvegarde du corpus dans un fichier texte
@@ -0,0 +1,46 @@
+# /**************************************************************************************************************************************************************************************
+# Nom du fichier : ner_fakes.py
+# Rôle du fichier : Ce fichier fournit aux tests des taggers Flair factices et déterministes, qui remplacent les modèles NER entraînés pour comparer les chemins d'annotation entre eux.
+
+# Auteur : Maxime BRONNY
+# Version : V1
+# Licence : Réalisé dans le cadre des cours "Fouille de données, Ingéniérie des langues, Développement logiciel libre, IA & Apprentisage" L3 INFORMATIQUE IED
+# Usage : Module utilisé par les tests, lancés avec la commande suivante :
+#           - make test
+# ***************************************************************************************************************************************************************************************/
+
+
+
+# **************************************************** # 
+# --- TAGGERS FACTICES POUR LES TESTS DE L'ANALYSE --- # 
+# **************************************************** # 
+
+
+
+class FakeTagger:
+    """
+    Tagger factice : chaque mot commençant par une majuscule est annoté avec 'tag'.
+    L'annotation d'une phrase ne dépend que de cette phrase, comme pour les taggers Flair.
+    Une phrase contenant 'fail_on' fait échouer tout l'appel à predict().
+    """
+
+    def __init__(self, tag, fail_on=None):
+        self.tag = tag
+        self.fail_on = fail_on
+        self.calls = []
+
+    def predict(self, sentences, mini_batch_size=32, label_name="ner"):
+        sentences = list(sentences)
+        self.calls.append(len(sentences))
+        if self.fail_on is not None and any(self.fail_on in sentence.to_plain_string() for sentence in sentences):
+            raise RuntimeError(f"phrase refusée : {self.fail_on}")
+        for sentence in sentences:
+            for position, token in enumerate(sentence):
+                if token.text[:1].isupper():
+                    sentence[position:position + 1].add_label(label_name, self.tag)
+
+
+
+def snapshot(analysis, label_types):
+    # Annotations d'une CVAnalysis sous une forme comparable : (texte, tag, début, fin) par type de label
+    return {label_type: [tuple(span) for span in analysis.spans(label_type)] for label_type in label_types}
@@ -0,0 +1,162 @@
+# /**************************************************************************************************************************************************************************************
+# Nom du fichier : test_batch_analysis.py
+# Rôle du fichier : Ce fichier vérifie que l'annotation NER par lots de plusieurs CV donne les mêmes annotations que l'annotation CV par CV, et qu'un CV en échec n'interrompt pas son lot.
+
+# Auteur : Maxime BRONNY
+# Version : V1
+# Licence : Réalisé dans le cadre des cours "Fouille de données, Ingéniérie des langues, Développement logiciel libre, IA & Apprentisage" L3 INFORMATIQUE IED
+# Usage : Tests lancés avec la commande suivante :
+#           - make test
+# ***************************************************************************************************************************************************************************************/
+
+
+
+# ****************************************** # 
+# --- LIBRAIRIES UTILISÉES PAR LES TESTS --- # 
+# ****************************************** # 
+
+
+
+import os
+import tempfile
+import unittest
+from unittest import mock
+
+import main
+from tests.ner_fakes import FakeTagger, snapshot
+
+
+
+LABEL_TYPES = (main.GENERIC_LABEL_TYPE, main.FINETUNED_LABEL_TYPE)
+
+CV_FOLDER = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "Banque_CV")
+
+TEXTS = [
+    "Maxime Bronny\nDéveloppeur Python chez Airbus à Toulouse.\nCompétences : Python, SQL, Docker",
+    "",
+    "Formation : Master Informatique\nExpérience : Data Scientist chez Orange. Stage de six mois à Paris.",
+    "Langues : Anglais : Courant\n\n\nEspagnol : Notions",
+]
+
+
+
+def _patch_taggers(generic, finetuned):
+    return mock.patch.multiple(main, get_tagger=lambda: generic, get_tagger_experience=lambda: finetuned)
+
+
+
+# ********************************************************** # 
+# --- ANNOTATION PAR LOTS COMPARÉE À L'ANNOTATION PAR CV --- # 
+# ********************************************************** # 
+
+
+
+class AnnotateCvTextsTest(unittest.TestCase):
+
+    def test_batch_matches_one_cv_at_a_time(self):
+        generic, finetuned = FakeTagger("ORG"), FakeTagger("COMPETENCE")
+        with _patch_taggers(generic, finetuned):
+            batched = main.annotate_cv_texts(TEXTS, mini_batch_size=4)
+            alone = [main.annotate_cv_texts([text], mini_batch_size=4)[0] for text in TEXTS]
+
+        # Un seul appel à predict() par tagger pour tout le lot
+        self.assertEqual(generic.calls[0], sum(len(analysis.sentences) for analysis in batched))
+        self.assertEqual(len(batched), len(TEXTS))
+        for text, batch_analysis, single_analysis in zip(TEXTS, batched, alone):
+            self.assertEqual(batch_analysis.text, text)
+            self.assertEqual(snapshot(batch_analysis, LABEL_TYPES), snapshot(single_analysis, LABEL_TYPES))
+
+    def test_traces_receive_each_tagger_time(self):
+        traces = [main.CVTrace(f"cv{index}") for index in range(len(TEXTS))]
+        with _patch_taggers(FakeTagger("ORG"), FakeTagger("COMPETENCE")):
+            main.annotate_cv_texts(TEXTS, traces=traces)
+        for trace in traces:
+            stages = {stage["stage"] for stage in trace.to_record()["stages"]}
+            self.assertLessEqual({"tokenisation", "ner_generique", "ner_finetune"}, stages)
+
+
+
+# *********************************************************** # 
+# --- ISOLEMENT DES ERREURS D'UN CV DANS analyse_cv_batch --- # 
+# *********************************************************** # 
+
+
+
+class AnalyseCvBatchErrorsTest(unittest.TestCase):
+
+    def setUp(self):
+        self.folder = tempfile.TemporaryDirectory()
+        self.addCleanup(self.folder.cleanup)
+        self.pdf_options = {"output_folder": self.folder.name, "text_cache": False}
+        self.corrupt = os.path.join(self.folder.name, "corrompu.pdf")
+        with open(self.corrupt, "wb") as corrupt_file:
+            corrupt_file.write(os.urandom(2048))
+        self.pdfs = [os.path.join(CV_FOLDER, "CV_TEST1.pdf"), self.corrupt, os.path.join(CV_FOLDER, "CV_TEST_data_scientist.pdf")]
+
+        # Les étapes suivant l'annotation sont remplacées : seul le déroulement du lot est vérifié ici
+        patcher = mock.patch.multiple(
+            main,
+            extract_all_entities=lambda text, analysis=None, trace=None: {"spans": snapshot(analysis, LABEL_TYPES)},
+            structure_cv=lambda text, entities: {"texte": text, **entities},
+            classify_cv=lambda structured_data, cache=None, trace=None: ["Informatique"],
+        )
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def _analyse(self, generic, finetuned, **options):
+        errors, traces = [], []
+        with _patch_taggers(generic, finetuned), mock.patch("builtins.print"):
+            results = main.analyse_cv_batch(self.pdfs, cache_path=None, pdf_options=self.pdf_options,
+                                            error_records=errors, trace_records=traces, **options)
+        return results, errors, traces
+
+    def test_unreadable_pdf_does_not_stop_the_batch(self):
+        for stream_pages in (False, True):
+            with self.subTest(stream_pages=stream_pages):
+                results, errors, traces = self._analyse(FakeTagger("ORG"), FakeTagger("COMPETENCE"), stream_pages=stream_pages)
+
+                self.assertEqual([name for name, _, _ in results], ["CV_TEST1.pdf", "corrompu.pdf", "CV_TEST_data_scientist.pdf"])
+                self.assertEqual(results[1][1:], (None, None))
+                self.assertIsNotNone(results[0][1])
+                self.assertIsNotNone(results[2][1])
+                self.assertEqual([(error["cv"], error["stage"]) for error in errors], [(self.corrupt, "pdf")])
+                self.assertEqual(traces[1]["error"]["stage"], "pdf")
+                self.assertNotIn("error", traces[0])
+
+    def test_failing_annotation_only_fails_its_cv(self):
+        # Le premier segment du second CV fait échouer le tagger : le lot est réannoté CV par CV
+        with mock.patch("builtins.print"):
+            text = main.extract_text_from_pdf(self.pdfs[2], **self.pdf_options)
+        marker = main.chunk_cv_text(text)[0][1]
+        self.pdfs = [self.pdfs[0], self.pdfs[2]]
+
+        reference, _, _ = self._analyse(FakeTagger("ORG"), FakeTagger("COMPETENCE"))
+        for stream_pages in (False, True):
+            with self.subTest(stream_pages=stream_pages):
+                results, errors, _ = self._analyse(FakeTagger("ORG", fail_on=marker), FakeTagger("COMPETENCE"),
+                                                   stream_pages=stream_pages)
+                self.assertEqual(results[0], reference[0])
+                self.assertEqual(results[1][1:], (None, None))
+                self.assertEqual([error["stage"] for error in errors], ["ner"])
+
+    def test_failing_classification_only_fails_its_cv(self):
+        self.pdfs = [self.pdfs[0], self.pdfs[2]]
+        reference, _, _ = self._analyse(FakeTagger("ORG"), FakeTagger("COMPETENCE"))
+        with mock.patch("builtins.print"):
+            failing = main.extract_text_from_pdf(self.pdfs[0], **self.pdf_options).split()[0]
+
+        def classify(structured_data, cache=None, trace=None):
+            if structured_data["texte"].split()[:1] == [failing]:
+                raise ValueError("classification impossible")
+            return ["Informatique"]
+
+        with mock.patch.object(main, "classify_cv", classify):
+            results, errors, _ = self._analyse(FakeTagger("ORG"), FakeTagger("COMPETENCE"))
+        self.assertEqual(results[0][1:], (None, None))
+        self.assertEqual(results[1], reference[1])
+        self.assertEqual([(error["cv"], error["stage"]) for error in errors], [(self.pdfs[0], "classification")])
+
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,147 @@
+# /**************************************************************************************************************************************************************************************
+# Nom du fichier : test_cv_analysis.py
+# Rôle du fichier : Ce fichier vérifie la représentation partagée d'un CV (CVAnalysis) : positions des entités dans le texte complet, regroupement par tag et indépendance des annotations des deux taggers.
+
+# Auteur : Maxime BRONNY
+# Version : V1
+# Licence : Réalisé dans le cadre des cours "Fouille de données, Ingéniérie des langues, Développement logiciel libre, IA & Apprentisage" L3 INFORMATIQUE IED
+# Usage : Tests lancés avec la commande suivante :
+#           - make test
+# ***************************************************************************************************************************************************************************************/
+
+
+
+# ****************************************** # 
+# --- LIBRAIRIES UTILISÉES PAR LES TESTS --- # 
+# ****************************************** # 
+
+
+
+import unittest
+
+import main
+from tests.ner_fakes import FakeTagger, snapshot
+
+
+
+TEXT = (
+    "Jeanne Mougin\n"
+    "  Développeuse chez Airbus à Toulouse  \n"
+    "\n"
+    "Compétences : Python, Docker et Kubernetes. Anglais courant ; Espagnol notions."
+)
+
+
+
+def _annotate(analysis, *taggers):
+    for tagger, label_type in taggers:
+        tagger.predict(analysis.sentences, label_name=label_type)
+    return analysis
+
+
+
+# ********************************************** # 
+# --- DÉCOUPAGE DU TEXTE D'UN CV EN SEGMENTS --- # 
+# ********************************************** # 
+
+
+
+class ChunkCvTextTest(unittest.TestCase):
+
+    def _assert_covers(self, text, chunks):
+        # Chaque segment est une partie du texte à sa position, et les segments gardent tout le texte hors espaces
+        for offset, chunk in chunks:
+            self.assertEqual(text[offset:offset + len(chunk)], chunk)
+            self.assertEqual(chunk, chunk.strip())
+            self.assertTrue(chunk)
+        self.assertEqual("".join("".join(chunk.split()) for _, chunk in chunks), "".join(text.split()))
+        self.assertEqual([offset for offset, _ in chunks], sorted(offset for offset, _ in chunks))
+
+    def test_short_lines_are_kept_whole(self):
+        chunks = main.chunk_cv_text(TEXT, max_chunk_chars=300)
+        self.assertEqual([chunk for _, chunk in chunks], [line.strip() for line in TEXT.split("\n") if line.strip()])
+        self._assert_covers(TEXT, chunks)
+
+    def test_long_lines_are_split_into_sentences(self):
+        chunks = main.chunk_cv_text(TEXT, max_chunk_chars=40)
+        self.assertEqual([chunk for _, chunk in chunks], [
+            "Jeanne Mougin",
+            "Développeuse chez Airbus à Toulouse",
+            "Compétences : Python, Docker et Kubernetes.",
+            "Anglais courant ;",
+            "Espagnol notions.",
+        ])
+        self._assert_covers(TEXT, chunks)
+
+    def test_sentence_without_boundary_stays_in_one_chunk(self):
+        line = "Python " * 80
+        self.assertEqual(main.chunk_cv_text(line, max_chunk_chars=50), [(0, line.strip())])
+
+    def test_empty_and_blank_texts_give_no_chunk(self):
+        for text in ("", "\n\n", "   \n\t\n"):
+            self.assertEqual(main.chunk_cv_text(text), [])
+
+    def test_pdf_text_is_fully_covered(self):
+        for max_chunk_chars in (20, 80, main.DEFAULT_MAX_CHUNK_CHARS):
+            text = "\n".join([TEXT] * 5) + "\nFin. " * 30
+            self._assert_covers(text, main.chunk_cv_text(text, max_chunk_chars))
+
+
+
+# ***************************************************** # 
+# --- ENTITÉS DE LA REPRÉSENTATION PARTAGÉE D'UN CV --- # 
+# ***************************************************** # 
+
+
+
+class CVAnalysisTest(unittest.TestCase):
+
+    def test_span_offsets_point_into_the_full_text(self):
+        analysis = _annotate(main.CVAnalysis(TEXT, max_chunk_chars=40), (FakeTagger("ORG"), main.GENERIC_LABEL_TYPE))
+        spans = analysis.spans(main.GENERIC_LABEL_TYPE)
+
+        self.assertEqual([span.text for span in spans],
+                         ["Jeanne", "Mougin", "Développeuse", "Airbus", "Toulouse", "Compétences", "Python", "Docker", "Kubernetes", "Anglais", "Espagnol"])
+        for span in spans:
+            self.assertEqual(TEXT[span.start:span.end], span.text)
+        self.assertEqual(spans, sorted(spans, key=lambda span: span.start))
+
+    def test_taggers_do_not_see_each_other_labels(self):
+        # Baseline : chaque tagger annotait sa propre copie tokenisée du texte
+        generic, finetuned = (FakeTagger("ORG"), main.GENERIC_LABEL_TYPE), (FakeTagger("COMPETENCE"), main.FINETUNED_LABEL_TYPE)
+        shared = _annotate(main.CVAnalysis(TEXT), generic, finetuned)
+        generic_only = _annotate(main.CVAnalysis(TEXT), generic)
+        finetuned_only = _annotate(main.CVAnalysis(TEXT), finetuned)
+
+        self.assertEqual(shared.spans(main.GENERIC_LABEL_TYPE), generic_only.spans(main.GENERIC_LABEL_TYPE))
+        self.assertEqual(shared.spans(main.FINETUNED_LABEL_TYPE), finetuned_only.spans(main.FINETUNED_LABEL_TYPE))
+        self.assertEqual(generic_only.spans(main.FINETUNED_LABEL_TYPE), [])
+
+    def test_spans_by_tag_keeps_requested_tags(self):
+        analysis = main.CVAnalysis("Python et Docker")
+        analysis.sentences[0][0:1].add_label(main.FINETUNED_LABEL_TYPE, "COMPETENCE")
+        analysis.sentences[0][2:3].add_label(main.FINETUNED_LABEL_TYPE, "COMPETENCE")
+
+        grouped = analysis.spans_by_tag(main.FINETUNED_LABEL_TYPE, main.FINETUNED_ENTITY_TYPES)
+        self.assertEqual(grouped["COMPETENCE"], ["Python", "Docker"])
+        self.assertEqual(set(grouped), set(main.FINETUNED_ENTITY_TYPES))
+        self.assertTrue(all(grouped[tag] == [] for tag in main.FINETUNED_ENTITY_TYPES if tag != "COMPETENCE"))
+        self.assertEqual(main.CVAnalysis("").spans_by_tag(main.FINETUNED_LABEL_TYPE), {})
+
+    def test_extend_page_by_page_matches_the_full_text(self):
+        pages = [line + "\n" for line in TEXT.split("\n")]
+        streamed = main.CVAnalysis("", max_chunk_chars=40)
+        for page in pages:
+            streamed.extend(page)
+        whole = main.CVAnalysis("".join(pages), max_chunk_chars=40)
+
+        tagger = (FakeTagger("ORG"), main.GENERIC_LABEL_TYPE)
+        self.assertEqual(streamed.text, whole.text)
+        self.assertEqual(streamed.chunks, whole.chunks)
+        self.assertEqual(snapshot(_annotate(streamed, tagger), [main.GENERIC_LABEL_TYPE]),
+                         snapshot(_annotate(whole, tagger), [main.GENERIC_LABEL_TYPE]))
+
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,161 @@
+# /**************************************************************************************************************************************************************************************
+# Nom du fichier : test_fuzzy_correction.py
+# Rôle du fichier : Ce fichier vérifie que la correction floue par lots (FuzzyCorrector) donne les mêmes références et les mêmes scores que l'appel à process.extractOne terme par terme qu'elle remplace.
+
+# Auteur : Maxime BRONNY
+# Version : V1
+# Licence : Réalisé dans le cadre des cours "Fouille de données, Ingéniérie des langues, Développement logiciel libre, IA & Apprentisage" L3 INFORMATIQUE IED
+# Usage : Tests lancés avec la commande suivante :
+#           - make test
+# ***************************************************************************************************************************************************************************************/
+
+
+
+# ****************************************** # 
+# --- LIBRAIRIES UTILISÉES PAR LES TESTS --- # 
+# ****************************************** # 
+
+
+
+import tempfile
+import unittest
+
+from rapidfuzz import fuzz, process
+
+import main
+from Fuzzy_correction import FuzzyCorrector
+from Ngram_index import load_esco_skills
+
+
+
+DETECTED_COMPETENCES = [
+    "Pyhton", "python", "Docker", "dockr", "Kubernete", "machine-learning", "Deep Learnig", "SQL", "scikit learn",
+    "tensor flow", "Node JS", "Réseaux", "Analyser des donnees", "Gestion de projet", "CI CD", "x", "",
+]
+
+DETECTED_EXPERIENCES = [
+    "Data Scientist", "data scientist", "Data Scientst", "Developpeur", "Développeur web", "Chef de projets",
+    "Ingenieur", "Stage", "Consultant SAP", "UX designer", "Analyste financier", "",
+]
+
+
+
+def extract_one_baseline(items, choices, scorer, threshold=80):
+    # Correction d'origine : un appel à process.extractOne par terme (références triées pour un résultat reproductible)
+    corrections = []
+    for item in items:
+        match, score, _ = process.extractOne(item, sorted(choices), scorer=scorer)
+        corrections.append((item, match, score, match if score > threshold else item))
+    return corrections
+
+
+
+# ************************************************************** # 
+# --- CORRECTION PAR MATRICE DE SCORES COMPARÉE À extractOne --- # 
+# ************************************************************** # 
+
+
+
+class FuzzyCorrectorTest(unittest.TestCase):
+
+    def assertSameCorrections(self, corrections, baseline):
+        self.assertEqual(len(corrections), len(baseline))
+        for correction, (item, match, score, corrected) in zip(corrections, baseline):
+            with self.subTest(item=item):
+                self.assertEqual(correction.original, item)
+                self.assertAlmostEqual(correction.score, score, places=3)
+                self.assertEqual(correction.match, match)
+                self.assertEqual(correction.corrected, corrected)
+
+    def test_matches_extract_one_for_each_scorer(self):
+        for scorer in (fuzz.WRatio, fuzz.ratio, fuzz.token_set_ratio):
+            with self.subTest(scorer=scorer.__name__):
+                corrector = FuzzyCorrector(main.KNOWN_COMPETENCIES, scorer=scorer)
+                self.assertIsNone(corrector.index)
+                self.assertSameCorrections(corrector.correct(DETECTED_COMPETENCES),
+                                           extract_one_baseline(DETECTED_COMPETENCES, main.KNOWN_COMPETENCIES, scorer))
+
+    def test_processor_is_applied_to_both_sides(self):
+        corrector = FuzzyCorrector(["Machine Learning", "Deep Learning"], scorer=fuzz.ratio, processor=str.lower)
+        correction = corrector.correct(["MACHINE LEARNING"])[0]
+        self.assertEqual((correction.match, correction.score, correction.corrected), ("Machine Learning", 100.0, "Machine Learning"))
+
+    def test_empty_inputs(self):
+        self.assertEqual(FuzzyCorrector(["Python"]).correct([]), [])
+        correction = FuzzyCorrector([]).correct(["Python"])[0]
+        self.assertEqual((correction.match, correction.score, correction.corrected), (None, 0.0, "Python"))
+
+
+
+# ************************************************************************************** # 
+# --- CORRECTION PRÉSÉLECTIONNÉE PAR L'INDEX COMPARÉE À extractOne SUR LES CANDIDATS --- # 
+# ************************************************************************************** # 
+
+
+
+class IndexedFuzzyCorrectorTest(unittest.TestCase):
+
+    @classmethod
+    def setUpClass(cls):
+        cls.vocabulary = main.KNOWN_COMPETENCIES | set(load_esco_skills())
+        cls.index_dir = tempfile.TemporaryDirectory()
+        cls.corrector = FuzzyCorrector(cls.vocabulary, scorer=fuzz.WRatio, index_processor=main.normalize, index_dir=cls.index_dir.name)
+        cls.items = [main.normalize(comp) for comp in DETECTED_COMPETENCES] + ["Concevoir des bases de donnees", "gerer des incidens"]
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.index_dir.cleanup()
+
+    def test_index_is_used_for_large_vocabularies(self):
+        self.assertIsNotNone(self.corrector.index)
+        self.assertEqual(self.corrector.index.normalized_labels, [main.normalize(choice) for choice in self.corrector.choices])
+
+    def test_matches_extract_one_over_the_candidates(self):
+        # Chemin d'origine de l'index : un appel à process.extractOne par terme, sur ses seuls candidats (dans l'ordre de l'index)
+        corrections = self.corrector.correct(self.items)
+        for item, correction in zip(self.items, corrections):
+            with self.subTest(item=item):
+                ids = self.corrector.index.candidates(main.normalize(item), self.corrector.candidate_limit)
+                if len(ids) == 0:
+                    self.assertEqual((correction.match, correction.score, correction.corrected), (None, 0.0, item))
+                    continue
+                match, score, _ = process.extractOne(item, [self.corrector.choices[i] for i in ids], scorer=fuzz.WRatio)
+                self.assertAlmostEqual(correction.score, score, places=3)
+                self.assertEqual(correction.match, match)
+                self.assertEqual(correction.corrected, match if score > self.corrector.threshold else item)
+
+    def test_known_terms_are_found_as_without_index(self):
+        # Les termes proches d'une référence sont corrigés comme par la comparaison à tout le vocabulaire
+        full = FuzzyCorrector(self.vocabulary, scorer=fuzz.WRatio, min_index_size=len(self.vocabulary) + 1)
+        items = ["python", "dockr", "kubernete", "analyser des donnees"]
+        self.assertEqual([correction.corrected for correction in self.corrector.correct(items)],
+                         [correction.corrected for correction in full.correct(items)])
+
+    def test_reloaded_index_gives_the_same_corrections(self):
+        reloaded = FuzzyCorrector(self.vocabulary, scorer=fuzz.WRatio, index_processor=main.normalize, index_dir=self.index_dir.name)
+        self.assertEqual(reloaded.correct(self.items), self.corrector.correct(self.items))
+
+
+
+# ************************************************************************** # 
+# --- CORRECTIONS DE main.py COMPARÉES AUX FONCTIONS QU'ELLES REMPLACENT --- # 
+# ************************************************************************** # 
+
+
+
+class MainCorrectionsTest(unittest.TestCase):
+
+    def test_competences_match_the_extract_one_loop(self):
+        baseline = extract_one_baseline([main.normalize(comp) for comp in DETECTED_COMPETENCES], main.KNOWN_COMPETENCIES, fuzz.WRatio)
+        self.assertEqual(sorted(main.correct_misspelled_competences(DETECTED_COMPETENCES)),
+                         sorted(set(corrected for _, _, _, corrected in baseline)))
+
+    def test_experiences_match_the_extract_one_loop(self):
+        baseline = extract_one_baseline(DETECTED_EXPERIENCES, main.KNOWN_EXPERIENCES, fuzz.ratio)
+        self.assertEqual(sorted(main.correct_experiences_with_rapidfuzz(DETECTED_EXPERIENCES)),
+                         sorted(set(corrected for _, _, _, corrected in baseline)))
+
+
+
+if __name__ == "__main__":
+    unittest.main()
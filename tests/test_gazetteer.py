@@ -0,0 +1,169 @@
+# /**************************************************************************************************************************************************************************************
+# Nom du fichier : test_gazetteer.py
+# Rôle du fichier : Ce fichier vérifie le dictionnaire de termes (Gazetteer) : normalisation identique à main.normalize, positions rapportées au texte d'origine, occurrences identiques à une recherche exhaustive et filtres de main.py identiques à ceux qu'ils remplacent.
+
+# Auteur : Maxime BRONNY
+# Version : V1
+# Licence : Réalisé dans le cadre des cours "Fouille de données, Ingéniérie des langues, Développement logiciel libre, IA & Apprentisage" L3 INFORMATIQUE IED
+# Usage : Tests lancés avec la commande suivante :
+#           - make test
+# ***************************************************************************************************************************************************************************************/
+
+
+
+# ****************************************** # 
+# --- LIBRAIRIES UTILISÉES PAR LES TESTS --- # 
+# ****************************************** # 
+
+
+
+import re
+import unittest
+from unittest import mock
+
+import main
+import Gazetteer as gazetteer_module
+from Gazetteer import Gazetteer, GazetteerMatch, normalize_with_offsets
+
+
+
+TEXTS = [
+    "",
+    "   ",
+    "Jeanne MOUGIN\nÉtudiante en Master Informatique\t-- Université de Lorraine",
+    "Compétences : Python, SQL, Node.js, scikit-learn ; Machine_Learning et Deep-Learning.",
+    "Expérience : Développeuse Python chez Airbus (Toulouse) ; ﬁnance, Œuvre, straße",
+    "Langues : Anglais : Courant ; Espagnol : notions\n\nLicence professionnelle, BTS SIO, DUT, Doctorat",
+    "PythonPython pythonista sql,sql SQLite",
+]
+
+CATEGORIES = {
+    "COMPETENCE": ["Python", "SQL", "Node.js", "Scikit-Learn", "Machine Learning", "Deep Learning", "Java", "JavaScript"],
+    "DIPLOME":    ["Master", "Licence", "BTS", "DUT", "Doctorat"],
+    "LANGUE":     ["Anglais", "Espagnol"],
+}
+
+
+
+def find_baseline(categories, text, whole_words=True):
+    # Recherche exhaustive de chaque terme normalisé dans le texte normalisé (chevauchements compris)
+    normalized_text, offsets = normalize_with_offsets(text)
+    matches = []
+    for category, terms in categories.items():
+        for term in terms:
+            word = main.normalize(term)
+            for found in re.finditer(f"(?={re.escape(word)})", normalized_text):
+                start, end = found.start(), found.start() + len(word)
+                if whole_words and ((start > 0 and normalized_text[start - 1].isalnum() and normalized_text[start].isalnum())
+                                    or (end < len(normalized_text) and normalized_text[end].isalnum() and normalized_text[end - 1].isalnum())):
+                    continue
+                original_start, original_end = offsets[start], offsets[end - 1] + 1
+                matches.append(GazetteerMatch(term, category, original_start, original_end, text[original_start:original_end]))
+    return sorted(matches, key=lambda match: (match.start, match.end, match.term))
+
+
+
+# ***************************************************** # 
+# --- NORMALISATION ET CORRESPONDANCE DES POSITIONS --- # 
+# ***************************************************** # 
+
+
+
+class NormalizeWithOffsetsTest(unittest.TestCase):
+
+    def test_same_text_as_main_normalize(self):
+        for text in TEXTS:
+            with self.subTest(text=text):
+                self.assertEqual(normalize_with_offsets(text)[0], main.normalize(text))
+
+    def test_offsets_point_to_the_original_characters(self):
+        for text in TEXTS:
+            normalized, offsets = normalize_with_offsets(text)
+            self.assertEqual(len(offsets), len(normalized))
+            self.assertEqual(offsets, sorted(offsets))
+            for character, offset in zip(normalized, offsets):
+                if character != " ":
+                    self.assertIn(character, main.normalize(text[offset]))
+
+
+
+# ************************************************ # 
+# --- OCCURRENCES TROUVÉES PAR LE DICTIONNAIRE --- # 
+# ************************************************ # 
+
+
+
+class GazetteerTest(unittest.TestCase):
+
+    def test_find_matches_an_exhaustive_search(self):
+        for whole_words in (True, False):
+            gazetteer = Gazetteer.from_categories(CATEGORIES, whole_words=whole_words)
+            for text in TEXTS:
+                with self.subTest(text=text, whole_words=whole_words):
+                    found = sorted(gazetteer.find(text), key=lambda match: (match.start, match.end, match.term))
+                    self.assertEqual(found, find_baseline(CATEGORIES, text, whole_words))
+
+    def test_matches_are_reported_in_the_original_text(self):
+        gazetteer = Gazetteer.from_categories(CATEGORIES)
+        text = TEXTS[3]
+        matches = {match.term: match for match in gazetteer.find(text, "COMPETENCE")}
+        self.assertEqual(matches["Machine Learning"].text, "Machine_Learning")
+        self.assertEqual(matches["Deep Learning"].text, "Deep-Learning")
+        self.assertEqual(matches["Scikit-Learn"].text, "scikit-learn")
+        for match in matches.values():
+            self.assertEqual(text[match.start:match.end], match.text)
+        self.assertEqual(gazetteer.find(TEXTS[2], "DIPLOME")[0].text, "Master")
+        self.assertEqual(gazetteer.find(TEXTS[2], "COMPETENCE"), [])
+
+    def test_terms_and_contains(self):
+        gazetteer = Gazetteer.from_categories(CATEGORIES)
+        self.assertEqual(gazetteer.terms(TEXTS[6]), ["SQL"])
+        self.assertEqual(gazetteer.terms(TEXTS[5], "LANGUE"), ["Anglais", "Espagnol"])
+        self.assertTrue(gazetteer.contains(TEXTS[5], "DIPLOME"))
+        self.assertFalse(gazetteer.contains(TEXTS[5], "COMPETENCE"))
+        self.assertFalse(Gazetteer([]).contains(TEXTS[3]))
+
+    @unittest.skipIf(gazetteer_module.ahocorasick is None, "pyahocorasick n'est pas installé")
+    def test_compiled_and_python_automata_agree(self):
+        words = sorted({main.normalize(term) for terms in CATEGORIES.values() for term in terms} | {"a", "aa", "ab", "bab"})
+        python_automaton = gazetteer_module._PythonAutomaton(words)
+        compiled_automaton = gazetteer_module._CAutomaton(words)
+        for text in [main.normalize(text) for text in TEXTS] + ["aaab bab abab"]:
+            self.assertEqual(sorted(python_automaton.iter(text)), sorted(compiled_automaton.iter(text)))
+
+    def test_python_automaton_is_used_without_pyahocorasick(self):
+        with mock.patch.object(gazetteer_module, "ahocorasick", None):
+            gazetteer = Gazetteer.from_categories(CATEGORIES)
+        self.assertIsInstance(gazetteer.automaton, gazetteer_module._PythonAutomaton)
+        for text in TEXTS:
+            self.assertEqual(sorted(gazetteer.find(text)), sorted(Gazetteer.from_categories(CATEGORIES).find(text)))
+
+
+
+# ******************************************************************* # 
+# --- FILTRES DE main.py COMPARÉS AUX FONCTIONS QU'ILS REMPLACENT --- # 
+# ******************************************************************* # 
+
+
+
+class MainFiltersTest(unittest.TestCase):
+
+    ENTRIES = ["Master Informatique", "master informatique", "Licence pro", "BTS SIO", "Remasterisation vidéo",
+               "Doctorat en chimie", "Formation Python", "", "Diplôme d'ingénieur"]
+
+    def test_detect_formations_matches_the_substring_search(self):
+        baseline = [entry for entry in self.ENTRIES if any(degree in entry for degree in main.DEGREES)]
+        self.assertEqual(main.detect_formations_finetuning(self.ENTRIES), baseline)
+
+    def test_name_filter_matches_the_substring_search(self):
+        entries = ["Stage chez Mougin SA", "Développeuse chez Airbus", "Jeanne-Marie consultante", "Chef de projet", "MOUGINET & fils"]
+        for names in (["Jeanne MOUGIN"], ["Airbus", "  "], ["Zoé", "Lefèvre"], ["Jean -"], []):
+            with self.subTest(names=names):
+                norm_names = [main.normalize(x) for name in names if name.strip() for x in name.split()]
+                baseline = [entry for entry in entries if not any(name in main.normalize(entry) for name in norm_names)]
+                self.assertEqual(main.detect_name_filter_experience(entries, names), baseline)
+
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,135 @@
+# /**************************************************************************************************************************************************************************************
+# Nom du fichier : test_lemmatization_service.py
+# Rôle du fichier : Ce fichier vérifie le service de lemmatisation : cache LRU (succès, éviction, doublons d'un même lot) et lemmes identiques à ceux du pipeline spaCy complet qu'il remplace.
+
+# Auteur : Maxime BRONNY
+# Version : V1
+# Licence : Réalisé dans le cadre des cours "Fouille de données, Ingéniérie des langues, Développement logiciel libre, IA & Apprentisage" L3 INFORMATIQUE IED
+# Usage : Tests lancés avec la commande suivante :
+#           - make test
+# ***************************************************************************************************************************************************************************************/
+
+
+
+# ****************************************** # 
+# --- LIBRAIRIES UTILISÉES PAR LES TESTS --- # 
+# ****************************************** # 
+
+
+
+import threading
+import unittest
+
+import spacy
+
+from Lemmatization_service import LemmatizationService
+
+
+
+PHRASES = ["Développer des applications web", "gérer les bases de données", "Analyse des données", "Python",
+           "Conçu et déployé des modèles", "les équipes", "CI/CD, Docker et Kubernetes !"]
+
+
+
+class RecordingLemmatizer(LemmatizationService):
+    # Service dont le modèle spaCy est remplacé par une transformation simple, pour observer les appels au modèle
+
+    def __init__(self, cache_size=100):
+        super().__init__(cache_size=cache_size)
+        self.calls = []
+
+    def _lemmatize_docs(self, texts, drop_stopwords, drop_punct):
+        self.calls.append(list(texts))
+        return [f"{text.lower()}|{int(drop_stopwords)}{int(drop_punct)}" for text in texts]
+
+
+
+# ********************************************* # 
+# --- CACHE LRU DU SERVICE DE LEMMATISATION --- # 
+# ********************************************* # 
+
+
+
+class LemmatizationCacheTest(unittest.TestCase):
+
+    def test_only_missing_texts_reach_the_model_once_per_batch(self):
+        service = RecordingLemmatizer()
+        self.assertEqual(service.lemmatize_many(["A", "B", "A"]), ["a|00", "b|00", "a|00"])
+        self.assertEqual(service.calls, [["A", "B"]])
+        self.assertEqual(service.lemmatize_many(["B", "C"]), ["b|00", "c|00"])
+        self.assertEqual(service.calls, [["A", "B"], ["C"]])
+        self.assertEqual(service.cache_info(), {"hits": 1, "misses": 3, "size": 3, "max_size": 100})
+        self.assertEqual(service.lemmatize_many([]), [])
+
+    def test_options_are_cached_separately(self):
+        service = RecordingLemmatizer()
+        self.assertEqual(service.lemmatize("A"), "a|00")
+        self.assertEqual(service.lemmatize("A", drop_stopwords=True), "a|10")
+        self.assertEqual(service.lemmatize("A", drop_punct=True), "a|01")
+        self.assertEqual(len(service.calls), 3)
+
+    def test_least_recently_used_entries_are_evicted(self):
+        service = RecordingLemmatizer(cache_size=2)
+        service.lemmatize_many(["A", "B"])
+        service.lemmatize("A")            # A devient la plus récemment utilisée
+        service.lemmatize("C")            # B est oubliée
+        self.assertEqual(service.cache_info()["size"], 2)
+        service.lemmatize_many(["A", "C"])
+        self.assertEqual(service.calls, [["A", "B"], ["C"]])
+        service.lemmatize("B")
+        self.assertEqual(service.calls[-1], ["B"])
+
+    def test_cache_larger_batch_than_its_size(self):
+        service = RecordingLemmatizer(cache_size=2)
+        texts = [f"T{index}" for index in range(5)]
+        self.assertEqual(service.lemmatize_many(texts), [f"t{index}|00" for index in range(5)])
+        self.assertEqual(service.cache_info()["size"], 2)
+
+    def test_clear(self):
+        service = RecordingLemmatizer()
+        service.lemmatize_many(["A", "A"])
+        service.clear()
+        self.assertEqual(service.cache_info(), {"hits": 0, "misses": 0, "size": 0, "max_size": 100})
+        service.lemmatize("A")
+        self.assertEqual(len(service.calls), 2)
+
+    def test_concurrent_calls_get_their_own_results(self):
+        service = RecordingLemmatizer(cache_size=50)
+        errors = []
+
+        def worker(offset):
+            for round_index in range(50):
+                texts = [f"T{(offset + round_index + index) % 80}" for index in range(10)]
+                if service.lemmatize_many(texts) != [f"{text.lower()}|00" for text in texts]:
+                    errors.append(texts)
+
+        threads = [threading.Thread(target=worker, args=(offset,)) for offset in range(8)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        self.assertEqual(errors, [])
+        self.assertLessEqual(service.cache_info()["size"], 50)
+
+
+
+# ************************************************************************ # 
+# --- LEMMES COMPARÉS AU PIPELINE spaCy COMPLET (nlp(texte)) D'ORIGINE --- # 
+# ************************************************************************ # 
+
+
+
+@unittest.skipUnless(spacy.util.is_package("fr_core_news_sm"), "modèle spaCy fr_core_news_sm non installé")
+class LemmatizationBaselineTest(unittest.TestCase):
+
+    def test_same_lemmas_as_the_full_pipeline(self):
+        nlp = spacy.load("fr_core_news_sm")
+        baseline = [" ".join(token.lemma_ for token in nlp(text)) for text in PHRASES]
+        service = LemmatizationService()
+        self.assertEqual(service.lemmatize_many(PHRASES), baseline)
+        self.assertEqual([service.lemmatize(text) for text in PHRASES], baseline)
+
+
+
+if __name__ == "__main__":
+    unittest.main()
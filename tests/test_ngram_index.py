@@ -0,0 +1,103 @@
+# /**************************************************************************************************************************************************************************************
+# Nom du fichier : test_ngram_index.py
+# Rôle du fichier : Ce fichier vérifie l'index de trigrammes des vocabulaires : candidats classés comme un calcul exhaustif du coefficient de Dice, et index identique après enregistrement puis rechargement.
+
+# Auteur : Maxime BRONNY
+# Version : V1
+# Licence : Réalisé dans le cadre des cours "Fouille de données, Ingéniérie des langues, Développement logiciel libre, IA & Apprentisage" L3 INFORMATIQUE IED
+# Usage : Tests lancés avec la commande suivante :
+#           - make test
+# ***************************************************************************************************************************************************************************************/
+
+
+
+# ****************************************** # 
+# --- LIBRAIRIES UTILISÉES PAR LES TESTS --- # 
+# ****************************************** # 
+
+
+
+import os
+import tempfile
+import unittest
+
+from unidecode import unidecode
+
+from Ngram_index import TrigramIndex, trigrams, load_esco_skills, ESCO_SKILLS_FILE
+
+
+
+def _normalize(text):
+    return " ".join(unidecode(text).lower().replace("-", " ").replace("_", " ").split())
+
+
+
+LABELS = [_normalize(label) for label in load_esco_skills()] if os.path.exists(ESCO_SKILLS_FILE) else []
+LABELS += ["python", "sql", "docker", "kubernetes", "machine learning", "deep learning", "analyser des donnees"]
+
+QUERIES = ["pyhton", "sql", "dockr", "kubernete", "machine learnig", "analyse de donnees", "gestion de projet",
+           "concevoir des bases de donnees", "zzz", ""]
+
+
+
+def dice_baseline(query, labels):
+    # Coefficient de Dice de 'query' avec chaque référence, calculé sans index
+    query_trigrams = trigrams(query)
+    return [2.0 * len(query_trigrams & trigrams(label)) / (len(query_trigrams) + len(trigrams(label))) for label in labels]
+
+
+
+# ********************************************* # 
+# --- CANDIDATS PRÉSÉLECTIONNÉS PAR L'INDEX --- # 
+# ********************************************* # 
+
+
+
+class TrigramIndexTest(unittest.TestCase):
+
+    @classmethod
+    def setUpClass(cls):
+        cls.index = TrigramIndex.build(LABELS)
+
+    def test_trigrams_include_word_boundaries(self):
+        self.assertEqual(trigrams("sql"), {" sq", "sql", "ql "})
+        self.assertEqual(trigrams(""), set())
+
+    def test_candidates_are_the_best_dice_scores(self):
+        for query in QUERIES:
+            for limit in (1, 5, 50):
+                with self.subTest(query=query, limit=limit):
+                    dice = dice_baseline(query, LABELS)
+                    expected = sorted((score for score in dice if score > 0), reverse=True)[:limit]
+                    candidates = list(self.index.candidates(query, limit))
+                    self.assertEqual(len(set(candidates)), len(candidates))
+                    for candidate, score in zip(candidates, expected):
+                        self.assertAlmostEqual(dice[candidate], score)
+                    self.assertEqual(len(candidates), len(expected))
+
+    def test_candidates_keep_vocabulary_order_on_ties(self):
+        index = TrigramIndex.build(["abc", "xabc", "abc", "zzz"])
+        self.assertEqual(list(index.candidates("abc")), [0, 2, 1])
+        self.assertEqual(list(index.candidates("qqq")), [])
+
+    def test_save_and_load_give_the_same_index(self):
+        with tempfile.TemporaryDirectory() as directory:
+            self.index.save(directory)
+            loaded = TrigramIndex.load(directory)
+            self.assertEqual(loaded.fingerprint, self.index.fingerprint)
+            self.assertEqual(loaded.normalized_labels, self.index.normalized_labels)
+            for query in QUERIES:
+                self.assertEqual(list(loaded.candidates(query, 20)), list(self.index.candidates(query, 20)))
+
+    def test_load_or_build_rebuilds_for_another_vocabulary(self):
+        with tempfile.TemporaryDirectory() as directory:
+            TrigramIndex.load_or_build(["python", "sql"], directory)
+            self.assertEqual(TrigramIndex.load_or_build(["python", "sql"], directory).normalized_labels, ["python", "sql"])
+            rebuilt = TrigramIndex.load_or_build(["docker"], directory)
+            self.assertEqual(rebuilt.normalized_labels, ["docker"])
+            self.assertEqual(TrigramIndex.load(directory).normalized_labels, ["docker"])
+
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,111 @@
+# /**************************************************************************************************************************************************************************************
+# Nom du fichier : test_regex_scanner.py
+# Rôle du fichier : Ce fichier vérifie que le scanner des champs d'un CV (CVFieldScanner) trouve les mêmes emails, téléphones et couples langue/niveau que les appels à re.findall qu'il remplace.
+
+# Auteur : Maxime BRONNY
+# Version : V1
+# Licence : Réalisé dans le cadre des cours "Fouille de données, Ingéniérie des langues, Développement logiciel libre, IA & Apprentisage" L3 INFORMATIQUE IED
+# Usage : Tests lancés avec la commande suivante :
+#           - make test
+# ***************************************************************************************************************************************************************************************/
+
+
+
+# ****************************************** # 
+# --- LIBRAIRIES UTILISÉES PAR LES TESTS --- # 
+# ****************************************** # 
+
+
+
+import random
+import re
+import unittest
+
+import main
+from Regex_scanner import CVFieldScanner
+
+
+
+TEXTS = [
+    "",
+    "Jean Datascientist\nEmail : jean.Datascientist@email.com\nTéléphone : 06 12 34 56 78\nLangues : Anglais : Courant, Espagnol : B2",
+    "Tél. +33 6 12 34 56 78 / 01.23.45.67.89 - contact@cv-classifier.fr ; JAPONAIS:natif ; français : Langue maternelle",
+    "Contact : 0612345678@gmail.com / +33612345678@orange.fr / 06 12 34 56 78jean@x.fr",
+    "Anglais : courant@x.fr  Espagnol: Notions  italien :  intermédiaire  Allemand :A1 chinois : C2.",
+    "jean@mail.anglais : courant ; portugais : bilingue0612345678 russe : natif 0712345678",
+    "a@b.c x@y.zz 0000000000 0 1 23 45 67 89 +330123456789 06-12-34-56-78 06.12 34-56.78",
+]
+
+
+
+def findall_baseline(text):
+    # Extraction d'origine : un re.findall par type de champ
+    lang_pattern = rf"(\b(?:{'|'.join(main.LANGUAGES)})\b)\s*:\s*(\b(?:{'|'.join(main.LANGUAGE_LEVELS)})\b)"
+    return {
+        "email": re.findall(main.EMAIL_PATTERN, text),
+        "phone": re.findall(main.PHONE_PATTERN, text),
+        "language": [tuple(match) for match in re.findall(lang_pattern, text, re.IGNORECASE)],
+    }
+
+
+
+def scanned(scanner, text):
+    grouped = scanner.scan_by_kind(text)
+    return {
+        "email": [match.text for match in grouped["email"]],
+        "phone": [match.text for match in grouped["phone"]],
+        "language": [(match.fields["language"], match.fields["level"]) for match in grouped["language"]],
+    }
+
+
+
+def random_cv_text(generator):
+    # Texte fait de champs collés ou séparés au hasard, pour provoquer les chevauchements entre types de champs
+    pieces = ["jean.dupont", "@", "gmail.com", "orange.fr", "06", "12", "34", "56", "78", "0612345678", "+33", "6",
+              "anglais", "Espagnol", "C1", "courant", "Langue maternelle", "natif", ":", " : ", " ", "\n", ".", "-", "_", "x", "é"]
+    return "".join(generator.choice(pieces) for _ in range(generator.randint(0, 60)))
+
+
+
+# *********************************************************** # 
+# --- CHAMPS DU SCANNER COMPARÉS AUX re.findall D'ORIGINE --- # 
+# *********************************************************** # 
+
+
+
+class CVFieldScannerTest(unittest.TestCase):
+
+    @classmethod
+    def setUpClass(cls):
+        cls.scanner = CVFieldScanner(main.EMAIL_PATTERN, main.PHONE_PATTERN, main.LANGUAGES, main.LANGUAGE_LEVELS)
+
+    def test_same_fields_as_findall(self):
+        for text in TEXTS:
+            with self.subTest(text=text):
+                self.assertEqual(scanned(self.scanner, text), findall_baseline(text))
+
+    def test_same_fields_as_findall_on_random_texts(self):
+        generator = random.Random(2024)
+        for _ in range(3000):
+            text = random_cv_text(generator)
+            with self.subTest(text=text):
+                self.assertEqual(scanned(self.scanner, text), findall_baseline(text))
+
+    def test_matches_are_ordered_and_located(self):
+        for text in TEXTS:
+            matches = self.scanner.scan(text)
+            self.assertEqual(matches, sorted(matches, key=lambda match: match.start))
+            for match in matches:
+                self.assertEqual(text[match.start:match.end], match.text)
+
+    def test_main_extractors_use_the_scanner(self):
+        text = TEXTS[1]
+        self.assertEqual(main.extract_emails_phones_ReGex(text), {"Emails": ["jean.Datascientist@email.com"], "Téléphone": ["06 12 34 56 78"]})
+        self.assertEqual(main.extract_languages(text), [{"Langue": "Anglais", "Niveau": "Courant"}, {"Langue": "Espagnol", "Niveau": "B2"}])
+        fields = main.scan_cv_fields(text)
+        self.assertEqual(main.extract_languages(text, fields), main.extract_languages(text))
+
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,118 @@
+# /**************************************************************************************************************************************************************************************
+# Nom du fichier : test_stream_annotation.py
+# Rôle du fichier : Ce fichier vérifie que l'annotation des pages au fil de leur extraction (stream_annotate_cv_pdfs) donne les mêmes textes et les mêmes annotations que l'extraction complète suivie de l'annotation par lots.
+
+# Auteur : Maxime BRONNY
+# Version : V1
+# Licence : Réalisé dans le cadre des cours "Fouille de données, Ingéniérie des langues, Développement logiciel libre, IA & Apprentisage" L3 INFORMATIQUE IED
+# Usage : Tests lancés avec la commande suivante :
+#           - make test
+# ***************************************************************************************************************************************************************************************/
+
+
+
+# ****************************************** # 
+# --- LIBRAIRIES UTILISÉES PAR LES TESTS --- # 
+# ****************************************** # 
+
+
+
+import os
+import tempfile
+import threading
+import unittest
+from unittest import mock
+
+import main
+import Generate_cv_corpus
+from tests.ner_fakes import FakeTagger, snapshot
+
+
+
+LABEL_TYPES = (main.GENERIC_LABEL_TYPE, main.FINETUNED_LABEL_TYPE)
+
+CV_FOLDER = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "Banque_CV")
+
+
+
+# ******************************************************************** # 
+# --- ANNOTATION AU FIL DES PAGES COMPARÉE À L'ANNOTATION PAR LOTS --- # 
+# ******************************************************************** # 
+
+
+
+class StreamAnnotateCvPdfsTest(unittest.TestCase):
+
+    @classmethod
+    def setUpClass(cls):
+        cls.folder = tempfile.TemporaryDirectory()
+        cls.pdf_options = {"output_folder": cls.folder.name, "text_cache": False}
+
+        # CV de plusieurs pages générés pour que les pages arrivent une à une dans la file
+        sources = Generate_cv_corpus.load_sources()
+        generated = []
+        for index, pages in enumerate((3, 5)):
+            path = os.path.join(cls.folder.name, f"cv_{pages}_pages.pdf")
+            Generate_cv_corpus.write_pdf(Generate_cv_corpus.generate_cv(index, sources, pages=(pages, pages))["lines"], path)
+            generated.append(path)
+        cls.pdfs = [os.path.join(CV_FOLDER, "CV_TEST1.pdf"), generated[0], os.path.join(CV_FOLDER, "CV_TEST2.pdf"),
+                    generated[1], os.path.join(CV_FOLDER, "CV_TEST_data_scientist.pdf")]
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.folder.cleanup()
+
+    def setUp(self):
+        patcher = mock.patch.multiple(main, get_tagger=lambda: FakeTagger("ORG"), get_tagger_experience=lambda: FakeTagger("COMPETENCE"))
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        printer = mock.patch("builtins.print")
+        printer.start()
+        self.addCleanup(printer.stop)
+
+    def _baseline(self):
+        # Chemin par lots : tout le texte des CV est extrait, puis annoté en un seul lot
+        texts = [main.extract_text_from_pdf(pdf_path, **self.pdf_options) for pdf_path in self.pdfs]
+        return texts, main.annotate_cv_texts(texts)
+
+    def test_same_texts_and_annotations_as_the_batch_path(self):
+        texts, analyses = self._baseline()
+        for mini_batch_size in (1, 4, 32):
+            with self.subTest(mini_batch_size=mini_batch_size):
+                streamed = list(main.stream_annotate_cv_pdfs(self.pdfs, mini_batch_size, pdf_options=self.pdf_options))
+                self.assertEqual([index for index, _, _, _ in streamed], list(range(len(self.pdfs))))
+                for (_, text, analysis, report), expected_text, expected_analysis in zip(streamed, texts, analyses):
+                    self.assertNotIn("error", report)
+                    self.assertEqual(text, expected_text)
+                    self.assertEqual(analysis.chunks, expected_analysis.chunks)
+                    self.assertEqual(snapshot(analysis, LABEL_TYPES), snapshot(expected_analysis, LABEL_TYPES))
+
+    def test_bounded_queue_gives_the_same_result(self):
+        _, analyses = self._baseline()
+        with mock.patch.object(main, "STREAM_QUEUE_PAGES", 1):
+            streamed = list(main.stream_annotate_cv_pdfs(self.pdfs, 2, pdf_options=self.pdf_options))
+        self.assertEqual([snapshot(analysis, LABEL_TYPES) for _, _, analysis, _ in streamed],
+                         [snapshot(analysis, LABEL_TYPES) for analysis in analyses])
+
+    def test_traces_receive_each_stage(self):
+        traces = [main.CVTrace(os.path.basename(pdf_path)) for pdf_path in self.pdfs]
+        list(main.stream_annotate_cv_pdfs(self.pdfs, pdf_options=self.pdf_options, traces=traces))
+        for trace in traces:
+            stages = [stage["stage"] for stage in trace.to_record()["stages"]]
+            self.assertEqual(stages, ["pdf", "tokenisation", "ner_generique", "ner_finetune"])
+
+    def test_abandoned_stream_stops_the_extraction_thread(self):
+        threads_before = threading.active_count()
+        with mock.patch.object(main, "STREAM_QUEUE_PAGES", 1):
+            stream = main.stream_annotate_cv_pdfs(self.pdfs * 3, pdf_options=self.pdf_options)
+            next(stream)
+            stream.close()
+        for thread in threading.enumerate():
+            if thread is not threading.current_thread() and thread.daemon:
+                thread.join(timeout=5)
+        self.assertLessEqual(threading.active_count(), threads_before)
+
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,175 @@
+# /**************************************************************************************************************************************************************************************
+# Nom du fichier : test_watch_cv_folder.py
+# Rôle du fichier : Ce fichier vérifie la surveillance du dossier des CV : délai de stabilité des PDF en cours d'écriture, CV déjà traités, fichiers supprimés et isolement des CV en échec.
+
+# Auteur : Maxime BRONNY
+# Version : V1
+# Licence : Réalisé dans le cadre des cours "Fouille de données, Ingéniérie des langues, Développement logiciel libre, IA & Apprentisage" L3 INFORMATIQUE IED
+# Usage : Tests lancés avec la commande suivante :
+#           - make test
+# ***************************************************************************************************************************************************************************************/
+
+
+
+# ****************************************** # 
+# --- LIBRAIRIES UTILISÉES PAR LES TESTS --- # 
+# ****************************************** # 
+
+
+
+import os
+import tempfile
+import unittest
+from types import SimpleNamespace
+from unittest import mock
+
+import Watch_cv_folder
+from Watch_cv_folder import FolderWatcher, load_state, save_state
+
+
+
+# ****************************************************** # 
+# --- DÉTECTION DES PDF STABLES (FolderWatcher.scan) --- # 
+# ****************************************************** # 
+
+
+
+class FolderWatcherTest(unittest.TestCase):
+
+    def setUp(self):
+        self.folder = tempfile.TemporaryDirectory()
+        self.addCleanup(self.folder.cleanup)
+        self.now = 100.0
+        patcher = mock.patch.object(Watch_cv_folder.time, "monotonic", lambda: self.now)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        self.watcher = FolderWatcher(self.folder.name, {}, settle_seconds=2.0)
+
+    def _write(self, filename, content, mtime_ns=None):
+        path = os.path.join(self.folder.name, filename)
+        with open(path, "wb") as file:
+            file.write(content)
+        if mtime_ns is not None:
+            os.utime(path, ns=(mtime_ns, mtime_ns))
+        return path
+
+    def test_file_is_ready_once_stable(self):
+        self._write("cv.pdf", b"%PDF-1")
+        self._write("notes.txt", b"ignore")
+        self.assertEqual(self.watcher.scan(), [])
+        self.now += 1.0
+        self.assertEqual(self.watcher.scan(), [])
+        self.now += 1.0
+        self.assertEqual(self.watcher.scan(), ["cv.pdf"])
+
+    def test_file_still_written_keeps_waiting(self):
+        self._write("cv.pdf", b"%PDF-1")
+        self.watcher.scan()
+        self.now += 1.5
+        self._write("cv.pdf", b"%PDF-1 suite de la copie")
+        self.assertEqual(self.watcher.scan(), [])
+        self.now += 1.5
+        self.assertEqual(self.watcher.scan(), [])
+        self.now += 0.5
+        self.assertEqual(self.watcher.scan(), ["cv.pdf"])
+
+    def test_processed_files_are_skipped_until_modified(self):
+        self._write("ok.pdf", b"%PDF-ok", mtime_ns=10**18)
+        self._write("bad.pdf", b"%PDF-bad", mtime_ns=10**18)
+        self.watcher.scan()
+        self.now += 2.0
+        self.assertEqual(self.watcher.scan(), ["bad.pdf", "ok.pdf"])
+        self.watcher.mark_processed(["ok.pdf"])
+        self.watcher.mark_processed(["bad.pdf"], error="PdfminerException : fichier illisible")
+
+        self.assertIsNone(self.watcher.state["ok.pdf"]["error"])
+        self.assertEqual(self.watcher.state["bad.pdf"]["error"], "PdfminerException : fichier illisible")
+        self.now += 10.0
+        self.assertEqual(self.watcher.scan(), [])
+
+        # Un CV en échec remplacé par une nouvelle version est de nouveau analysé
+        self._write("bad.pdf", b"%PDF-bad corrige", mtime_ns=2 * 10**18)
+        self.watcher.scan()
+        self.now += 2.0
+        self.assertEqual(self.watcher.scan(), ["bad.pdf"])
+
+    def test_deleted_files_leave_the_state(self):
+        path = self._write("cv.pdf", b"%PDF-1")
+        self.watcher.scan()
+        self.now += 2.0
+        self.watcher.mark_processed(self.watcher.scan())
+        self.assertIn("cv.pdf", self.watcher.state)
+
+        self._write("copie.pdf", b"%PDF-2")
+        self.watcher.scan()
+        os.remove(path)
+        os.remove(os.path.join(self.folder.name, "copie.pdf"))
+        self.assertEqual(self.watcher.scan(), [])
+        self.assertEqual(self.watcher.state, {})
+        self.assertEqual(self.watcher.pending, {})
+
+    def test_state_survives_a_restart(self):
+        self._write("cv.pdf", b"%PDF-1")
+        self.watcher.scan()
+        self.now += 2.0
+        self.watcher.mark_processed(self.watcher.scan())
+        state_path = os.path.join(self.folder.name, Watch_cv_folder.STATE_FILENAME)
+        save_state(self.watcher.state, state_path)
+
+        restarted = FolderWatcher(self.folder.name, load_state(state_path), settle_seconds=2.0)
+        restarted.scan()
+        self.now += 2.0
+        self.assertEqual(restarted.scan(), [])
+
+
+
+# ******************************************************** # 
+# --- ISOLEMENT DES CV EN ÉCHEC (_process_ready_files) --- # 
+# ******************************************************** # 
+
+
+
+class ProcessReadyFilesTest(unittest.TestCase):
+
+    def test_per_cv_errors_are_returned(self):
+        def process_cv_files(pdf_paths, error_records=None, **options):
+            error_records.append({"cv": pdf_paths[1], "stage": "pdf", "error": "PdfminerException : illisible"})
+
+        main = SimpleNamespace(process_cv_files=process_cv_files)
+        errors = Watch_cv_folder._process_ready_files(main, "dossier", ["a.pdf", "b.pdf", "c.pdf"], {})
+        self.assertEqual(errors, {"b.pdf": "PdfminerException : illisible"})
+
+    def test_whole_batch_failure_is_retried_file_by_file(self):
+        calls = []
+
+        def process_cv_files(pdf_paths, error_records=None, **options):
+            calls.append([os.path.basename(path) for path in pdf_paths])
+            if "b.pdf" in calls[-1]:
+                raise MemoryError("lot trop grand")
+
+        main = SimpleNamespace(process_cv_files=process_cv_files)
+        with mock.patch("builtins.print"):
+            errors = Watch_cv_folder._process_ready_files(main, "dossier", ["a.pdf", "b.pdf", "c.pdf"], {"jobs": 2})
+        self.assertEqual(errors, {"b.pdf": "lot trop grand"})
+        self.assertEqual(calls, [["a.pdf", "b.pdf", "c.pdf"], ["a.pdf"], ["b.pdf"], ["c.pdf"]])
+
+
+    def test_watch_once_marks_only_failed_cv_as_errors(self):
+        with tempfile.TemporaryDirectory() as folder:
+            for filename in ("a.pdf", "b.pdf"):
+                with open(os.path.join(folder, filename), "wb") as file:
+                    file.write(b"%PDF-1")
+
+            def process_cv_files(pdf_paths, error_records=None, **options):
+                error_records.append({"cv": os.path.join(folder, "b.pdf"), "stage": "pdf", "error": "illisible"})
+
+            main = SimpleNamespace(process_cv_files=process_cv_files)
+            with mock.patch.dict("sys.modules", main=main), mock.patch("builtins.print"):
+                Watch_cv_folder.watch_folder(folder, settle_seconds=0, use_inotify=False, prewarm_models=False, once=True)
+
+            state = load_state(os.path.join(folder, Watch_cv_folder.STATE_FILENAME))
+            self.assertEqual({filename: entry["error"] for filename, entry in state.items()}, {"a.pdf": None, "b.pdf": "illisible"})
+
+
+if __name__ == "__main__":
+    unittest.main()